@@ -1,16 +1,29 @@
 # save as: audio_alerts.py
 import cv2
-import mediapipe as mp
-import pygame
+import argparse
 import time
 import random
-import requests
 import threading
+from frame_sources import add_source_arguments, open_source_from_args
+from audio_engine import AudioEngine, sound_for_level
+from voice_cache import VoiceLineCache
+from scoring_strategies import FrameFeatures, AudioStrategy
 
 class AudioAlertSystem:
+    # Funny voice lines
+    VOICE_LINES = [
+        "Awkward silence detected!",
+        "Warning: Cringe levels rising!",
+        "Social skills malfunction!",
+        "Emergency! Call backup conversation topics!",
+        "Abort mission! Abort mission!",
+        "Awkwardness overload detected!",
+        "Please remain calm during this social disaster.",
+        "Have you tried talking about the weather?"
+    ]
+    
     def __init__(self):
-        # Initialize pygame for sound
-        pygame.mixer.init()
+        import mediapipe as mp
         
         # Previous detection setup
         self.mp_face = mp.solutions.face_detection
@@ -21,71 +34,44 @@ class AudioAlertSystem:
         self.hands = self.mp_hands.Hands(min_detection_confidence=0.7, min_tracking_confidence=0.5)
         
         self.awkwardness_score = 0
-        self.last_sound_time = 0
+        self.scoring = AudioStrategy()
         
-        # Create some basic sound effects (using pygame's built-in tones)
+        # Synthesized sound effects, played from the audio thread
         self.create_sound_effects()
         
-        # Funny voice lines
-        self.voice_lines = [
-            "Awkward silence detected!",
-            "Warning: Cringe levels rising!",
-            "Social skills malfunction!",
-            "Emergency! Call backup conversation topics!",
-            "Abort mission! Abort mission!",
-            "Awkwardness overload detected!",
-            "Please remain calm during this social disaster.",
-            "Have you tried talking about the weather?"
-        ]
+        # Funny voice lines, rendered to audio once and played from the cache
+        self.voice_lines = self.VOICE_LINES
+        self.voice_cache = VoiceLineCache(self.audio).prerender(self.voice_lines)
         
         self.current_voice_line = 0
     
     def create_sound_effects(self):
-        """Create basic sound effects using pygame"""
-        # Create different frequency sounds for different alerts
-        self.sounds = {}
-        
-        # We'll use simple beep sounds since creating complex sounds is advanced
-        # In a real project, you'd load .wav or .mp3 files
-        
-        # For now, we'll just use pygame's basic sound generation
+        """Synthesize the alert sounds (cached as WAV) and start the audio thread"""
+        # Ding, buzzer, alarm and explosion are generated with NumPy on first run
+        self.audio = AudioEngine().start()
+        self.sound_messages = {
+            'ding': "🔔 *ding* - Mild awkwardness detected",
+            'buzzer': "📢 *buzzer* - Awkwardness increasing!",
+            'alarm': "🚨 *alarm* - HIGH CRINGE ALERT!",
+            'explosion': "💥 *EXPLOSION* - SOCIAL MELTDOWN!"
+        }
         print("🔊 Sound system initialized!")
-        print("Note: Using basic beep sounds. For better sounds, add .wav files!")
     
     def play_awkward_sound(self, awkwardness_level):
         """Play different sounds based on awkwardness level"""
-        current_time = time.time()
-        
-        # Don't play sounds too frequently
-        if current_time - self.last_sound_time < 2:
-            return
-        
-        self.last_sound_time = current_time
-        
-        # Play different "sounds" based on level (just print for now)
-        if awkwardness_level < 15:
-            print("🔔 *ding* - Mild awkwardness detected")
-        elif awkwardness_level < 30:
-            print("📢 *buzzer* - Awkwardness increasing!")
-        elif awkwardness_level < 50:
-            print("🚨 *alarm* - HIGH CRINGE ALERT!")
-        else:
-            print("💥 *EXPLOSION* - SOCIAL MELTDOWN!")
-        
-        # In a real implementation, you'd play actual sound files:
-        # pygame.mixer.Sound('awkward_sound.wav').play()
+        # The engine coalesces repeats and keeps sounds at least 2 seconds apart
+        name = sound_for_level(awkwardness_level)
+        if self.audio.play(name):
+            print(self.sound_messages[name])
     
     def speak_voice_line(self):
-        """Play a funny voice line (simulated)"""
+        """Play a funny voice line from the pre-rendered cache"""
         line = self.voice_lines[self.current_voice_line % len(self.voice_lines)]
         print(f"🗣️ Voice Alert: '{line}'")
         self.current_voice_line += 1
         
-        # In a real implementation, you could use text-to-speech:
-        # import pyttsx3
-        # engine = pyttsx3.init()
-        # engine.say(line)
-        # engine.runAndWait()
+        # Never calls text-to-speech here - a missing clip plays a tone and renders in the background
+        self.voice_cache.speak(line)
     
     def process_frame_with_audio(self, frame):
         """Process frame and trigger audio alerts"""
@@ -95,18 +81,10 @@ class AudioAlertSystem:
         face_results = self.face_detector.process(rgb_frame)
         hand_results = self.hands.process(rgb_frame)
         
-        frame_awkwardness = 0
-        
-        # Calculate awkwardness
-        if not face_results.detections:
-            frame_awkwardness += 3  # No face visible
-        
-        if hand_results.multi_hand_landmarks:
-            frame_awkwardness += 2  # Hands visible (fidgeting)
-        
-        # Update score
-        self.awkwardness_score += frame_awkwardness * 0.3
-        self.awkwardness_score = max(0, self.awkwardness_score - 0.15)
+        # Calculate awkwardness (no face +3, hands visible +2) and update the score
+        features = FrameFeatures.from_results(face_results, hand_results, time.time())
+        frame_awkwardness = self.scoring.frame_points(features)
+        self.awkwardness_score = self.scoring.next_score(self.awkwardness_score, frame_awkwardness)
         
         # Trigger audio alerts
         if self.awkwardness_score > 25:
@@ -139,6 +117,8 @@ class AudioAlertSystem:
 # Enhanced version with downloadable sounds
 def download_sound_effect(url, filename):
     """Download a sound effect from the internet"""
+    import requests
+    
     try:
         response = requests.get(url)
         with open(filename, 'wb') as f:
@@ -147,24 +127,38 @@ def download_sound_effect(url, filename):
     except:
         return False
 
-# Main execution
-audio_system = AudioAlertSystem()
-camera = cv2.VideoCapture(0)
 
-print("🎵 Audio Alert System Starting!")
-print("Prepare for sound effects and voice alerts!")
-print("(Note: This demo uses text alerts - add real sound files for audio)")
+def main():
+    """Run the audio alert system on the webcam (or any --source)"""
+    parser = argparse.ArgumentParser(description="Audio Alert System")
+    add_source_arguments(parser)
+    args = parser.parse_args()
+    
+    audio_system = AudioAlertSystem()
+    camera = open_source_from_args(args)
+
+    print("🎵 Audio Alert System Starting!")
+    print("Prepare for sound effects and voice alerts!")
+    print("(Sound effects are synthesized on first run and cached in .awkward_cache/)")
 
-while True:
-    ret, frame = camera.read()
-    if not ret:
-        break
+    while True:
+        ret, frame = camera.read()
+        if not ret:
+            break
     
-    frame = audio_system.process_frame_with_audio(frame)
+        frame = audio_system.process_frame_with_audio(frame)
     
-    cv2.imshow("Audio-Enhanced Awkwardness Detector", frame)
-    if cv2.waitKey(1) & 0xFF == ord('q'):
-        break
+        cv2.imshow("Audio-Enhanced Awkwardness Detector", frame)
+        if cv2.waitKey(1) & 0xFF == ord('q'):
+            break
+
+    for line in audio_system.voice_cache.report_lines():
+        print(line)
+    audio_system.voice_cache.stop()
+    audio_system.audio.stop()
+    camera.release()
+    cv2.destroyAllWindows()
+
 
-camera.release()
-cv2.destroyAllWindows()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+# save as: audio_engine.py
+import os
+import time
+import wave
+import queue
+import threading
+import numpy as np
+from event_stream import ALERT_LEVELS, alert_level
+
+SAMPLE_RATE = 22050
+SYNTH_VERSION = 1  # Bump when the synthesizers change so cached WAVs get rebuilt
+DEFAULT_CACHE_DIR = os.path.join(".awkward_cache", "sounds")
+
+# Lower number = more urgent
+SOUND_PRIORITIES = {
+    'explosion': 0,
+    'alarm': 1,
+    'voice': 2,
+    'buzzer': 3,
+    'ding': 4,
+    'tone': 5
+}
+
+
+def envelope(n, attack=0.01, decay=4.0, rate=SAMPLE_RATE):
+    """Short linear attack then exponential decay"""
+    t = np.arange(n) / rate
+    attack_samples = max(1, int(attack * rate))
+    env = np.exp(-decay * t)
+    env[:attack_samples] *= np.linspace(0, 1, attack_samples)
+    return env
+
+
+def synthesize_ding(rate=SAMPLE_RATE):
+    """Bright bell: a fundamental plus an inharmonic partial"""
+    t = np.arange(int(0.8 * rate)) / rate
+    tone = np.sin(2 * np.pi * 1320 * t) + 0.4 * np.sin(2 * np.pi * 3430 * t)
+    return 0.5 * tone * envelope(len(t), decay=5.0, rate=rate)
+
+
+def synthesize_buzzer(rate=SAMPLE_RATE):
+    """Game-show wrong-answer buzz: a low, harmonic-rich square wave"""
+    t = np.arange(int(0.6 * rate)) / rate
+    tone = np.sign(np.sin(2 * np.pi * 140 * t)) + 0.5 * np.sign(np.sin(2 * np.pi * 147 * t))
+    return 0.25 * tone * envelope(len(t), decay=1.5, rate=rate)
+
+
+def synthesize_alarm(rate=SAMPLE_RATE):
+    """Two-tone siren, four cycles"""
+    t = np.arange(int(1.2 * rate)) / rate
+    frequency = np.where((t * 4).astype(int) % 2 == 0, 880, 660)
+    phase = 2 * np.pi * np.cumsum(frequency) / rate
+    return 0.35 * np.sin(phase) * envelope(len(t), decay=0.5, rate=rate)
+
+
+def synthesize_explosion(rate=SAMPLE_RATE):
+    """Low-passed noise burst over a falling rumble"""
+    n = int(1.6 * rate)
+    t = np.arange(n) / rate
+    noise = np.random.default_rng(7).standard_normal(n)
+    # Cheap low-pass: moving average over ~3ms
+    kernel = np.ones(64) / 64
+    rumble_noise = np.convolve(noise, kernel, mode='same') * 6
+    rumble = np.sin(2 * np.pi * (60 - 25 * t) * t)
+    return np.clip(0.6 * (rumble_noise + 0.5 * rumble) * envelope(n, attack=0.005, decay=2.5, rate=rate), -1, 1)
+
+
+def synthesize_tone(frequency=660, duration=0.4, rate=SAMPLE_RATE):
+    """Plain sine blip (fallback for anything without a real sound)"""
+    t = np.arange(int(duration * rate)) / rate
+    return 0.4 * np.sin(2 * np.pi * frequency * t) * envelope(len(t), decay=6.0, rate=rate)
+
+
+# Alert sound for each status bucket
+LEVEL_SOUNDS = {
+    'smooth': 'ding',
+    'nervous': 'ding',
+    'uncomfortable': 'buzzer',
+    'major': 'alarm',
+    'catastrophe': 'explosion'
+}
+
+SOUND_SYNTHS = {
+    'ding': synthesize_ding,
+    'buzzer': synthesize_buzzer,
+    'alarm': synthesize_alarm,
+    'explosion': synthesize_explosion,
+    'tone': synthesize_tone
+}
+
+
+def sound_for_level(awkwardness_level, levels=ALERT_LEVELS):
+    """Which alert fits a score"""
+    return LEVEL_SOUNDS[alert_level(awkwardness_level, levels)]
+
+
+def write_wav(path, samples, rate=SAMPLE_RATE):
+    """Save float samples in [-1, 1] as 16-bit mono WAV"""
+    pcm = (np.clip(samples, -1, 1) * 32767).astype('<i2')
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(pcm.tobytes())
+
+
+def init_mixer(rate=SAMPLE_RATE, headless=False):
+    """Start pygame's mixer, dropping to the dummy driver when there is no audio device"""
+    if headless:
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    import pygame
+    if pygame.mixer.get_init():
+        return pygame
+    try:
+        pygame.mixer.init(frequency=rate, size=-16, channels=2, buffer=512)
+    except pygame.error:
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        pygame.mixer.init(frequency=rate, size=-16, channels=2, buffer=512)
+        print("🔇 No audio device - using pygame's dummy driver")
+    return pygame
+
+
+class AudioEngine:
+    """Plays cached alert sounds from its own thread so the video loop never waits on audio"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, sample_rate=SAMPLE_RATE, min_interval=2.0,
+                 max_pending=8, headless=False):
+        self.cache_dir = cache_dir
+        self.sample_rate = sample_rate
+        self.min_interval = min_interval  # Seconds between sounds unless a more urgent one arrives
+        self.max_pending = max_pending
+        self.headless = headless
+
+        self.sounds = {}
+        self.queue = queue.PriorityQueue()
+        self.pending = set()
+        self.lock = threading.Lock()
+        self.sequence = 0
+        self.last_play_time = 0.0
+        self.last_priority = None
+        self.thread = None
+        self.running = False
+        self.ready = threading.Event()
+        self.play_listeners = []
+
+        self.stats = {
+            'requested': 0,
+            'played': 0,
+            'coalesced': 0,
+            'rate_limited': 0,
+            'overflow': 0,
+            'latency_total': 0.0,
+            'latency_max': 0.0
+        }
+
+    def start(self):
+        """Launch the audio thread (sounds load there, off the caller's thread)"""
+        if self.running:
+            return self
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name="audio-engine", daemon=True)
+        self.thread.start()
+        return self
+
+    def cached_path(self, name):
+        return os.path.join(self.cache_dir, f"{name}_{self.sample_rate}hz_v{SYNTH_VERSION}.wav")
+
+    def load_sounds(self):
+        """Synthesize each alert once, cache it as WAV, and keep a pygame Sound in memory"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for name, synth in SOUND_SYNTHS.items():
+            path = self.cached_path(name)
+            if not os.path.exists(path):
+                write_wav(path, synth(self.sample_rate), self.sample_rate)
+            self.sounds[name] = self.pygame.mixer.Sound(path)
+
+    def register_sound(self, name, path):
+        """Make an extra clip (e.g. a voice line) playable by name; False when the mixer never came up"""
+        if not self.ready.wait(timeout=5.0):
+            print(f"🔇 Audio engine not ready - skipping sound '{name}'")
+            return False
+        sound = self.pygame.mixer.Sound(path)
+        with self.lock:
+            self.sounds[name] = sound
+        return True
+
+    def add_play_listener(self, callback):
+        """Call callback(name, latency_seconds) on the audio thread after each sound starts"""
+        self.play_listeners.append(callback)
+
+    def play(self, name, priority=None):
+        """Queue a sound; returns immediately and drops repeats and rate-limited requests"""
+        if priority is None:
+            priority = SOUND_PRIORITIES.get(name, SOUND_PRIORITIES['tone'])
+        now = time.perf_counter()
+        with self.lock:
+            self.stats['requested'] += 1
+            if name in self.pending:
+                self.stats['coalesced'] += 1
+                return False
+            if self.rate_limited(priority, now):
+                self.stats['rate_limited'] += 1
+                return False
+            if len(self.pending) >= self.max_pending:
+                self.stats['overflow'] += 1
+                return False
+            self.pending.add(name)
+            self.sequence += 1
+            self.queue.put((priority, self.sequence, name, now))
+        return True
+
+    def rate_limited(self, priority, now):
+        """Too soon after the last sound, unless this one is more urgent"""
+        if now - self.last_play_time >= self.min_interval:
+            return False
+        return self.last_priority is None or priority >= self.last_priority
+
+    def run(self):
+        """Audio thread: load sounds, then play queued requests in priority order"""
+        self.pygame = init_mixer(self.sample_rate, self.headless)
+        self.load_sounds()
+        self.ready.set()
+
+        while self.running:
+            try:
+                priority, _, name, requested_at = self.queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if name is None:
+                break
+
+            with self.lock:
+                self.pending.discard(name)
+                sound = self.sounds.get(name) or self.sounds.get('tone')
+                # Re-check: something more urgent may have played while this waited
+                if self.rate_limited(priority, time.perf_counter()) and self.last_play_time > requested_at:
+                    self.stats['rate_limited'] += 1
+                    continue
+
+            sound.play()
+            played_at = time.perf_counter()
+            latency = played_at - requested_at
+            with self.lock:
+                self.last_play_time = played_at
+                self.last_priority = priority
+                self.stats['played'] += 1
+                self.stats['latency_total'] += latency
+                self.stats['latency_max'] = max(self.stats['latency_max'], latency)
+            for callback in self.play_listeners:
+                callback(name, latency)
+
+    def stop(self):
+        """Stop the audio thread"""
+        if not self.running:
+            return
+        self.running = False
+        self.queue.put((-1, -1, None, 0.0))
+        self.thread.join(timeout=1.0)
+
+    def report_lines(self):
+        """Audio engine counters for the session report"""
+        played = max(1, self.stats['played'])
+        return [
+            f"• Sounds Played: {self.stats['played']}/{self.stats['requested']} requested "
+            f"({self.stats['coalesced']} coalesced, {self.stats['rate_limited']} rate-limited, "
+            f"{self.stats['overflow']} overflow)",
+            f"• Audio Latency: {1000 * self.stats['latency_total'] / played:.1f}ms avg, "
+            f"{1000 * self.stats['latency_max']:.1f}ms max"
+        ]
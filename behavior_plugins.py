@@ -0,0 +1,275 @@
+# save as: behavior_plugins.py
+import time
+import argparse
+from scoring_strategies import FrameFeatures
+
+# Inference models, and the models each one needs built alongside it
+MODELS = {
+    'faces': (),
+    'hands': (),
+    'pose': (),
+    'gaze': ('faces',),  # Head pose and FaceMesh irises, run on the face boxes
+    'microphone': ()
+}
+VISION_MODELS = ('faces', 'hands', 'pose')
+
+
+def count_faces(detector, detections, values):
+    return len(detections.face_results.detections or [])
+
+
+def fingertip_ys(detector, detections, values):
+    return [hand.landmark[8].y for hand in detections.hand_results.multi_hand_landmarks or []]
+
+
+def gaze_away(detector, detections, values):
+    # Face is there, but it's pointed somewhere else
+    return bool(values['face_count']) and detector.gaze_estimator.looking_away()
+
+
+def posture_flags(detector, detections, values):
+    return detector.posture_monitor.slouching, detector.posture_monitor.shoulders_tense
+
+
+def dead_silence(detector, detections, values):
+    return detector.silence_listener is not None and detector.silence_listener.detector.silent
+
+
+# Values derived from model outputs, computed at most once per frame however many plugins read them
+DERIVED = {
+    'face_count': (('faces',), count_faces),
+    'fingertips': (('hands',), fingertip_ys),
+    'looking_away': (('face_count', 'gaze'), gaze_away),
+    'posture': (('pose',), posture_flags),
+    'silent': (('microphone',), dead_silence)
+}
+
+
+class BehaviorPlugin:
+    """A behavior detector: the values it reads and the FrameFeatures fields it fills from them"""
+
+    name = "base"
+    description = ""
+    needs = ()
+    weights_off = ()  # UltimateStrategy weights that score nothing while this plugin is off
+
+    def fields(self, values):
+        raise NotImplementedError
+
+
+class FaceAbsencePlugin(BehaviorPlugin):
+    """No face in frame counts as breaking eye contact"""
+
+    name = "face_absence"
+    description = "Missing face (face model)"
+    needs = ('face_count',)
+
+    def fields(self, values):
+        return {'face_count': values['face_count']}
+
+
+class GazePlugin(BehaviorPlugin):
+    """A face turned away counts as breaking eye contact"""
+
+    name = "gaze"
+    description = "Looking away (face model + gaze)"
+    needs = ('looking_away',)
+
+    def fields(self, values):
+        return {'looking_away': values['looking_away']}
+
+
+class FaceTouchPlugin(BehaviorPlugin):
+    """Fingertips up by the face"""
+
+    name = "face_touch"
+    description = "Face touching (hand model)"
+    needs = ('fingertips',)
+    weights_off = ('touch_points',)
+
+    def fields(self, values):
+        return {'fingertip_ys': values['fingertips']}
+
+
+class FidgetPlugin(BehaviorPlugin):
+    """Hands in view anywhere below the face"""
+
+    name = "fidget"
+    description = "Fidgeting (hand model)"
+    needs = ('fingertips',)
+    weights_off = ('fidget_points',)
+
+    def fields(self, values):
+        return {'fingertip_ys': values['fingertips']}
+
+
+class PosturePlugin(BehaviorPlugin):
+    """Slouching and raised shoulders from pose landmarks"""
+
+    name = "posture"
+    description = "Slouching and tense shoulders (pose model)"
+    needs = ('posture',)
+    weights_off = ('posture_points',)
+
+    def fields(self, values):
+        slouching, shoulders_tense = values['posture']
+        return {'slouching': slouching, 'shoulders_tense': shoulders_tense}
+
+
+class SilencePlugin(BehaviorPlugin):
+    """Dead silence from the microphone"""
+
+    name = "silence"
+    description = "Dead silence (microphone)"
+    needs = ('silent',)
+    weights_off = ('silence_points',)
+
+    def fields(self, values):
+        return {'silent': values['silent']}
+
+
+PLUGINS = {plugin.name: plugin for plugin in
+           (FaceAbsencePlugin, GazePlugin, FaceTouchPlugin, FidgetPlugin, PosturePlugin, SilencePlugin)}
+
+
+# What turns on each optional input, for warnings when an asked-for behavior has to be dropped
+INPUT_FLAGS = {'gaze': "gaze estimation (remove --no-gaze)", 'posture': "a pose model (--pose or --backend holistic)",
+               'silence': "the microphone (--mic)"}
+
+
+def select_behaviors(names=None, gaze=True, pose=False, microphone=False):
+    """Requested plugins (all by default), minus those whose optional inputs are turned off"""
+    explicit = names is not None
+    names = list(PLUGINS) if names is None else list(names)
+    unavailable = {'gaze': not gaze, 'posture': not pose, 'silence': not microphone}
+    for name in names:
+        if explicit and unavailable.get(name):
+            print(f"⚠️ Behavior '{name}' needs {INPUT_FLAGS[name]} - it won't be scored this run")
+    return [name for name in names if not unavailable.get(name)]
+
+
+class BehaviorGraph:
+    """Resolves enabled plugins to the models and derived values they need, then evaluates them per frame"""
+
+    def __init__(self, names=None):
+        names = list(PLUGINS) if names is None else list(names)
+        for name in names:
+            if name not in PLUGINS:
+                raise ValueError(f"Unknown behavior '{name}' (choose from {', '.join(PLUGINS)})")
+        self.plugins = [PLUGINS[name]() for name in names]
+        self.models = set()
+        self.order = []  # Derived values, dependencies first
+        for plugin in self.plugins:
+            for need in plugin.needs:
+                self.resolve(need)
+
+        self.stats = {
+            'frames': 0,
+            'seconds': {name: 0.0 for name in self.order}
+        }
+
+    def resolve(self, name):
+        if name in MODELS:
+            if name not in self.models:
+                self.models.add(name)
+                for dependency in MODELS[name]:
+                    self.resolve(dependency)
+        elif name in DERIVED:
+            if name not in self.order:
+                for dependency in DERIVED[name][0]:
+                    self.resolve(dependency)
+                self.order.append(name)
+        else:
+            raise ValueError(f"Unknown model or derived value '{name}'")
+
+    @property
+    def names(self):
+        return [plugin.name for plugin in self.plugins]
+
+    def needs(self, model):
+        return model in self.models
+
+    def needs_vision(self):
+        return any(model in self.models for model in VISION_MODELS)
+
+    def scoring_weights(self):
+        """UltimateStrategy weights to zero for the plugins that are off"""
+        return {weight: 0 for name, plugin in PLUGINS.items() if name not in self.names
+                for weight in plugin.weights_off}
+
+    def features(self, detector, detections, timestamp):
+        """This frame's FrameFeatures; fields of plugins that are off keep their scoring-neutral defaults"""
+        values = {}
+        for name in self.order:
+            start = time.perf_counter()
+            values[name] = DERIVED[name][1](detector, detections, values)
+            self.stats['seconds'][name] += time.perf_counter() - start
+        self.stats['frames'] += 1
+        # face_count None means nobody measured it, so it never reads as "no face"
+        fields = {'face_count': None, 'fingertip_ys': []}
+        for plugin in self.plugins:
+            fields.update(plugin.fields(values))
+        return FrameFeatures(timestamp, **fields)
+
+    def plan_lines(self):
+        return [f"• Behaviors: {', '.join(self.names) or 'none'}",
+                f"• Models: {', '.join(name for name in MODELS if name in self.models) or 'none'}",
+                f"• Derived: {' -> '.join(self.order) or 'none'}"]
+
+    def report_lines(self):
+        frames = max(1, self.stats['frames'])
+        cost = sum(self.stats['seconds'].values())
+        return self.plan_lines()[:2] + [f"• Derived Features: {1e6 * cost / frames:.1f}µs per frame"]
+
+
+def benchmark_plans(source_spec="synthetic:150", plans=None, profile=None):
+    """Whole-pipeline frame cost for several behavior sets, each building only the models it needs"""
+    import io
+    import contextlib
+    from frame_sources import open_source
+    from model_profiles import DEFAULT_PROFILE
+    from final_awkwardness_detector import UltimateAwkwardnessDetector
+
+    plans = plans or {
+        'everything': ['face_absence', 'gaze', 'face_touch', 'fidget'],
+        'faces only': ['face_absence', 'gaze'],
+        'hands only': ['face_touch', 'fidget'],
+        'memes only': []
+    }
+    results = {}
+    print(f"📊 Behavior Plan Benchmark ({source_spec})")
+    for label, names in plans.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            detector = UltimateAwkwardnessDetector(enable_audio=False, enable_motion_gate=False,
+                                                   profile=profile or DEFAULT_PROFILE, behaviors=names)
+        source = open_source(source_spec)
+        frames = 0
+        elapsed = 0.0
+        for frame in source:
+            # Only the detector's work counts, not decoding
+            start = time.perf_counter()
+            detector.process_frame(frame, source.timestamp)
+            elapsed += time.perf_counter() - start
+            frames += 1
+        source.release()
+        detector.backend.close()
+        models = ', '.join(name for name in MODELS if detector.behavior_graph.needs(name)) or 'none'
+        results[label] = 1000 * elapsed / max(1, frames)
+        print(f"• {label}: {results[label]:.1f}ms per frame (models: {models})")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show what a set of behaviors needs, or time several sets")
+    parser.add_argument("--behaviors", nargs="*", default=None, choices=list(PLUGINS), metavar="NAME",
+                        help=f"Behaviors to plan for (default: all of {', '.join(PLUGINS)})")
+    parser.add_argument("--benchmark", action="store_true", help="Time the pipeline for several behavior sets")
+    parser.add_argument("--source", default="synthetic:150")
+    parser.add_argument("--profile", default=None)
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark_plans(args.source, profile=args.profile)
+    else:
+        for line in BehaviorGraph(args.behaviors).plan_lines():
+            print(line)
@@ -1,30 +1,43 @@
 # save as: camera_test.py
 import cv2
+import argparse
+from frame_sources import add_source_arguments, open_source_from_args
 
-# Access your "awkwardness surveillance device" (aka webcam)
-camera = cv2.VideoCapture(0)
 
-print("🕵️ Awkwardness Detection Camera Test!")
-print("Press 'q' to quit when you're done looking awkward")
+def main():
+    """Check that the webcam (or any --source) opens and shows frames"""
+    parser = argparse.ArgumentParser(description="Camera Test")
+    add_source_arguments(parser)
+    args = parser.parse_args()
+    
+    # Access your "awkwardness surveillance device" (aka webcam)
+    camera = open_source_from_args(args)
+
+    print("🕵️ Awkwardness Detection Camera Test!")
+    print("Press 'q' to quit when you're done looking awkward")
 
-while True:
-    # Capture your potentially awkward face
-    ret, frame = camera.read()
+    while True:
+        # Capture your potentially awkward face
+        ret, frame = camera.read()
     
-    if not ret:
-        print("❌ Camera not found! Check if another app is using it")
-        break
+        if not ret:
+            print("❌ Camera not found! Check if another app is using it")
+            break
     
-    # Add some fun text
-    cv2.putText(frame, "AWKWARDNESS SURVEILLANCE ACTIVE", 
-                (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+        # Add some fun text
+        cv2.putText(frame, "AWKWARDNESS SURVEILLANCE ACTIVE", 
+                    (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
     
-    cv2.imshow("Your Future Date Monitor", frame)
+        cv2.imshow("Your Future Date Monitor", frame)
     
-    # Press 'q' to quit
-    if cv2.waitKey(1) & 0xFF == ord('q'):
-        break
+        # Press 'q' to quit
+        if cv2.waitKey(1) & 0xFF == ord('q'):
+            break
+
+    camera.release()
+    cv2.destroyAllWindows()
+    print("📹 Camera test complete! Ready for awkwardness detection!")
+
 
-camera.release()
-cv2.destroyAllWindows()
-print("📹 Camera test complete! Ready for awkwardness detection!")
+if __name__ == "__main__":
+    main()
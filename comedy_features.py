@@ -1,13 +1,17 @@
 # save as: comedy_features.py
 import cv2
-import mediapipe as mp
+import argparse
 import time
 import random
 import json
 from datetime import datetime
+from frame_sources import add_source_arguments, open_source_from_args
+from scoring_strategies import FrameFeatures, ComedyStrategy
 
 class ComedyFeaturesSystem:
     def __init__(self):
+        import mediapipe as mp
+        
         # Previous setup code
         self.mp_face = mp.solutions.face_detection
         self.mp_hands = mp.solutions.hands
@@ -17,6 +21,7 @@ class ComedyFeaturesSystem:
         self.hands = self.mp_hands.Hands(min_detection_confidence=0.7, min_tracking_confidence=0.5)
         
         self.awkwardness_score = 0
+        self.scoring = ComedyStrategy()
         
         # Comedy features
         self.meme_mode = False
@@ -157,19 +162,13 @@ class ComedyFeaturesSystem:
         face_results = self.face_detector.process(rgb_frame)
         hand_results = self.hands.process(rgb_frame)
         
-        frame_awkwardness = 0
         face_detected = bool(face_results.detections)
         hands_detected = bool(hand_results.multi_hand_landmarks)
         
-        # Calculate awkwardness
-        if not face_detected:
-            frame_awkwardness += 3
-        if hands_detected:
-            frame_awkwardness += 2
-        
-        # Update score and stats
-        self.awkwardness_score += frame_awkwardness * 0.3
-        self.awkwardness_score = max(0, self.awkwardness_score - 0.1)
+        # Calculate awkwardness, update score and stats
+        features = FrameFeatures.from_results(face_results, hand_results, time.time())
+        frame_awkwardness = self.scoring.frame_points(features)
+        self.awkwardness_score = self.scoring.next_score(self.awkwardness_score, frame_awkwardness)
         self.update_statistics(frame_awkwardness, face_detected, hands_detected)
         
         # Draw detections
@@ -207,32 +206,42 @@ class ComedyFeaturesSystem:
         for line in analysis:
             print(line)
 
-# Main execution with keyboard controls
-comedy_system = ComedyFeaturesSystem()
-camera = cv2.VideoCapture(0)
 
-print("🎭 Comedy Features System Online!")
-print("Controls:")
-print("- Press 'm' to toggle Meme Mode")
-print("- Press 'r' to generate analysis report")
-print("- Press 'q' to quit")
+def main():
+    """Run the comedy features system on the webcam (or any --source)"""
+    parser = argparse.ArgumentParser(description="Comedy Features System")
+    add_source_arguments(parser)
+    args = parser.parse_args()
+    
+    comedy_system = ComedyFeaturesSystem()
+    camera = open_source_from_args(args)
+
+    print("🎭 Comedy Features System Online!")
+    print("Controls:")
+    print("- Press 'm' to toggle Meme Mode")
+    print("- Press 'r' to generate analysis report")
+    print("- Press 'q' to quit")
 
-while True:
-    ret, frame = camera.read()
-    if not ret:
-        break
+    while True:
+        ret, frame = camera.read()
+        if not ret:
+            break
     
-    frame = comedy_system.process_frame_with_comedy(frame)
+        frame = comedy_system.process_frame_with_comedy(frame)
     
-    cv2.imshow("Comedy-Enhanced Awkwardness Detector", frame)
+        cv2.imshow("Comedy-Enhanced Awkwardness Detector", frame)
     
-    key = cv2.waitKey(1) & 0xFF
-    if key == ord('q'):
-        break
-    elif key == ord('m'):
-        comedy_system.toggle_meme_mode()
-    elif key == ord('r'):
-        comedy_system.save_session_report()
+        key = cv2.waitKey(1) & 0xFF
+        if key == ord('q'):
+            break
+        elif key == ord('m'):
+            comedy_system.toggle_meme_mode()
+        elif key == ord('r'):
+            comedy_system.save_session_report()
+
+    camera.release()
+    cv2.destroyAllWindows()
+
 
-camera.release()
-cv2.destroyAllWindows()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
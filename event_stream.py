@@ -0,0 +1,291 @@
+# save as: event_stream.py
+import os
+import json
+import time
+import socket
+import argparse
+import threading
+import socketserver
+from collections import deque
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Same buckets as the on-screen status
+ALERT_LEVELS = ((5, "smooth"), (15, "nervous"), (30, "uncomfortable"), (50, "major"), (float('inf'), "catastrophe"))
+
+
+def alert_levels(cutoffs=None):
+    """The status buckets with their upper limits moved to cutoffs (e.g. ones picked by score_tuner.py)"""
+    if cutoffs is None:
+        return ALERT_LEVELS
+    cutoffs = [float(c) for c in cutoffs]
+    if len(cutoffs) != len(ALERT_LEVELS) - 1 or any(b <= a for a, b in zip(cutoffs, cutoffs[1:])):
+        raise ValueError(f"Need {len(ALERT_LEVELS) - 1} increasing cutoffs, got {cutoffs}")
+    return tuple((limit, name) for limit, (_, name) in zip(cutoffs + [float('inf')], ALERT_LEVELS))
+
+
+def alert_level(score, levels=ALERT_LEVELS):
+    """Name of the status bucket a score falls in"""
+    for limit, name in levels:
+        if score < limit:
+            return name
+    return levels[-1][1]
+
+
+class Subscriber:
+    """One consumer's bounded queue; when it's full the oldest event is dropped"""
+
+    def __init__(self, name, max_queue=256):
+        self.name = name
+        self.queue = deque(maxlen=max_queue)
+        self.condition = threading.Condition()
+        self.delivered = 0
+        self.dropped = 0
+        self.closed = False
+
+    def offer(self, message):
+        """Never blocks the publisher"""
+        with self.condition:
+            if len(self.queue) == self.queue.maxlen:
+                self.dropped += 1
+            self.queue.append(message)
+            self.condition.notify()
+
+    def get(self, timeout=None):
+        """Next message, or None on timeout/close"""
+        with self.condition:
+            if not self.queue and not self.closed:
+                self.condition.wait(timeout)
+            if not self.queue:
+                return None
+            self.delivered += 1
+            return self.queue.popleft()
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+
+class EventHub:
+    """Fans published events out to every subscriber's queue"""
+
+    def __init__(self, max_queue=256):
+        self.max_queue = max_queue
+        self.subscribers = []
+        self.closed_subscribers = []
+        self.lock = threading.Lock()
+        self.sequence = 0
+        self.started_at = time.time()
+        self.stats = {
+            'published': 0,
+            'subscribers_total': 0,
+            'delivered': 0,
+            'dropped': 0
+        }
+
+    def subscribe(self, name="client"):
+        subscriber = Subscriber(name, self.max_queue)
+        with self.lock:
+            self.subscribers.append(subscriber)
+            self.stats['subscribers_total'] += 1
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        subscriber.close()
+        with self.lock:
+            if subscriber in self.subscribers:
+                self.subscribers.remove(subscriber)
+            self.stats['delivered'] += subscriber.delivered
+            self.stats['dropped'] += subscriber.dropped
+
+    def publish(self, event_type, data):
+        """Serialize once and hand the same line to every subscriber"""
+        with self.lock:
+            self.sequence += 1
+            sequence = self.sequence
+            message = json.dumps({'id': sequence, 'type': event_type, 'time': round(time.time(), 3),
+                                  'data': data})
+            subscribers = list(self.subscribers)
+            self.stats['published'] += 1
+        for subscriber in subscribers:
+            subscriber.offer((sequence, event_type, message))
+
+    def close(self):
+        self.closed_subscribers = list(self.subscribers)
+        for subscriber in self.closed_subscribers:
+            subscriber.close()
+
+    def report_lines(self):
+        """Throughput and drops for the session report"""
+        with self.lock:
+            delivered = self.stats['delivered'] + sum(s.delivered for s in self.subscribers)
+            dropped = self.stats['dropped'] + sum(s.dropped for s in self.subscribers)
+        elapsed = max(1e-9, time.time() - self.started_at)
+        return [
+            f"• Event Stream: {self.stats['published']} events ({self.stats['published'] / elapsed:.1f}/s), "
+            f"{delivered} delivered, {dropped} dropped, {self.stats['subscribers_total']} subscribers"
+        ]
+
+
+class SSEHandler(BaseHTTPRequestHandler):
+    """GET /events streams Server-Sent Events until the client disconnects"""
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/events':
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+
+        hub = self.server.hub
+        subscriber = hub.subscribe(f"sse:{self.client_address[0]}")
+        try:
+            while True:
+                item = subscriber.get(timeout=15.0)
+                if item is None:
+                    if subscriber.closed:
+                        break  # Queue drained after the hub closed
+                    self.wfile.write(b": keep-alive\n\n")  # Also notices closed connections
+                else:
+                    sequence, event_type, message = item
+                    self.wfile.write(f"id: {sequence}\nevent: {event_type}\ndata: {message}\n\n".encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            hub.unsubscribe(subscriber)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class SocketHandler(socketserver.StreamRequestHandler):
+    """Newline-delimited JSON to each UNIX socket client"""
+
+    def handle(self):
+        hub = self.server.hub
+        subscriber = hub.subscribe("unix")
+        try:
+            while True:
+                item = subscriber.get(timeout=15.0)
+                if item is None and subscriber.closed:
+                    break
+                if item is not None:
+                    self.wfile.write(item[2].encode('utf-8') + b"\n")
+                    self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            hub.unsubscribe(subscriber)
+
+
+class EventStreamServer:
+    """Serves an EventHub over SSE and/or a UNIX socket from background threads"""
+
+    def __init__(self, hub, port=None, host="127.0.0.1", socket_path=None):
+        self.hub = hub
+        self.servers = []
+        self.socket_path = socket_path
+        if port is not None:
+            http_server = ThreadingHTTPServer((host, port), SSEHandler)
+            http_server.daemon_threads = True
+            http_server.hub = hub
+            self.servers.append(http_server)
+            print(f"📡 Event stream: http://{host}:{http_server.server_address[1]}/events")
+        if socket_path is not None:
+            if not hasattr(socket, 'AF_UNIX'):
+                print("📡 UNIX sockets aren't available on this platform")
+            else:
+                if os.path.exists(socket_path):
+                    os.unlink(socket_path)
+                unix_server = socketserver.ThreadingUnixStreamServer(socket_path, SocketHandler)
+                unix_server.daemon_threads = True
+                unix_server.hub = hub
+                self.servers.append(unix_server)
+                print(f"📡 Event stream: unix socket {socket_path}")
+
+    def start(self):
+        for server in self.servers:
+            threading.Thread(target=server.serve_forever, name="event-stream", daemon=True).start()
+        return self
+
+    def stop(self, drain_timeout=1.0):
+        """Close subscriptions (clients get what's already queued), then the servers"""
+        self.hub.close()
+        deadline = time.time() + drain_timeout
+        while time.time() < deadline and any(s.queue for s in self.hub.closed_subscribers):
+            time.sleep(0.01)
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+        if self.socket_path is not None and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+class DetectorEventPublisher:
+    """Turns detector state into score, behavior and alert-level events"""
+
+    def __init__(self, hub, score_rate=5.0, levels=ALERT_LEVELS):
+        self.hub = hub
+        self.levels = levels
+        self.score_interval = 1.0 / score_rate if score_rate > 0 else float('inf')
+        self.last_score_time = 0.0
+        self.level = None
+
+    def update(self, detector):
+        """Call once per processed frame; cheap when nothing changed"""
+        now = time.perf_counter()
+        score = round(float(detector.awkwardness_score), 2)
+        if now - self.last_score_time >= self.score_interval:
+            self.last_score_time = now
+            self.hub.publish('score', {'score': score, 'frame': detector.stats['total_frames']})
+
+        level = alert_level(score, self.levels)
+        if level != self.level:
+            self.hub.publish('alert_level', {'level': level, 'previous': self.level, 'score': score})
+            self.level = level
+
+        events = detector.events
+        for name in events.behaviors:
+            if events.started(name):
+                self.hub.publish('behavior_start', {'behavior': name,
+                                                    'start': round(events.segmenters[name].active['start'], 3)})
+        for name, event in events.closed:
+            self.hub.publish('behavior_end', {'behavior': name, 'start': round(event['start'], 3),
+                                              'end': round(event['end'], 3), 'peak': event['peak']})
+
+
+def listen(url=None, socket_path=None, limit=None):
+    """Print events from a running detector (SSE URL or UNIX socket)"""
+    count = 0
+    if socket_path is not None:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(socket_path)
+        lines = client.makefile('r', encoding='utf-8')
+    else:
+        from urllib.request import urlopen
+        lines = (line.decode('utf-8') for line in urlopen(url))
+    for line in lines:
+        line = line.strip()
+        if socket_path is None:
+            if not line.startswith("data: "):
+                continue
+            line = line[len("data: "):]
+        event = json.loads(line)
+        print(f"{event['id']:>6} {event['type']:<15} {json.dumps(event['data'])}")
+        count += 1
+        if limit is not None and count >= limit:
+            break
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print awkwardness events from a running detector")
+    parser.add_argument("--url", default="http://127.0.0.1:8765/events")
+    parser.add_argument("--socket", default=None, help="Read from a UNIX socket instead of SSE")
+    parser.add_argument("--limit", type=int, default=None)
+    args = parser.parse_args()
+
+    listen(args.url, args.socket, args.limit)
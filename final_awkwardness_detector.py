@@ -1,36 +1,141 @@
 # save as: final_awkwardness_detector.py
 import cv2
-import mediapipe as mp
 import time
 import random
 import json
 from datetime import datetime
 import argparse
+import threading
+from motion_gate import MotionGate, MARGINAL_FACE_SCORE
+from frame_sources import open_source, add_source_arguments, open_source_from_args
+from model_profiles import PROFILES, DEFAULT_PROFILE, get_profile, resize_for_inference
+from inference_backends import BACKENDS, NO_FACES, NO_HANDS, FrameDetections, build_backend, PostureMonitor
+from quality_controller import AdaptiveQualityController, build_quality_levels
+from person_tracker import PersonTracker
+from gaze_estimator import GazeEstimator
+from audio_engine import AudioEngine, sound_for_level
+from silence_detector import MicrophoneListener
+from event_segmenter import BehaviorEvents
+from event_stream import EventHub, EventStreamServer, DetectorEventPublisher, alert_level, alert_levels
+from preview_server import PreviewServer
+from session_recorder import SessionRecorder
+from highlight_extractor import HighlightExtractor, extract_highlights
+from scoring_strategies import STRATEGIES, UltimateStrategy, StrategyBank
+from behavior_plugins import PLUGINS, BehaviorGraph, select_behaviors
+from servo_output import DEFAULT_BAUD, BAUD_RATES, ServoChannel
+from session_archive import SUMMARY_VERSION, ScoreSeries
+
+# On-screen status for each alert level
+LEVEL_STATUS = {
+    'smooth': ("😊 Smooth & Confident", (0, 255, 0)),
+    'nervous': ("😐 Slightly Nervous", (0, 255, 255)),
+    'uncomfortable': ("😅 Getting Uncomfortable", (0, 165, 255)),
+    'major': ("😰 Major Awkwardness", (0, 100, 255)),
+    'catastrophe': ("🚨 SOCIAL CATASTROPHE!", (0, 0, 255))
+}
 
 class UltimateAwkwardnessDetector:
-    def __init__(self, enable_memes=True, enable_audio=True):
+    def __init__(self, enable_memes=True, enable_audio=True, enable_motion_gate=True,
+                 profile=DEFAULT_PROFILE, target_fps=None, enable_gaze=True,
+                 backend='separate', enable_pose=False, enable_mic=False, event_port=None,
+                 event_socket=None, event_rate=5.0, compare_strategies=None, score_tracks=None,
+                 scoring_weights=None, behaviors=None, servo_port=None, servo_baud=DEFAULT_BAUD,
+                 servo_rate=20.0, alert_cutoffs=None):
         print("🚀 Initializing Ultimate Awkwardness Detector...")
         
+        # Startup breakdown (heavy imports happen here, not at module import)
+        self.startup_timings = {}
+        start = time.perf_counter()
+        import mediapipe as mp
+        self.startup_timings['mediapipe_import'] = time.perf_counter() - start
+        
         # Core detection setup
         self.mp_face = mp.solutions.face_detection
         self.mp_hands = mp.solutions.hands
         self.mp_draw = mp.solutions.drawing_utils
-        
-        self.face_detector = self.mp_face.FaceDetection(min_detection_confidence=0.5)
-        self.hands = self.mp_hands.Hands(
-            min_detection_confidence=0.7, 
-            min_tracking_confidence=0.5,
-            max_num_hands=2
-        )
+        self.mp_pose_connections = mp.solutions.pose.POSE_CONNECTIONS
+        
+        # Enabled behaviors decide which models get built and which derived features run per frame
+        self.behavior_graph = BehaviorGraph(select_behaviors(behaviors, gaze=enable_gaze,
+                                                             pose=enable_pose or backend == 'holistic',
+                                                             microphone=enable_mic))
+        
+        # Model profile picks the speed/accuracy trade-off
+        self.profile = get_profile(profile)
+        start = time.perf_counter()
+        self.backend = build_backend(mp, self.profile, backend, enable_pose=self.behavior_graph.needs('pose'),
+                                     enable_face=self.behavior_graph.needs('faces'),
+                                     enable_hands=self.behavior_graph.needs('hands'))
+        self.startup_timings['graph_construction'] = time.perf_counter() - start
+        print(f"🧠 Model profile: {self.profile['name']} ({self.profile['description']}), "
+              f"{self.backend.name} backend")
+        print(f"🧩 Behaviors: {', '.join(self.behavior_graph.names) or 'none'} "
+              f"(models: {', '.join(sorted(self.behavior_graph.models)) or 'none'})")
+        
+        # Posture signals whenever the backend produces pose landmarks
+        self.posture_monitor = PostureMonitor()
+        
+        # Optional feedback loop that sheds quality to hold a target frame rate
+        quality_levels = build_quality_levels(self.profile)
+        self.quality = quality_levels[0]
+        self.quality_controller = None
+        if target_fps:
+            self.quality_controller = AdaptiveQualityController(quality_levels, target_fps=target_fps)
+        
+        # Skip inference on static frames and reuse the last results
+        self.motion_gate = MotionGate() if enable_motion_gate else None
+        self.last_results = None
+        
+        # Stable per-person IDs, scores and stats when several people are in frame
+        self.person_tracker = PersonTracker()
+        
+        # Head pose every frame, FaceMesh irises only when the pose is ambiguous
+        self.gaze_estimator = GazeEstimator() if self.behavior_graph.needs('gaze') else None
         
         # Core metrics
         self.awkwardness_score = 0
         self.session_start = time.time()
+        self.frame_time = 0.0  # Session time of the frame being processed
+        self.scoring = UltimateStrategy(**dict(scoring_weights or {}, **self.behavior_graph.scoring_weights()))
+        # Tuned level boundaries go with tuned weights: status text, sounds, event stream and servo follow them
+        self.alert_levels = alert_levels(alert_cutoffs)
+        self.last_features = None
+        
+        # Other rule sets scored from the same detections, for side-by-side comparison
+        self.strategy_bank = None
+        if compare_strategies is not None:
+            self.strategy_bank = StrategyBank(compare_strategies or None, score_tracks)
         
         # Feature toggles
         self.meme_mode = enable_memes
         self.audio_enabled = enable_audio
         
+        # Alert sounds play on their own thread so frames never wait on audio
+        self.audio_engine = AudioEngine().start() if enable_audio else None
+        
+        # Dead silence from the microphone, captured on the audio thread and analyzed per frame
+        self.silence_listener = MicrophoneListener().start() if self.behavior_graph.needs('microphone') else None
+        if self.silence_listener is not None and not self.silence_listener.active:
+            self.silence_listener = None
+        
+        # Structured events for overlays, loggers and other local tools
+        self.event_hub = None
+        self.event_server = None
+        self.event_publisher = None
+        if event_port is not None or event_socket is not None:
+            self.event_hub = EventHub()
+            self.event_server = EventStreamServer(self.event_hub, port=event_port, socket_path=event_socket).start()
+            self.event_publisher = DetectorEventPublisher(self.event_hub, score_rate=event_rate,
+                                                          levels=self.alert_levels)
+        
+        # Servo meter on a serial port, written from its own thread at a capped rate
+        self.servo = ServoChannel(servo_port, servo_baud, servo_rate, levels=self.alert_levels).start() \
+            if servo_port else None
+        
+        # MJPEG preview server and session recorder, started by run() when asked for
+        self.preview = None
+        self.recorder = None
+        
         # All our comedy features combined
         self.setup_comedy_features()
         self.setup_statistics()
@@ -56,13 +161,23 @@ class UltimateAwkwardnessDetector:
     
     def setup_statistics(self):
         """Initialize statistics tracking"""
+        # When the worst moments happened (top few peaks, constant memory)
+        self.highlights = HighlightExtractor()
+        # Per-second score for the session archive
+        self.score_series = ScoreSeries()
+        # Face touches and eye contact breaks are counted as debounced events, not frames
+        self.events = BehaviorEvents()
         self.stats = {
             'total_frames': 0,
             'awkward_frames': 0,
             'face_touches': 0,
             'eye_contact_breaks': 0,
             'peak_awkwardness': 0,
-            'smooth_moments': 0
+            'smooth_moments': 0,
+            'quality_level': 0,
+            'slouch_frames': 0,
+            'tense_shoulder_frames': 0,
+            'silent_frames': 0
         }
     
     def setup_alerts(self):
@@ -72,22 +187,30 @@ class UltimateAwkwardnessDetector:
         self.alert_colors = [(0, 0, 255), (255, 0, 0), (0, 255, 255)]
         self.alert_color_index = 0
     
-    def process_frame(self, frame):
-        """Main processing pipeline"""
+    def process_frame(self, frame, timestamp=None):
+        """Main processing pipeline (timestamp: the source's clock, for clips analyzed faster than real time)"""
         self.stats['total_frames'] += 1
-        
-        # Convert for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Detect faces and hands
-        face_results = self.face_detector.process(rgb_frame)
-        hand_results = self.hands.process(rgb_frame)
+        self.frame_time = timestamp if timestamp is not None else time.time() - self.session_start
+        frame_start = time.perf_counter()
+        
+        # Detect faces and hands (and pose, depending on the backend)
+        detections = self.detect(frame)
+        face_results, hand_results = detections.face_results, detections.hand_results
+        self.posture_monitor.update(detections.pose_landmarks)
+        # Tracks first, so gaze can keep each person's FaceMesh verdict with them
+        self.person_tracker.update(face_results, hand_results, self.frame_time)
+        if self.gaze_estimator is not None:
+            self.gaze_estimator.update(frame, face_results, self.person_tracker.detection_ids)
+        if self.silence_listener is not None:
+            self.silence_listener.poll()
         
         # Calculate awkwardness for this frame
-        frame_awkwardness = self.calculate_awkwardness(face_results, hand_results)
+        frame_awkwardness = self.calculate_awkwardness(detections)
         
         # Update overall score
         self.update_awkwardness_score(frame_awkwardness)
+        self.highlights.update(self.frame_time, self.awkwardness_score)
+        self.score_series.update(self.frame_time, self.awkwardness_score)
         
         # Update statistics
         self.update_statistics(frame_awkwardness, face_results, hand_results)
@@ -96,40 +219,103 @@ class UltimateAwkwardnessDetector:
         frame = self.draw_detections(frame, face_results, hand_results)
         frame = self.draw_ui_elements(frame)
         
-        if self.meme_mode:
+        if self.meme_mode and self.quality['comedy_overlays']:
             frame = self.draw_comedy_elements(frame)
         
+        self.trigger_audio()
+        if self.event_publisher is not None:
+            self.event_publisher.update(self)
+        if self.servo is not None:
+            self.servo.update(self.awkwardness_score)
+        
+        frame_time = time.perf_counter() - frame_start
+        if self.stats['total_frames'] == 1:
+            self.startup_timings['first_frame'] = frame_time
+        if self.quality_controller is not None and self.quality_controller.update(frame_time):
+            self.apply_quality(self.quality_controller.settings)
+        
         return frame
     
-    def calculate_awkwardness(self, face_results, hand_results):
+    def trigger_audio(self):
+        """Ask the audio engine for the sound matching the current score"""
+        if self.audio_engine is None:
+            return
+        sound = sound_for_level(self.awkwardness_score, self.alert_levels)
+        if sound != 'ding':
+            self.audio_engine.play(sound)
+        elif self.events.started('face_touch'):
+            # One ding per touch, not one per frame the hand stays there
+            self.audio_engine.play('ding')
+    
+    def apply_quality(self, settings):
+        """Switch to a new quality level from the controller"""
+        if settings['hands_model_complexity'] != self.quality['hands_model_complexity']:
+            # Model complexity is baked into the graph, so rebuild it
+            self.backend.set_model_complexity(settings['hands_model_complexity'])
+            self.last_results = None
+        self.quality = settings
+        self.stats['quality_level'] = self.quality_controller.level
+        print(f"🎚️ {self.quality_controller.status_text()}")
+    
+    def detect(self, frame):
+        """Run inference on the backend, reusing the last results while the scene is static"""
+        on_stride = (self.stats['total_frames'] - 1) % self.quality['detection_stride'] == 0
+        run_inference = on_stride and (self.motion_gate is None or self.motion_gate.should_run(frame))
+        if not run_inference and self.last_results is not None:
+            return self.last_results
+        if not self.behavior_graph.needs_vision():
+            # Nothing enabled looks at the picture, so skip conversion and inference altogether
+            self.last_results = FrameDetections(NO_FACES, NO_HANDS)
+            return self.last_results
+        
+        start = time.perf_counter()
+        
+        # Convert for MediaPipe (landmarks are normalized, so a smaller frame draws fine)
+        small_frame = resize_for_inference(frame, self.quality['inference_width'])
+        rgb_frame = cv2.cvtColor(small_frame, cv2.COLOR_BGR2RGB)
+        detections = self.backend.process(rgb_frame)
+        
+        if self.motion_gate is not None:
+            weakest = detections.weakest_face_score
+            self.motion_gate.record_inference(time.perf_counter() - start,
+                                              (detections.face_count, detections.hand_count),
+                                              marginal=weakest is not None and weakest < MARGINAL_FACE_SCORE)
+        
+        self.last_results = detections
+        return self.last_results
+    
+    def calculate_awkwardness(self, detections):
         """Calculate awkwardness score for current frame"""
-        awkwardness = 0
-        
-        # No face detected (looking away?)
-        if not face_results.detections:
-            awkwardness += 3
-            self.stats['eye_contact_breaks'] += 1
-        
-        # Hands visible (potential fidgeting)
-        if hand_results.multi_hand_landmarks:
-            for hand_landmarks in hand_results.multi_hand_landmarks:
-                # Check if hand is near face area
-                index_tip = hand_landmarks.landmark[8]  # Index finger tip
-                if index_tip.y < 0.4:  # Upper part of image
-                    awkwardness += 4
-                    self.stats['face_touches'] += 1
-                else:
-                    awkwardness += 1  # General fidgeting
+        # Everything the enabled behaviors look at, gathered once and shared with any comparison strategies
+        features = self.behavior_graph.features(self, detections, self.frame_time)
+        awkwardness = self.scoring.frame_points(features)
+        self.last_features = features
+        if self.strategy_bank is not None:
+            self.strategy_bank.update(features)
+        
+        flags = {}
+        for behavior in self.scoring.behaviors:
+            flags[behavior] = flags.get(behavior, 0) + 1
+        if features.slouching:
+            self.stats['slouch_frames'] += 1
+            flags['slouching'] = 1
+        if features.shoulders_tense:
+            self.stats['tense_shoulder_frames'] += 1
+            flags['tense_shoulders'] = 1
+        if features.silent:
+            self.stats['silent_frames'] += 1
+        
+        # One event per episode, however many frames it lasts
+        self.events.update(flags, features.timestamp)
+        self.stats['face_touches'] = self.events.count('face_touch')
+        self.stats['eye_contact_breaks'] = self.events.count('eye_contact_break')
         
         return awkwardness
     
     def update_awkwardness_score(self, frame_awkwardness):
         """Update the overall awkwardness score"""
-        # Add current frame's awkwardness
-        self.awkwardness_score += frame_awkwardness * 0.5
-        
-        # Natural decay over time
-        self.awkwardness_score = max(0, self.awkwardness_score - 0.2)
+        # Add current frame's awkwardness, with natural decay over time
+        self.awkwardness_score = self.scoring.next_score(self.awkwardness_score, frame_awkwardness)
         
         # Update peak
         self.stats['peak_awkwardness'] = max(
@@ -154,6 +340,14 @@ class UltimateAwkwardnessDetector:
         if face_results.detections:
             for detection in face_results.detections:
                 self.mp_draw.draw_detection(frame, detection)
+        self.person_tracker.draw(frame)
+        
+        # Draw pose skeleton when the backend tracks it
+        if self.last_results is not None and self.last_results.pose_landmarks is not None:
+            self.mp_draw.draw_landmarks(frame, self.last_results.pose_landmarks,
+                                        self.mp_pose_connections)
+        if self.gaze_estimator is not None:
+            self.gaze_estimator.draw(frame)
         
         # Draw hand landmarks
         if hand_results.multi_hand_landmarks:
@@ -172,21 +366,7 @@ class UltimateAwkwardnessDetector:
                    (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
         
         # Status based on score
-        if self.awkwardness_score < 5:
-            status = "😊 Smooth & Confident"
-            color = (0, 255, 0)
-        elif self.awkwardness_score < 15:
-            status = "😐 Slightly Nervous"
-            color = (0, 255, 255)
-        elif self.awkwardness_score < 30:
-            status = "😅 Getting Uncomfortable"
-            color = (0, 165, 255)
-        elif self.awkwardness_score < 50:
-            status = "😰 Major Awkwardness"
-            color = (0, 100, 255)
-        else:
-            status = "🚨 SOCIAL CATASTROPHE!"
-            color = (0, 0, 255)
+        status, color = LEVEL_STATUS[alert_level(self.awkwardness_score, self.alert_levels)]
         
         cv2.putText(frame, status, (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
         
@@ -206,6 +386,16 @@ class UltimateAwkwardnessDetector:
         cv2.putText(frame, "CRINGE LEVEL", (meter_x, meter_y - 10), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
         
+        # Adaptive quality level
+        if self.quality_controller is not None:
+            cv2.putText(frame, self.quality_controller.status_text(), (meter_x, meter_y + 40),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.45, (200, 200, 200), 1)
+        
+        # Dead silence timer
+        if self.silence_listener is not None and self.silence_listener.detector.silent:
+            cv2.putText(frame, f"Dead silence: {self.silence_listener.detector.current_silence():.0f}s",
+                       (10, h - 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 165, 255), 2)
+        
         # Alert border for high awkwardness
         if self.awkwardness_score > 40:
             border_color = self.alert_colors[self.alert_color_index % len(self.alert_colors)]
@@ -266,6 +456,8 @@ class UltimateAwkwardnessDetector:
             f"📅 Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
             f"⏱️ Session Duration: {session_time/60:.1f} minutes",
             f"🎯 Frames Analyzed: {self.stats['total_frames']}",
+            f"🧠 Model Profile: {self.profile['name']}",
+            *self.behavior_graph.report_lines(),
             "",
             "📊 AWKWARDNESS METRICS:",
             f"• Peak Cringe Level: {self.stats['peak_awkwardness']:.1f}/100",
@@ -274,7 +466,22 @@ class UltimateAwkwardnessDetector:
             f"• Smooth Moments: {self.stats['smooth_moments']}",
             f"• Face Touches: {self.stats['face_touches']} (concerning)",
             f"• Eye Contact Breaks: {self.stats['eye_contact_breaks']}",
+            f"• Slouching Frames: {self.stats['slouch_frames']}",
+            f"• Tense Shoulder Frames: {self.stats['tense_shoulder_frames']}",
+            f"• Dead Silence Frames: {self.stats['silent_frames']}",
+            *(self.silence_listener.detector.report_lines() if self.silence_listener is not None else []),
             "",
+            "⏱️ BEHAVIOR EVENTS:",
+            *(self.events.report_lines() or ["• Nothing lasted long enough to count"]),
+            "",
+            "👥 PER-PERSON ANALYSIS:",
+            *(self.person_tracker.report_lines() or ["• Nobody stayed in frame long enough to track"]),
+            "",
+            "🏆 MOST AWKWARD MOMENTS:",
+            *(self.highlights.report_lines() or ["• Nothing awkward enough to make the highlight reel"]),
+            "",
+            *(["🧮 SCORING STRATEGIES:", *self.strategy_bank.report_lines(), ""]
+              if self.strategy_bank is not None else []),
             "🔬 BEHAVIORAL ANALYSIS:",
             f"• Fidget Factor: {random.randint(6, 10)}/10 (high)",
             f"• Social Confidence: {max(1, 10 - int(self.stats['peak_awkwardness']/10))}/10",
@@ -291,22 +498,77 @@ class UltimateAwkwardnessDetector:
             "Successfully turned social anxiety into comedy!"
         ]
         
-        # Save report
+        performance = []
+        if self.motion_gate is not None:
+            performance += self.motion_gate.report_lines()
+        if self.gaze_estimator is not None:
+            performance += self.gaze_estimator.report_lines()
+        if self.audio_engine is not None:
+            performance += self.audio_engine.report_lines()
+        if self.silence_listener is not None:
+            performance += self.silence_listener.detector.performance_lines()
+        if self.event_hub is not None:
+            performance += self.event_hub.report_lines()
+        if self.servo is not None:
+            performance += self.servo.report_lines()
+        if self.preview is not None:
+            performance += self.preview.report_lines()
+        if self.recorder is not None:
+            performance += self.recorder.report_lines()
+        if self.quality_controller is not None:
+            metrics = self.quality_controller.metrics()
+            performance.append(f"• Quality Level: {metrics['quality_level']}/{metrics['quality_levels'] - 1} "
+                               f"({metrics['measured_fps']:.1f}/{metrics['target_fps']:.0f} fps, "
+                               f"{metrics['quality_changes']} changes)")
+        if performance:
+            report[-3:-3] = ["", "⚡ PERFORMANCE:"] + performance
+        
+        # Save report, plus a structured summary for session_archive.py
         filename = f"awkwardness_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
         with open(filename, 'w') as f:
             f.write('\n'.join(report))
+        with open(filename[:-4] + ".json", 'w') as f:
+            json.dump(self.session_summary(session_time), f)
         
         print(f"\n📝 Report saved as: {filename}")
         return report
     
-    def run(self):
-        """Main execution loop"""
-        camera = cv2.VideoCapture(0)
+    def session_summary(self, session_time):
+        """Everything the archive indexes about this session"""
+        return {
+            'version': SUMMARY_VERSION,
+            'started_at': datetime.fromtimestamp(self.session_start).isoformat(timespec='seconds'),
+            'duration': round(session_time, 2),
+            'frames': self.stats['total_frames'],
+            'profile': self.profile['name'],
+            'scores': {'peak': round(self.stats['peak_awkwardness'], 2), 'final': round(self.awkwardness_score, 2),
+                       'mean': round(self.score_series.mean, 2)},
+            'stats': self.stats,
+            'events': self.events.to_dict(),
+            'highlights': self.highlights.highlights(),
+            'series': self.score_series.rows()
+        }
+    
+    def run(self, source=None, preview_port=None, preview_fps=10.0, preview_width=640,
+            record_dir=None, record_raw=False, record_options=None, cut_highlights=False):
+        """Main execution loop (webcam unless a FrameSource is given)"""
+        camera = source if source is not None else open_source()
         
         if not camera.isOpened():
-            print("❌ Could not open camera!")
+            print("❌ Could not open video source!")
             return
         
+        # Remote viewers share one JPEG per preview frame, encoded off the video thread
+        if preview_port is not None:
+            self.preview = PreviewServer(port=preview_port, max_fps=preview_fps, max_width=preview_width).start()
+        
+        # Session video is encoded on the recorder's thread; capture only pays for a queue append
+        if record_dir is not None:
+            options = dict(record_options or {})
+            options.setdefault('fps', camera.fps or 30.0)
+            options['overlays'] = not record_raw
+            self.recorder = SessionRecorder(record_dir, **options).start()
+        
         print("\n🎬 ULTIMATE AWKWARDNESS DETECTOR ONLINE!")
         print("Controls:")
         print("- Press 'm' to toggle meme mode")
@@ -317,14 +579,21 @@ class UltimateAwkwardnessDetector:
         while True:
             ret, frame = camera.read()
             if not ret:
-                print("❌ Failed to read from camera")
+                print("📼 End of video source")
                 break
             
-            # Process frame
+            # Process frame (overlays are drawn in place, so keep a clean copy for raw recordings)
+            raw_frame = frame.copy() if self.recorder is not None and record_raw else None
             frame = self.process_frame(frame)
+            if self.recorder is not None:
+                self.recorder.submit(raw_frame if raw_frame is not None else frame,
+                                     time.time() - self.session_start, self.awkwardness_score, self.last_results,
+                                     self.last_features.signals() if self.last_features is not None else None)
             
             # Display
             cv2.imshow("Ultimate Awkwardness Detector", frame)
+            if self.preview is not None:
+                self.preview.submit(frame)
             
             # Handle keyboard input
             key = cv2.waitKey(1) & 0xFF
@@ -340,23 +609,123 @@ class UltimateAwkwardnessDetector:
         
         camera.release()
         cv2.destroyAllWindows()
+        if self.audio_engine is not None:
+            self.audio_engine.stop()
+        if self.silence_listener is not None:
+            self.silence_listener.stop()
+        if self.preview is not None:
+            self.preview.stop()
+        if self.recorder is not None:
+            self.recorder.stop()
+        if self.strategy_bank is not None:
+            self.strategy_bank.close()
+        if self.servo is not None:
+            self.servo.stop()
         
         # Final report
         print("\n🎉 Session Complete!")
+        self.highlights.finish()
         final_report = self.generate_final_report()
+        if cut_highlights and self.recorder is not None:
+            extract_highlights(self.recorder.session_dir, k=self.highlights.k,
+                               window_seconds=self.highlights.window_seconds, min_score=self.highlights.min_score)
+        if self.event_server is not None:
+            self.event_hub.publish('session_end', {'frames': self.stats['total_frames'],
+                                                   'peak': round(self.stats['peak_awkwardness'], 2)})
+            self.event_server.stop()
 
 if __name__ == "__main__":
     # Command line options
     parser = argparse.ArgumentParser(description="Ultimate Awkwardness Detector")
     parser.add_argument("--no-memes", action="store_true", help="Disable meme mode")
     parser.add_argument("--no-audio", action="store_true", help="Disable audio alerts")
+    parser.add_argument("--no-motion-gate", action="store_true", help="Run inference on every frame")
+    parser.add_argument("--no-gaze", action="store_true", help="Only count missing faces as eye contact breaks")
+    parser.add_argument("--profile", choices=list(PROFILES), default=DEFAULT_PROFILE,
+                        help="Model profile (lite is fastest, accurate is slowest)")
+    parser.add_argument("--backend", choices=list(BACKENDS), default="separate",
+                        help="Separate face/hand graphs or a single Holistic pass (adds posture)")
+    parser.add_argument("--pose", action="store_true", help="Add a pose graph to the separate backend")
+    parser.add_argument("--mic", action="store_true", help="Listen for dead silence (needs sounddevice)")
+    parser.add_argument("--events-port", type=int, default=None,
+                        help="Publish events as Server-Sent Events on this port (/events)")
+    parser.add_argument("--events-socket", default=None, help="Publish events on this UNIX socket")
+    parser.add_argument("--events-rate", type=float, default=5.0, help="Score updates per second")
+    parser.add_argument("--servo", default=None, metavar="PORT",
+                        help="Drive the servo meter on this serial port (e.g. /dev/ttyUSB0)")
+    parser.add_argument("--servo-baud", type=int, default=DEFAULT_BAUD, choices=BAUD_RATES)
+    parser.add_argument("--servo-rate", type=float, default=20.0, help="Servo updates per second")
+    parser.add_argument("--preview-port", type=int, default=None,
+                        help="Serve an MJPEG preview of the annotated video on this port")
+    parser.add_argument("--preview-fps", type=float, default=10.0, help="Preview frame rate cap")
+    parser.add_argument("--preview-width", type=int, default=640, help="Preview width cap in pixels")
+    parser.add_argument("--record", default=None, metavar="DIR",
+                        help="Record the annotated session video into DIR")
+    parser.add_argument("--record-raw", action="store_true", help="Record frames without overlays")
+    parser.add_argument("--record-codec", default="mp4v", help="FourCC for recordings")
+    parser.add_argument("--record-size", default=None, metavar="WxH", help="Resize recordings")
+    parser.add_argument("--segment-minutes", type=float, default=5.0, help="Start a new file this often")
+    parser.add_argument("--segment-mb", type=float, default=None, help="...or when a file reaches this size")
+    parser.add_argument("--highlights", action="store_true",
+                        help="Cut the most awkward moments of the recording into clips afterwards")
+    parser.add_argument("--compare-strategies", nargs="*", default=None, choices=list(STRATEGIES),
+                        metavar="NAME", help="Also score with these rule sets (all when no names are given)")
+    parser.add_argument("--score-tracks", default=None, metavar="CSV",
+                        help="Write every compared strategy's per-frame score to this file")
+    parser.add_argument("--scoring-weights", default=None, metavar="JSON",
+                        help="Scoring weights and alert cutoffs picked by score_tuner.py")
+    parser.add_argument("--behaviors", nargs="*", default=None, choices=list(PLUGINS), metavar="NAME",
+                        help=f"Only detect these ({', '.join(PLUGINS)}); models nothing needs are never built")
+    parser.add_argument("--target-fps", type=float, default=None,
+                        help="Adapt quality to hold this frame rate (off by default)")
+    add_source_arguments(parser)
     
     args = parser.parse_args()
+    scoring_weights = None
+    alert_cutoffs = None
+    if args.scoring_weights:
+        with open(args.scoring_weights) as f:
+            tuned = json.load(f)
+        scoring_weights = tuned['weights']
+        alert_cutoffs = tuned.get('cutoffs')
+    
+    # Open the video source while the models load - both take the better part of a second
+    source_slot = {}
+    source_thread = threading.Thread(
+        target=lambda: source_slot.update(source=open_source_from_args(args)), daemon=True)
+    source_thread.start()
     
     # Create and run detector
     detector = UltimateAwkwardnessDetector(
         enable_memes=not args.no_memes,
-        enable_audio=not args.no_audio
+        enable_audio=not args.no_audio,
+        enable_motion_gate=not args.no_motion_gate,
+        profile=args.profile,
+        target_fps=args.target_fps,
+        enable_gaze=not args.no_gaze,
+        backend=args.backend,
+        enable_pose=args.pose,
+        enable_mic=args.mic,
+        event_port=args.events_port,
+        event_socket=args.events_socket,
+        event_rate=args.events_rate,
+        compare_strategies=args.compare_strategies,
+        score_tracks=args.score_tracks,
+        scoring_weights=scoring_weights,
+        behaviors=args.behaviors,
+        servo_port=args.servo,
+        servo_baud=args.servo_baud,
+        servo_rate=args.servo_rate,
+        alert_cutoffs=alert_cutoffs
     )
     
-    detector.run()
\ No newline at end of file
+    source_thread.join()
+    record_options = {
+        'codec': args.record_codec,
+        'resolution': tuple(int(v) for v in args.record_size.split('x')) if args.record_size else None,
+        'segment_seconds': args.segment_minutes * 60,
+        'segment_bytes': int(args.segment_mb * 1e6) if args.segment_mb else None
+    }
+    detector.run(source_slot['source'], preview_port=args.preview_port, preview_fps=args.preview_fps,
+                 preview_width=args.preview_width, record_dir=args.record, record_raw=args.record_raw,
+                 record_options=record_options, cut_highlights=args.highlights)
\ No newline at end of file
@@ -0,0 +1,331 @@
+# save as: frame_sources.py
+import os
+import glob
+import math
+import time
+import queue
+import threading
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+
+class FrameSource:
+    """Anything that produces BGR frames - reads like cv2.VideoCapture so loops stay the same"""
+
+    live = False
+
+    def __init__(self, fps=30.0):
+        self.fps = fps
+        self.frame_index = -1
+        self.timestamp = 0.0  # seconds of the last frame returned by read()
+        self.opened = False
+
+    def open(self):
+        """Prepare the source; returns True when frames can be read"""
+        self.opened = True
+        return True
+
+    def grab_frame(self):
+        """Return (ok, frame, timestamp) for the next frame - implemented by subclasses"""
+        raise NotImplementedError
+
+    def read(self):
+        """Return (ok, frame) just like cv2.VideoCapture.read"""
+        if not self.opened:
+            return False, None
+        ok, frame, timestamp = self.grab_frame()
+        if ok:
+            self.frame_index += 1
+            self.timestamp = timestamp
+        return ok, frame
+
+    def isOpened(self):
+        return self.opened
+
+    def release(self):
+        self.opened = False
+
+    def __iter__(self):
+        while True:
+            ok, frame = self.read()
+            if not ok:
+                return
+            yield frame
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+class CameraSource(FrameSource):
+    """Live webcam frames"""
+
+    live = True
+
+    def __init__(self, index=0, width=None, height=None):
+        super().__init__()
+        self.index = index
+        self.width = width
+        self.height = height
+        self.capture = None
+
+    def open(self):
+        self.capture = cv2.VideoCapture(self.index)
+        if self.width:
+            self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        if self.height:
+            self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        self.fps = self.capture.get(cv2.CAP_PROP_FPS) or 30.0
+        self.opened = self.capture.isOpened()
+        self.start_time = time.time()
+        return self.opened
+
+    def grab_frame(self):
+        ok, frame = self.capture.read()
+        return ok, frame, time.time() - self.start_time
+
+    def release(self):
+        if self.capture is not None:
+            self.capture.release()
+        super().release()
+
+
+class VideoFileSource(FrameSource):
+    """Frames decoded from a recorded video file"""
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.capture = None
+
+    def open(self):
+        self.capture = cv2.VideoCapture(self.path)
+        self.fps = self.capture.get(cv2.CAP_PROP_FPS) or 30.0
+        self.opened = self.capture.isOpened()
+        return self.opened
+
+    def grab_frame(self):
+        ok, frame = self.capture.read()
+        if not ok:
+            return False, None, self.timestamp
+        # Container timestamps keep variable frame rate recordings honest
+        position_ms = self.capture.get(cv2.CAP_PROP_POS_MSEC)
+        timestamp = position_ms / 1000 if position_ms > 0 else (self.frame_index + 1) / self.fps
+        return True, frame, timestamp
+
+    def release(self):
+        if self.capture is not None:
+            self.capture.release()
+        super().release()
+
+
+class ImageSequenceSource(FrameSource):
+    """Frames from a directory of images (or a glob pattern), in name order"""
+
+    def __init__(self, pattern, fps=30.0):
+        super().__init__(fps)
+        self.pattern = pattern
+        self.paths = []
+        self.position = 0
+
+    def open(self):
+        if os.path.isdir(self.pattern):
+            candidates = glob.glob(os.path.join(self.pattern, '*'))
+        else:
+            candidates = glob.glob(self.pattern)
+        self.paths = sorted(p for p in candidates if p.lower().endswith(IMAGE_EXTENSIONS))
+        self.position = 0
+        self.opened = bool(self.paths)
+        return self.opened
+
+    def grab_frame(self):
+        while self.position < len(self.paths):
+            frame = cv2.imread(self.paths[self.position])
+            self.position += 1
+            if frame is not None:
+                return True, frame, (self.frame_index + 1) / self.fps
+        return False, None, self.timestamp
+
+
+class SyntheticSource(FrameSource):
+    """Deterministic generated frames: a drifting 'face', a 'hand' that wanders up to it, and sensor noise"""
+
+    def __init__(self, num_frames=300, width=640, height=480, fps=30.0, seed=0, noise=4.0):
+        super().__init__(fps)
+        self.num_frames = num_frames
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.noise = noise
+
+    def open(self):
+        self.rng = np.random.default_rng(self.seed)
+        # Vertical gradient background, built once
+        column = np.linspace(60, 140, self.height, dtype=np.float32)
+        self.background = np.repeat(column[:, None], self.width, axis=1)
+        self.background = np.dstack([self.background, self.background * 0.9, self.background * 0.8])
+        self.background = self.background.astype(np.uint8)
+        self.opened = True
+        return True
+
+    def render(self, index):
+        """Draw frame number `index` (same index, same pixels)"""
+        frame = self.background.copy()
+        t = index / self.fps
+        w, h = self.width, self.height
+
+        # Face sways gently and disappears for a second every ten seconds
+        if t % 10 < 9:
+            face_center = (int(w / 2 + 40 * math.sin(t * 0.7)), int(h * 0.35))
+            cv2.ellipse(frame, face_center, (int(w * 0.09), int(h * 0.16)), 0, 0, 360, (140, 170, 220), -1)
+            cv2.circle(frame, (face_center[0] - 25, face_center[1] - 15), 6, (40, 40, 40), -1)
+            cv2.circle(frame, (face_center[0] + 25, face_center[1] - 15), 6, (40, 40, 40), -1)
+
+        # Hand rises toward the face every four seconds
+        rise = max(0.0, math.sin(t * math.pi / 2))
+        hand_center = (int(w * 0.7), int(h * (0.9 - 0.6 * rise)))
+        cv2.circle(frame, hand_center, int(w * 0.05), (120, 160, 210), -1)
+
+        if self.noise:
+            grain = self.rng.normal(0, self.noise, frame.shape)
+            frame = np.clip(frame + grain, 0, 255).astype(np.uint8)
+        return frame
+
+    def grab_frame(self):
+        index = self.frame_index + 1
+        if self.num_frames is not None and index >= self.num_frames:
+            return False, None, self.timestamp
+        return True, self.render(index), index / self.fps
+
+
+class PrefetchingSource(FrameSource):
+    """Decode frames on a background thread into a bounded queue"""
+
+    def __init__(self, source, queue_size=8, realtime=False):
+        super().__init__(source.fps)
+        self.source = source
+        self.live = source.live
+        self.realtime = realtime
+        self.frames = queue.Queue(maxsize=queue_size)
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.dropped = 0
+        self.pace_origin = None
+
+    def open(self):
+        if not self.source.open():
+            return False
+        self.fps = self.source.fps
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.decode_loop, daemon=True)
+        self.thread.start()
+        self.opened = True
+        return True
+
+    def decode_loop(self):
+        """Background thread: keep the queue topped up"""
+        while not self.stop_event.is_set():
+            ok, frame = self.source.read()
+            item = (ok, frame, self.source.timestamp)
+            if self.live:
+                # Live feeds should show the newest frame, so make room by dropping the oldest
+                while True:
+                    try:
+                        self.frames.put_nowait(item)
+                        break
+                    except queue.Full:
+                        try:
+                            self.frames.get_nowait()
+                            self.dropped += 1
+                        except queue.Empty:
+                            pass
+            else:
+                while not self.stop_event.is_set():
+                    try:
+                        self.frames.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+            if not ok:
+                break
+
+    def grab_frame(self):
+        while True:
+            try:
+                ok, frame, timestamp = self.frames.get(timeout=0.5)
+                break
+            except queue.Empty:
+                # A slow camera is fine, a decoder thread that died (or was stopped) will never deliver
+                if self.thread is None or not self.thread.is_alive():
+                    self.opened = False
+                    return False, None, self.timestamp
+        if not ok:
+            self.opened = False
+            return False, None, self.timestamp
+
+        if self.realtime and not self.live:
+            # Hold frames back so playback runs at the recorded speed
+            now = time.perf_counter()
+            if self.pace_origin is None:
+                self.pace_origin = (now, timestamp)
+            delay = (self.pace_origin[0] + timestamp - self.pace_origin[1]) - now
+            if delay > 0:
+                time.sleep(delay)
+        return True, frame, timestamp
+
+    def release(self):
+        self.stop_event.set()
+        # Unblock the decoder if it is waiting on a full queue
+        while not self.frames.empty():
+            try:
+                self.frames.get_nowait()
+            except queue.Empty:
+                break
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+        self.source.release()
+        super().release()
+
+
+def make_source(spec=None):
+    """Turn a source description into a FrameSource
+
+    None or a number -> webcam, 'synthetic[:frames]' -> generated frames,
+    a directory or glob -> image sequence, anything else -> video file.
+    """
+    if spec is None or str(spec).isdigit():
+        return CameraSource(int(spec or 0))
+    spec = str(spec)
+    if spec.startswith('synthetic'):
+        _, _, frames = spec.partition(':')
+        return SyntheticSource(num_frames=int(frames) if frames else 300)
+    if os.path.isdir(spec) or any(ch in spec for ch in '*?['):
+        return ImageSequenceSource(spec)
+    return VideoFileSource(spec)
+
+
+def open_source(spec=None, prefetch=True, realtime=False, queue_size=8):
+    """Build, wrap and open a frame source"""
+    source = make_source(spec)
+    if prefetch:
+        source = PrefetchingSource(source, queue_size=queue_size, realtime=realtime)
+    source.open()
+    return source
+
+
+def add_source_arguments(parser):
+    """Add the shared --source/--realtime/--no-prefetch options to an argparse parser"""
+    parser.add_argument("--source", default=None,
+                        help="Camera index, video file, image directory/glob or 'synthetic[:frames]' (default: webcam)")
+    parser.add_argument("--realtime", action="store_true",
+                        help="Play files at recorded speed instead of as fast as possible")
+    parser.add_argument("--no-prefetch", action="store_true", help="Decode frames on the main thread")
+
+
+def open_source_from_args(args):
+    """Open the source described by add_source_arguments options"""
+    return open_source(args.source, prefetch=not args.no_prefetch, realtime=args.realtime)
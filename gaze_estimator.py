@@ -0,0 +1,206 @@
+# save as: gaze_estimator.py
+import math
+import time
+import cv2
+import numpy as np
+
+# Generic head in millimetres, camera-style axes (x right, y down, z away from the camera),
+# in the order FaceDetection returns its keypoints
+FACE_TEMPLATE_3D = np.array([
+    (-30.0, -35.0, 30.0),   # Right eye
+    (30.0, -35.0, 30.0),    # Left eye
+    (0.0, 0.0, 0.0),        # Nose tip
+    (0.0, 40.0, 15.0),      # Mouth center
+    (-75.0, -20.0, 100.0),  # Right ear tragion
+    (75.0, -20.0, 100.0)    # Left ear tragion
+], dtype=np.float64)
+
+# FaceMesh (refine_landmarks=True) indices: iris centers and the eye corners/lids around them
+RIGHT_EYE = {'iris': 468, 'outer': 33, 'inner': 133, 'top': 159, 'bottom': 145}
+LEFT_EYE = {'iris': 473, 'outer': 263, 'inner': 362, 'top': 386, 'bottom': 374}
+
+LOOKING = "looking"
+AWAY = "away"
+AMBIGUOUS = "ambiguous"
+
+
+def estimate_head_pose(keypoints, frame_width, frame_height):
+    """Yaw and pitch in degrees from the six FaceDetection keypoints (None if solvePnP fails)"""
+    image_points = np.array([(kp.x * frame_width, kp.y * frame_height) for kp in keypoints],
+                            dtype=np.float64)
+    focal = float(frame_width)
+    camera_matrix = np.array([[focal, 0, frame_width / 2],
+                              [0, focal, frame_height / 2],
+                              [0, 0, 1]], dtype=np.float64)
+    ok, rvec, _ = cv2.solvePnP(FACE_TEMPLATE_3D, image_points, camera_matrix, None,
+                               flags=cv2.SOLVEPNP_EPNP)
+    if not ok:
+        return None
+    rotation, _ = cv2.Rodrigues(rvec)
+    # Direction the nose points; (0, 0, -1) means straight at the camera
+    facing = rotation @ np.array([0.0, 0.0, -1.0])
+    yaw = math.degrees(math.atan2(facing[0], -facing[2]))
+    pitch = math.degrees(math.atan2(-facing[1], -facing[2]))
+    return yaw, pitch
+
+
+def iris_offsets(landmarks):
+    """How far the irises sit from the middle of the eyes (0 = centered, 0.5 = at the corner)"""
+    horizontal = []
+    vertical = []
+    for eye in (RIGHT_EYE, LEFT_EYE):
+        iris = landmarks[eye['iris']]
+        outer, inner = landmarks[eye['outer']], landmarks[eye['inner']]
+        top, bottom = landmarks[eye['top']], landmarks[eye['bottom']]
+        width = inner.x - outer.x
+        height = bottom.y - top.y
+        if abs(width) > 1e-6:
+            horizontal.append((iris.x - outer.x) / width - 0.5)
+        if abs(height) > 1e-6:
+            vertical.append((iris.y - top.y) / height - 0.5)
+    if not horizontal:
+        return None
+    return float(np.mean(horizontal)), float(np.mean(vertical)) if vertical else 0.0
+
+
+class GazeEstimator:
+    """Two-stage eye contact check: head pose every frame, FaceMesh irises only when unsure"""
+
+    def __init__(self, looking_yaw=20, looking_pitch=15, away_yaw=40, away_pitch=30,
+                 iris_limit=0.15, escalation_interval=5, crop_margin=0.25):
+        self.looking_yaw = looking_yaw
+        self.looking_pitch = looking_pitch
+        self.away_yaw = away_yaw
+        self.away_pitch = away_pitch
+        self.iris_limit = iris_limit
+        self.escalation_interval = escalation_interval  # Frames between FaceMesh runs
+        self.crop_margin = crop_margin
+
+        self.face_mesh = None
+        self.frame_index = 0
+        # Per face (person track id, or detection index): frame of the last FaceMesh run and its verdict
+        self.mesh_frames = {}
+        self.mesh_verdicts = {}
+        self.last_face_results = None
+        self.estimates = []
+
+        self.stats = {
+            'frames': 0,
+            'faces': 0,
+            'pose_time': 0.0,
+            'ambiguous': 0,
+            'mesh_runs': 0,
+            'mesh_time': 0.0
+        }
+
+    def classify_pose(self, yaw, pitch):
+        """Cheap verdict from head angles alone"""
+        if abs(yaw) <= self.looking_yaw and abs(pitch) <= self.looking_pitch:
+            return LOOKING
+        if abs(yaw) >= self.away_yaw or abs(pitch) >= self.away_pitch:
+            return AWAY
+        return AMBIGUOUS
+
+    def update(self, frame, face_results, face_keys=None):
+        """Estimate gaze for every detected face; returns a list of dicts with yaw, pitch and verdict.
+
+        face_keys names each detection (e.g. the person tracker's track ids) so FaceMesh verdicts and
+        rate limits stay with their own face; detection order is used when it's missing.
+        """
+        self.frame_index += 1
+        self.stats['frames'] += 1
+        # Reused detections (motion gate / stride) mean the estimate can be reused too
+        if face_results is self.last_face_results:
+            return self.estimates
+        self.last_face_results = face_results
+
+        h, w, _ = frame.shape
+        detections = face_results.detections or []
+        keys = list(face_keys) if face_keys is not None else list(range(len(detections)))
+        self.estimates = []
+        for key, detection in zip(keys, detections):
+            start = time.perf_counter()
+            keypoints = detection.location_data.relative_keypoints
+            pose = estimate_head_pose(keypoints, w, h) if len(keypoints) >= 6 else None
+            self.stats['pose_time'] += time.perf_counter() - start
+            self.stats['faces'] += 1
+
+            if pose is None:
+                yaw, pitch, verdict = 0.0, 0.0, AMBIGUOUS
+            else:
+                yaw, pitch = pose
+                verdict = self.classify_pose(yaw, pitch)
+
+            stage = "pose"
+            if verdict == AMBIGUOUS:
+                self.stats['ambiguous'] += 1
+                verdict = self.escalate(frame, detection, key)
+                stage = "mesh"
+            self.estimates.append({'yaw': yaw, 'pitch': pitch, 'verdict': verdict, 'stage': stage})
+        # Faces that are gone take their FaceMesh history with them
+        for stale in set(self.mesh_frames) - set(keys):
+            del self.mesh_frames[stale]
+            del self.mesh_verdicts[stale]
+        return self.estimates
+
+    def escalate(self, frame, detection, key=0):
+        """Check the irises with FaceMesh on the face crop, at most every few frames per face"""
+        if self.frame_index - self.mesh_frames.get(key, -self.escalation_interval) < self.escalation_interval:
+            # Give the head the benefit of the doubt until this face's next FaceMesh run
+            return self.mesh_verdicts[key]
+
+        start = time.perf_counter()
+        if self.face_mesh is None:
+            import mediapipe as mp
+            self.face_mesh = mp.solutions.face_mesh.FaceMesh(
+                static_image_mode=True, max_num_faces=1, refine_landmarks=True,
+                min_detection_confidence=0.5)
+
+        h, w, _ = frame.shape
+        box = detection.location_data.relative_bounding_box
+        x1 = max(0, int((box.xmin - box.width * self.crop_margin) * w))
+        y1 = max(0, int((box.ymin - box.height * self.crop_margin) * h))
+        x2 = min(w, int((box.xmin + box.width * (1 + self.crop_margin)) * w))
+        y2 = min(h, int((box.ymin + box.height * (1 + self.crop_margin)) * h))
+
+        verdict = LOOKING
+        if x2 - x1 > 8 and y2 - y1 > 8:
+            crop = cv2.cvtColor(frame[y1:y2, x1:x2], cv2.COLOR_BGR2RGB)
+            results = self.face_mesh.process(crop)
+            if results.multi_face_landmarks:
+                offsets = iris_offsets(results.multi_face_landmarks[0].landmark)
+                if offsets is not None and max(abs(offsets[0]), abs(offsets[1])) > self.iris_limit:
+                    verdict = AWAY
+
+        self.mesh_frames[key] = self.frame_index
+        self.mesh_verdicts[key] = verdict
+        self.stats['mesh_runs'] += 1
+        self.stats['mesh_time'] += time.perf_counter() - start
+        return verdict
+
+    def looking_away(self):
+        """True when every visible face is looking away from the camera"""
+        return bool(self.estimates) and all(e['verdict'] == AWAY for e in self.estimates)
+
+    def draw(self, frame):
+        """Show the head angles of the first face"""
+        if self.estimates:
+            estimate = self.estimates[0]
+            color = (0, 0, 255) if estimate['verdict'] == AWAY else (0, 255, 0)
+            cv2.putText(frame, f"Yaw {estimate['yaw']:+.0f} Pitch {estimate['pitch']:+.0f} "
+                               f"({estimate['verdict']}, {estimate['stage']})",
+                       (10, 100), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
+        return frame
+
+    def report_lines(self):
+        """Per-stage cost and escalation rate for the session report"""
+        faces = max(1, self.stats['faces'])
+        mesh_runs = max(1, self.stats['mesh_runs'])
+        return [
+            f"• Head Pose Stage: {1000 * self.stats['pose_time'] / faces:.2f}ms per face "
+            f"({self.stats['faces']} faces)",
+            f"• FaceMesh Stage: {1000 * self.stats['mesh_time'] / mesh_runs:.1f}ms per run "
+            f"({self.stats['mesh_runs']} runs)",
+            f"• Escalation Rate: {100 * self.stats['mesh_runs'] / faces:.1f}% of faces "
+            f"({100 * self.stats['ambiguous'] / faces:.1f}% ambiguous)"
+        ]
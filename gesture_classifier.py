@@ -0,0 +1,472 @@
+# save as: gesture_classifier.py
+import os
+import time
+import argparse
+from collections import deque
+import numpy as np
+
+GESTURES = ('hair_touch', 'neck_touch', 'waving', 'crossed_arms')
+NEUTRAL = 'neutral'  # Templates of ordinary hand activity, so not every hand is forced into a gesture
+LABELS = GESTURES + (NEUTRAL,)
+TEMPLATE_VERSION = 1
+DEFAULT_TEMPLATES = "gesture_templates.npz"
+DEFAULT_WINDOW = 12  # Frames per classified window
+
+FINGERTIPS = [4, 8, 12, 16, 20]
+FRAME_SIZE = 20  # Per-hand values per frame (see frame_vectors)
+FEATURE_SIZE = FRAME_SIZE + 5  # Window mean plus wrist spread, speed and direction reversals
+DEFAULT_ANCHOR = (0.5, 0.3, 0.2)  # Face center x, y and size when no face has been seen yet
+
+
+def face_anchor(face_results, previous=None):
+    """(center x, center y, size) of the first face, or the last one seen"""
+    if face_results.detections:
+        box = face_results.detections[0].location_data.relative_bounding_box
+        return (box.xmin + box.width / 2, box.ymin + box.height / 2, max(box.width, box.height, 1e-3))
+    return previous or DEFAULT_ANCHOR
+
+
+def hand_arrays(hand_results, anchor):
+    """(landmarks (H, 21, 2), sides (H,), keys) for the hands in one frame.
+
+    Sides are +1 for hands labeled Right and -1 for Left; x is mirrored by side so both hands share one
+    template set. Backends without handedness fall back to which side of the face the wrist is on.
+    """
+    hands = hand_results.multi_hand_landmarks or []
+    landmarks = np.array([[(p.x, p.y) for p in hand.landmark] for hand in hands], dtype=np.float32)
+    handedness = getattr(hand_results, 'multi_handedness', None)
+    if handedness:
+        names = [h.classification[0].label for h in handedness]
+    else:
+        names = ['Right' if hand[0, 0] >= anchor[0] else 'Left' for hand in landmarks]
+    sides = np.array([1.0 if name == 'Right' else -1.0 for name in names], dtype=np.float32)
+    keys = [name if names.count(name) == 1 else f"{name}{i}" for i, name in enumerate(names)]
+    return landmarks, sides, keys
+
+
+def frame_vectors(landmarks, sides, anchors):
+    """Per-hand frame vectors for a batch of frames with H hands each.
+
+    landmarks is (N, H, 21, 2) in image coordinates, sides (N, H) and anchors (N, 3). Positions are
+    measured from the face center in face sizes, hand shape from the wrist in hand sizes.
+    """
+    landmarks = np.asarray(landmarks, dtype=np.float32)
+    sides = np.asarray(sides, dtype=np.float32)[..., None]
+    anchors = np.asarray(anchors, dtype=np.float32)
+    center = anchors[:, None, :2]
+    scale = anchors[:, None, 2:3]
+
+    def from_face(points):
+        offset = (points - center) / scale
+        return np.stack([offset[..., 0] * sides[..., 0], offset[..., 1]], axis=-1)
+
+    wrist = landmarks[:, :, 0]
+    hand_size = np.linalg.norm(landmarks[:, :, 9] - wrist, axis=-1, keepdims=True) + 1e-6
+    shape = (landmarks[:, :, FINGERTIPS] - wrist[:, :, None]) / hand_size[..., None]
+    shape[..., 0] *= sides
+    if landmarks.shape[1] > 1:
+        other = (np.roll(wrist, 1, axis=1) - wrist) / scale
+        other[..., 0] *= sides[..., 0]
+        present = np.ones(hand_size.shape, dtype=np.float32)
+    else:
+        other = np.zeros(wrist.shape, dtype=np.float32)
+        present = np.zeros(hand_size.shape, dtype=np.float32)
+    return np.concatenate([from_face(wrist), from_face(landmarks[:, :, 8]), from_face(landmarks[:, :, 12]),
+                           hand_size / scale, shape.reshape(shape.shape[:2] + (10,)), other, present], axis=-1)
+
+
+def window_features(windows, min_step=0.02):
+    """Fixed-length features for a batch of (M, W, FRAME_SIZE) windows, whatever W is"""
+    windows = np.asarray(windows, dtype=np.float32)
+    wrist = windows[:, :, 0:2]
+    steps = np.diff(wrist, axis=1)
+    # Waving is a wrist that keeps changing horizontal direction; small jitter doesn't count
+    direction = np.sign(steps[..., 0]) * (np.abs(steps[..., 0]) > min_step)
+    reversals = (direction[:, 1:] * direction[:, :-1] < 0).mean(axis=1, keepdims=True)
+    return np.concatenate([windows.mean(axis=1), wrist.std(axis=1), np.abs(steps).mean(axis=1), reversals],
+                          axis=1)
+
+
+def load_kd_tree():
+    """scipy's cKDTree, imported only once an index is built (it's slow to import), or None without scipy"""
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:  # Optional: without scipy the index falls back to brute-force distances
+        return None
+    return cKDTree
+
+
+class TemplateIndex:
+    """Nearest-neighbor search over template features: a KD-tree when scipy is there, else brute force"""
+
+    def __init__(self, points, leaf_size=16, brute_force=False, chunk_size=256):
+        self.points = np.ascontiguousarray(points, dtype=np.float64)
+        self.chunk_size = chunk_size
+        self.tree = None
+        kd_tree = None if brute_force else load_kd_tree()
+        if kd_tree is not None:
+            self.tree = kd_tree(self.points, leafsize=leaf_size)
+        self.kind = "kd-tree" if self.tree is not None else "brute force"
+        self.squared_norms = (self.points ** 2).sum(axis=1)
+
+    def query(self, queries, k=5):
+        """(distances, indices), both (M, k), nearest first"""
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float64))
+        k = min(k, len(self.points))
+        if self.tree is not None:
+            distances, indices = self.tree.query(queries, k=k)
+            return distances.reshape(len(queries), k), indices.reshape(len(queries), k)
+        distances = np.empty((len(queries), k))
+        indices = np.empty((len(queries), k), dtype=np.int64)
+        # Chunked so a big batch against a big library never builds one huge distance matrix
+        for start in range(0, len(queries), self.chunk_size):
+            chunk = queries[start:start + self.chunk_size]
+            squared = (chunk ** 2).sum(axis=1)[:, None] + self.squared_norms[None] - 2 * chunk @ self.points.T
+            nearest = np.argpartition(squared, k - 1, axis=1)[:, :k] if k < len(self.points) else \
+                np.tile(np.arange(k), (len(chunk), 1))
+            nearest_squared = np.take_along_axis(squared, nearest, axis=1)
+            order = np.argsort(nearest_squared, axis=1)
+            indices[start:start + len(chunk)] = np.take_along_axis(nearest, order, axis=1)
+            distances[start:start + len(chunk)] = np.sqrt(np.maximum(np.take_along_axis(nearest_squared, order,
+                                                                                      axis=1), 0))
+        return distances, indices
+
+
+class GestureTemplates:
+    """A library of labeled window features, saved to and loaded from .npz files"""
+
+    def __init__(self, features=None, labels=None, window=DEFAULT_WINDOW):
+        self.window = window
+        self.features = np.zeros((0, FEATURE_SIZE), dtype=np.float32) if features is None else \
+            np.asarray(features, dtype=np.float32)
+        self.labels = np.zeros(0, dtype=np.int64) if labels is None else np.asarray(labels, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def add(self, label, features):
+        """Append templates for one label (a name from LABELS)"""
+        if label not in LABELS:
+            raise ValueError(f"Unknown gesture '{label}' (choose from {', '.join(LABELS)})")
+        features = np.atleast_2d(np.asarray(features, dtype=np.float32))
+        self.features = np.concatenate([self.features, features])
+        self.labels = np.concatenate([self.labels, np.full(len(features), LABELS.index(label))])
+
+    def counts(self):
+        return {label: int((self.labels == i).sum()) for i, label in enumerate(LABELS)}
+
+    def save(self, path):
+        np.savez_compressed(path, features=self.features, labels=np.array(LABELS)[self.labels],
+                            window=self.window, version=TEMPLATE_VERSION)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            if int(data['version']) != TEMPLATE_VERSION or data['features'].shape[1:] != (FEATURE_SIZE,):
+                raise ValueError(f"{path} holds templates from another feature version - record them again")
+            names = [str(name) for name in data['labels']]
+            unknown = set(names) - set(LABELS)
+            if unknown:
+                raise ValueError(f"{path} has unknown gestures: {', '.join(sorted(unknown))}")
+            return cls(data['features'], [LABELS.index(name) for name in names], int(data['window']))
+
+
+class GestureClassifier:
+    """Classifies per-hand landmark windows by k-nearest templates, batched across hands and frames"""
+
+    def __init__(self, templates, k=5, max_distance=None, stride=3, brute_force=False):
+        if not len(templates):
+            raise ValueError("The gesture template library is empty")
+        self.templates = templates
+        self.window = templates.window
+        self.k = k
+        self.stride = stride  # Classify every stride frames, all ready hands in one query
+        # Features are standardized so positions, shapes and motion weigh about the same
+        self.mean = templates.features.mean(axis=0)
+        self.std = templates.features.std(axis=0) + 1e-3
+        start = time.perf_counter()
+        self.index = TemplateIndex((templates.features - self.mean) / self.std, brute_force=brute_force)
+        self.build_time = time.perf_counter() - start
+        self.max_distance = max_distance or self.default_max_distance()
+
+        self.anchor = None
+        self.windows = {}  # Hand key -> recent frame vectors
+        self.current = {}  # Hand key -> gesture being made (None for nothing in particular)
+        self.frames = 0
+
+        self.stats = {
+            'queries': 0,
+            'windows': 0,
+            'query_time': 0.0,
+            'unmatched': 0,
+            'gestures': {gesture: 0 for gesture in GESTURES}
+        }
+
+    def default_max_distance(self, sample=500):
+        """Three times the typical distance between neighboring templates"""
+        points = self.index.points[np.linspace(0, len(self.index.points) - 1, min(sample, len(self.index.points)),
+                                               dtype=np.int64)]
+        distances, _ = self.index.query(points, k=2)
+        return 3.0 * float(np.median(distances[:, -1])) + 1e-6
+
+    @classmethod
+    def from_path(cls, path=DEFAULT_TEMPLATES, **options):
+        """Load a recorded library, or use the built-in starter templates when there is none"""
+        if path and os.path.exists(path):
+            templates = GestureTemplates.load(path)
+            print(f"🖐️ Loaded {len(templates)} gesture templates from {path}")
+        else:
+            templates = synthetic_templates()
+            print("🖐️ Using starter gesture templates (record your own with: python gesture_classifier.py record)")
+        return cls(templates, **options)
+
+    def classify(self, features):
+        """Gesture name (or None) for each row of window features, from one batched neighbor query"""
+        features = np.atleast_2d(features)
+        start = time.perf_counter()
+        distances, indices = self.index.query((features - self.mean) / self.std, self.k)
+        # Close neighbors vote with weight 1/distance; templates beyond max_distance don't vote
+        weights = np.where(distances <= self.max_distance, 1.0 / (distances + 1e-3), 0.0)
+        votes = np.zeros((len(features), len(LABELS)))
+        np.add.at(votes, (np.repeat(np.arange(len(features)), indices.shape[1]), self.templates.labels[indices].ravel()),
+                  weights.ravel())
+        winners = votes.argmax(axis=1)
+        self.stats['query_time'] += time.perf_counter() - start
+        self.stats['queries'] += 1
+        self.stats['windows'] += len(features)
+        self.stats['unmatched'] += int((votes.max(axis=1) == 0).sum())
+        return [LABELS[w] if votes[i, w] > 0 and LABELS[w] != NEUTRAL else None for i, w in enumerate(winners)]
+
+    def classify_windows(self, windows):
+        """Offline batch: (M, W, FRAME_SIZE) frame vector windows -> gesture names"""
+        return self.classify(window_features(windows))
+
+    def update(self, face_results, hand_results):
+        """Feed one frame; returns the gestures that started this frame"""
+        self.anchor = face_anchor(face_results, self.anchor)
+        landmarks, sides, keys = hand_arrays(hand_results, self.anchor)
+        for key in list(self.windows):
+            if key not in keys:  # Hand left the frame: its window and gesture are over
+                del self.windows[key]
+                self.current.pop(key, None)
+        if not keys:
+            return []
+        vectors = frame_vectors(landmarks[None], sides[None], [self.anchor])[0]
+        for key, vector in zip(keys, vectors):
+            self.windows.setdefault(key, deque(maxlen=self.window)).append(vector)
+
+        self.frames += 1
+        ready = [key for key in keys if len(self.windows[key]) == self.window]
+        if self.frames % self.stride or not ready:
+            return []
+        started = []
+        for key, gesture in zip(ready, self.classify_windows(np.array([self.windows[key] for key in ready]))):
+            if gesture is not None and self.current.get(key) != gesture:
+                started.append(gesture)
+                self.stats['gestures'][gesture] += 1
+            self.current[key] = gesture
+        return started
+
+    def report_lines(self):
+        windows = max(1, self.stats['windows'])
+        seen = ", ".join(f"{gesture} x{count}" for gesture, count in self.stats['gestures'].items() if count)
+        return [f"• Gestures: {seen or 'none'}",
+                f"• Classifier: {len(self.templates)} templates ({self.index.kind}), "
+                f"{1e6 * self.stats['query_time'] / windows:.0f}µs per window, "
+                f"{self.stats['unmatched']} of {self.stats['windows']} windows unlike any template"]
+
+
+def hand_model(wrist, angle, length, curl):
+    """21 landmarks around a wrist for a hand pointing along angle (arrays of any matching shape)"""
+    finger_angles = np.array([-0.9, -0.3, 0.0, 0.25, 0.5])
+    finger_lengths = np.array([0.55, 0.95, 1.0, 0.92, 0.75])
+    joints = np.array([0.45, 0.7, 0.85, 1.0])  # Landmark 9 (middle knuckle) sits at 0.45 of the middle finger
+    directions = angle[..., None] + finger_angles
+    # Curling folds the outer joints back toward the palm
+    reach = finger_lengths[:, None] * np.where(joints < 0.5, joints, 0.45 + (joints - 0.45) * curl[..., None, None])
+    offsets = np.stack([np.cos(directions)[..., None] * reach, np.sin(directions)[..., None] * reach], axis=-1)
+    offsets = offsets * length[..., None, None, None]
+    points = wrist[..., None, None, :] + offsets
+    return np.concatenate([wrist[..., None, :], points.reshape(points.shape[:-3] + (20, 2))], axis=-2)
+
+
+def synthetic_windows(label, count, window=DEFAULT_WINDOW, rng=None):
+    """(count, window, FRAME_SIZE) frame vectors of one hand making a gesture, from a simple hand model.
+
+    Positions are in face sizes from the face center with x mirrored to the hand's own side, then drawn
+    into image coordinates and run through frame_vectors like camera landmarks are.
+    """
+    rng = rng or np.random.default_rng(0)
+    t = np.arange(window)[None]
+
+    def u(low, high):
+        return rng.uniform(low, high, (count, 1))
+
+    def jitter(size):
+        return rng.normal(0, size, (count, window))
+
+    curl = u(0.9, 1.0) + 0 * t
+    other_x, other_y = -u(0.4, 1.3), u(1.0, 3.5)
+    two_hands = rng.random(count) < 0.5
+
+    if label == 'hair_touch':
+        x, y = u(0.35, 0.85) + jitter(0.03), u(-1.0, -0.35) + jitter(0.03)
+        angle = u(-2.4, -1.3) + jitter(0.1)
+    elif label == 'neck_touch':
+        x, y = u(-0.2, 0.45) + jitter(0.03), u(0.9, 1.5) + jitter(0.03)
+        angle = u(-2.6, -1.0) + jitter(0.1)
+    elif label == 'waving':
+        phase = 2 * np.pi * t / u(6, 16) + u(0, 2 * np.pi)
+        swing = u(0.15, 0.4)
+        x, y = u(0.7, 1.6) + swing * np.sin(phase), u(-0.4, 0.7) + jitter(0.03)
+        angle = -np.pi / 2 + 0.4 * np.sin(phase) + jitter(0.05)
+    elif label == 'crossed_arms':
+        x, y = -u(0.3, 1.1) + jitter(0.01), u(1.9, 3.0) + jitter(0.01)
+        angle = np.pi + u(-0.5, 0.5) + jitter(0.03)
+        curl = u(0.4, 0.8) + 0 * t
+        # The other hand is tucked in on this hand's side
+        other_x, other_y = u(0.3, 1.1), u(-0.3, 0.3)
+        other_y = y[:, :1] + other_y
+        two_hands = rng.random(count) < 0.85
+    elif label == NEUTRAL:
+        kind = rng.integers(0, 3, (count, 1))
+        # Resting low, talking with the hands, or touching the face (scored separately)
+        x = np.choose(kind, [u(0.2, 1.3), u(0.2, 1.3), u(-0.3, 0.4)])
+        y = np.choose(kind, [u(2.2, 3.5), u(0.9, 2.2), u(-0.3, 0.5)])
+        drift = np.cumsum(rng.normal(0, 1, (count, window, 2)), axis=1) * np.choose(kind, [0.005, 0.03, 0.01])[..., None]
+        x, y = x + drift[..., 0], y + drift[..., 1]
+        angle = u(-np.pi, np.pi) + jitter(0.1)
+        curl = u(0.5, 1.0) + 0 * t
+    else:
+        raise ValueError(f"Unknown gesture '{label}' (choose from {', '.join(LABELS)})")
+
+    length = u(0.8, 1.1) + 0 * t
+    hands = hand_model(np.stack([x, y], axis=-1), angle, length, curl)
+    other = hand_model(np.stack([other_x + 0 * t, other_y + 0 * t], axis=-1), u(-np.pi, np.pi) + 0 * t,
+                       length, u(0.5, 1.0) + 0 * t)
+    hands = hands + rng.normal(0, 0.01, hands.shape)
+
+    sides = rng.choice([-1.0, 1.0], (count, 1, 1))
+    anchors = np.concatenate([u(0.4, 0.6), u(0.2, 0.4), u(0.12, 0.3)], axis=1)
+    frames = np.empty((count, window, FRAME_SIZE), dtype=np.float32)
+    for pair, mask in ((True, two_hands), (False, ~two_hands)):
+        if not mask.any():
+            continue
+        group = np.stack([hands[mask], other[mask]], axis=2) if pair else hands[mask][:, :, None]
+        group_sides = np.concatenate([sides[mask], -sides[mask]], axis=2) if pair else sides[mask]
+        anchor = anchors[mask]
+        # Face units (x mirrored to the gesturing hand's side) -> image coordinates
+        image = group.copy()
+        image[..., 0] = anchor[:, None, None, None, 0] + group[..., 0] * sides[mask][..., None] * \
+            anchor[:, None, None, None, 2]
+        image[..., 1] = anchor[:, None, None, None, 1] + group[..., 1] * anchor[:, None, None, None, 2]
+        n, w, h = image.shape[:3]
+        vectors = frame_vectors(image.reshape(n * w, h, 21, 2), np.broadcast_to(group_sides, (n, w, h)).reshape(n * w, h),
+                                np.repeat(anchor, w, axis=0))
+        frames[mask] = vectors[:, 0].reshape(n, w, FRAME_SIZE)
+    return frames
+
+
+def synthetic_templates(per_class=400, window=DEFAULT_WINDOW, seed=0):
+    """Starter library drawn from the hand model, until real recordings replace it"""
+    rng = np.random.default_rng(seed)
+    templates = GestureTemplates(window=window)
+    for label in LABELS:
+        templates.add(label, window_features(synthetic_windows(label, per_class, window, rng)))
+    return templates
+
+
+def record_templates(source_spec, label, output=DEFAULT_TEMPLATES, window=DEFAULT_WINDOW, stride=2, profile=None):
+    """Add one template per hand window of a clip of someone making one gesture (or 'neutral')"""
+    import cv2
+    import mediapipe as mp
+    from frame_sources import open_source
+    from model_profiles import DEFAULT_PROFILE, get_profile, resize_for_inference
+    from inference_backends import build_backend
+
+    if label not in LABELS:
+        raise ValueError(f"Unknown gesture '{label}' (choose from {', '.join(LABELS)})")
+    templates = GestureTemplates.load(output) if os.path.exists(output) else GestureTemplates(window=window)
+    profile = get_profile(profile or DEFAULT_PROFILE)
+    backend = build_backend(mp, profile)
+    source = open_source(source_spec)
+    anchor = None
+    windows = {}
+    collected = []
+    frames = 0
+    for frame in source:
+        rgb_frame = cv2.cvtColor(resize_for_inference(frame, profile['inference_width']), cv2.COLOR_BGR2RGB)
+        detections = backend.process(rgb_frame)
+        anchor = face_anchor(detections.face_results, anchor)
+        landmarks, sides, keys = hand_arrays(detections.hand_results, anchor)
+        windows = {key: windows[key] for key in keys if key in windows}
+        frames += 1
+        if not keys:
+            continue
+        for key, vector in zip(keys, frame_vectors(landmarks[None], sides[None], [anchor])[0]):
+            windows.setdefault(key, deque(maxlen=templates.window)).append(vector)
+            if len(windows[key]) == templates.window and frames % stride == 0:
+                collected.append(np.array(windows[key]))
+    source.release()
+    backend.close()
+
+    if collected:
+        templates.add(label, window_features(np.array(collected)))
+        templates.save(output)
+    print(f"🖐️ {len(collected)} '{label}' templates from {frames} frames -> {output} ({len(templates)} total)")
+    return len(collected)
+
+
+def benchmark_classifier(sizes=(1000, 5000, 20000), batch=2, queries=2000, window=DEFAULT_WINDOW):
+    """Held-out accuracy on the hand model, and query cost for growing libraries with and without the tree"""
+    rng = np.random.default_rng(1)
+    test_labels = np.repeat(np.arange(len(LABELS)), 200)
+    test = np.concatenate([window_features(synthetic_windows(label, 200, window, rng)) for label in LABELS])
+
+    print(f"📊 Gesture Classifier Benchmark ({window}-frame windows, batches of {batch} hands)")
+    for size in sizes:
+        templates = synthetic_templates(per_class=size // len(LABELS), window=window)
+        for brute_force in ((False, True) if load_kd_tree() is not None else (True,)):
+            classifier = GestureClassifier(templates, brute_force=brute_force)
+            predicted = classifier.classify(test)
+            truth = [LABELS[i] if LABELS[i] != NEUTRAL else None for i in test_labels]
+            accuracy = np.mean([p == t for p, t in zip(predicted, truth)])
+            batches = test[rng.integers(0, len(test), (queries // batch, batch))]
+            start = time.perf_counter()
+            for features in batches:
+                classifier.classify(features)
+            per_batch = (time.perf_counter() - start) / len(batches)
+            print(f"• {len(templates)} templates, {classifier.index.kind}: accuracy {accuracy:.1%}, "
+                  f"{1e6 * per_batch:.0f}µs per batch (build {1000 * classifier.build_time:.1f}ms)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Nearest-template gesture classifier")
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record", help="Add templates from a clip of one gesture")
+    record_parser.add_argument("label", choices=LABELS)
+    record_parser.add_argument("--source", default=None, help="Clip or camera to record from (default: webcam)")
+    record_parser.add_argument("--output", default=DEFAULT_TEMPLATES)
+    record_parser.add_argument("--profile", default=None)
+    starter_parser = commands.add_parser("starter", help="Write the built-in starter templates to a file")
+    starter_parser.add_argument("--output", default=DEFAULT_TEMPLATES)
+    starter_parser.add_argument("--per-class", type=int, default=400)
+    info_parser = commands.add_parser("info", help="Count the templates in a library")
+    info_parser.add_argument("path", nargs="?", default=DEFAULT_TEMPLATES)
+    bench_parser = commands.add_parser("benchmark", help="Accuracy and query cost on the hand model")
+    bench_parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    bench_parser.add_argument("--batch", type=int, default=2, help="Hand windows per query")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record_templates(args.source, args.label, args.output, profile=args.profile)
+    elif args.command == "starter":
+        synthetic_templates(args.per_class).save(args.output)
+        print(f"🖐️ Starter templates saved to {args.output}")
+    elif args.command == "info":
+        templates = GestureTemplates.load(args.path)
+        print(f"🖐️ {args.path}: {len(templates)} templates, {templates.window}-frame windows")
+        for label, count in templates.counts().items():
+            print(f"• {label}: {count}")
+    else:
+        benchmark_classifier(args.sizes, args.batch)
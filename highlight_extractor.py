@@ -0,0 +1,184 @@
+# save as: highlight_extractor.py
+import os
+import json
+import heapq
+import argparse
+from session_recorder import load_session
+
+
+class HighlightExtractor:
+    """Keeps the top-K non-overlapping high-score windows of a score stream in O(K) memory"""
+
+    def __init__(self, k=5, window_seconds=10.0, min_score=15.0, release_ratio=0.7):
+        self.k = k
+        self.window_seconds = window_seconds
+        self.min_score = min_score  # Scores below this never start a highlight
+        self.release_ratio = release_ratio  # A peak is over once the score falls this far below it
+        self.heap = []  # Min-heap of (score, peak_time, start, end)
+        self.best = None  # (score, time) of the peak being climbed
+        self.samples = 0
+        self.candidates = 0
+
+    def update(self, timestamp, score):
+        """Feed one (time, score) sample; constant work per sample"""
+        self.samples += 1
+        if self.best is None:
+            if score >= self.min_score:
+                self.best = (score, timestamp)
+            return
+        if score > self.best[0]:
+            self.best = (score, timestamp)
+        # Confirm the peak when the score has clearly dropped or its window is complete
+        elif score < self.best[0] * self.release_ratio or timestamp - self.best[1] >= self.window_seconds / 2:
+            self.offer(*self.best)
+            self.best = (score, timestamp) if score >= self.min_score else None
+
+    def offer(self, score, peak_time):
+        """Insert a peak, keeping only the best of any overlapping windows"""
+        self.candidates += 1
+        half = self.window_seconds / 2
+        candidate = (score, peak_time, peak_time - half, peak_time + half)
+        overlapping = [h for h in self.heap if h[2] < candidate[3] and candidate[2] < h[3]]
+        if any(h[0] >= score for h in overlapping):
+            return
+        if overlapping:
+            self.heap = [h for h in self.heap if h not in overlapping]
+            heapq.heapify(self.heap)
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, candidate)
+        elif score > self.heap[0][0]:
+            heapq.heapreplace(self.heap, candidate)
+
+    def finish(self):
+        """Flush a peak still in progress at the end of the stream"""
+        if self.best is not None:
+            self.offer(*self.best)
+            self.best = None
+        return self.highlights()
+
+    def highlights(self):
+        """Best first, as dicts"""
+        return [{'rank': rank + 1, 'score': round(float(score), 2), 'peak': round(peak, 3),
+                 'start': round(max(0.0, start), 3), 'end': round(end, 3)}
+                for rank, (score, peak, start, end) in enumerate(sorted(self.heap, reverse=True))]
+
+    def report_lines(self):
+        """Worst moments with their session time for the report"""
+        lines = []
+        for highlight in self.highlights():
+            minutes, seconds = divmod(highlight['peak'], 60)
+            lines.append(f"• #{highlight['rank']}: score {highlight['score']:.1f} at {int(minutes)}:{seconds:04.1f}")
+        return lines
+
+
+def scan_session(session_dir, extractor):
+    """Stream every sidecar record through the extractor (one record in memory at a time)"""
+    manifest = load_session(session_dir)
+    for segment in manifest['segments']:
+        with open(segment['sidecar']) as f:
+            for line in f:
+                record = json.loads(line)
+                extractor.update(record['t'], record.get('score', 0.0))
+    return extractor.finish()
+
+
+def locate_windows(manifest, highlights):
+    """Map each highlight's session-time window to a segment and local frame range, in one pass.
+
+    Clips stay inside the segment holding the peak; a window that runs into a neighbouring segment is
+    marked truncated, with clip_start/clip_end giving the session time the clip really covers.
+    """
+    segments = manifest['segments']
+    for highlight in highlights:
+        highlight['segment'] = None
+    for number, segment in enumerate(segments):
+        pending = [h for h in highlights if h['segment'] is None and segment['start'] <= h['peak'] <= segment['end']]
+        if not pending:
+            continue
+        with open(segment['sidecar']) as f:
+            for line in f:
+                record = json.loads(line)
+                for highlight in pending:
+                    if 'first_frame' not in highlight and record['t'] >= highlight['start']:
+                        highlight['first_frame'] = record['frame']
+                        highlight['clip_start'] = record['t']
+                    if record['t'] <= highlight['end']:
+                        highlight['last_frame'] = record['frame']
+                        highlight['clip_end'] = record['t']
+        for highlight in pending:
+            highlight['segment'] = number
+            highlight['truncated'] = (number > 0 and highlight['start'] < segment['start']) or \
+                (number < len(segments) - 1 and highlight['end'] > segment['end'])
+    return [h for h in highlights if h['segment'] is not None and 'first_frame' in h]
+
+
+def remux_clip(video_path, output_path, first_frame, last_frame, fps):
+    """Copy the packets for a frame range into a new file, starting at the keyframe before it (no re-encode)"""
+    import av
+    with av.open(video_path) as source:
+        stream = source.streams.video[0]
+        time_base = stream.time_base
+        start_pts = int(first_frame / fps / time_base)
+        end_pts = int(last_frame / fps / time_base)
+        source.seek(start_pts, stream=stream, backward=True, any_frame=False)
+        with av.open(output_path, 'w') as output:
+            out_stream = output.add_stream_from_template(stream)
+            offset = None
+            packets = 0
+            for packet in source.demux(stream):
+                if packet.pts is None:
+                    continue
+                if packet.pts > end_pts:
+                    break
+                if offset is None:
+                    offset = packet.pts
+                packet.pts -= offset
+                if packet.dts is not None:
+                    packet.dts -= offset
+                packet.stream = out_stream
+                output.mux(packet)
+                packets += 1
+    return packets
+
+
+def extract_highlights(session_dir, output_dir=None, k=5, window_seconds=10.0, min_score=15.0):
+    """Find the top-K awkward windows of a recording and cut each one into its own clip"""
+    output_dir = output_dir or os.path.join(session_dir, "highlights")
+    os.makedirs(output_dir, exist_ok=True)
+    extractor = HighlightExtractor(k, window_seconds, min_score)
+    highlights = scan_session(session_dir, extractor)
+    manifest = load_session(session_dir)
+
+    for highlight in locate_windows(manifest, highlights):
+        segment = manifest['segments'][highlight['segment']]
+        extension = os.path.splitext(segment['path'])[1]
+        clip_path = os.path.join(output_dir, f"highlight_{highlight['rank']:02d}{extension}")
+        highlight['packets'] = remux_clip(segment['path'], clip_path, highlight['first_frame'],
+                                          highlight['last_frame'], segment['fps'])
+        highlight['clip'] = os.path.basename(clip_path)
+
+    index = {'session': os.path.abspath(session_dir), 'window_seconds': window_seconds,
+             'samples': extractor.samples, 'highlights': highlights}
+    with open(os.path.join(output_dir, "highlights.json"), 'w') as f:
+        json.dump(index, f, indent=2)
+
+    print(f"🏆 {len(highlights)} highlights from {extractor.samples} frames -> {output_dir}")
+    for line in extractor.report_lines():
+        print(line)
+    for highlight in highlights:
+        if highlight.get('truncated'):
+            print(f"✂️ #{highlight['rank']} cut to its segment: {highlight['clip_start']:.1f}-"
+                  f"{highlight['clip_end']:.1f}s of {highlight['start']:.1f}-{highlight['end']:.1f}s")
+    return index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cut the most awkward moments out of a recorded session")
+    parser.add_argument("session_dir", help="Directory written by --record")
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("-k", type=int, default=5, help="How many highlights to keep")
+    parser.add_argument("--window", type=float, default=10.0, help="Clip length in seconds")
+    parser.add_argument("--min-score", type=float, default=15.0)
+    args = parser.parse_args()
+
+    extract_highlights(args.session_dir, args.output_dir, args.k, args.window, args.min_score)
@@ -0,0 +1,259 @@
+# save as: inference_backends.py
+import time
+import argparse
+from types import SimpleNamespace
+import cv2
+import numpy as np
+from model_profiles import DEFAULT_PROFILE, get_profile, build_face_detector, build_hands
+
+# FaceMesh points that stand in for the six FaceDetection keypoints
+# (right eye, left eye, nose tip, mouth center, right ear, left ear)
+MESH_KEYPOINTS = [(33, 133), (362, 263), (1,), (13, 14), (234,), (454,)]
+
+# Pose landmark indices
+NOSE, LEFT_EAR, RIGHT_EAR, LEFT_SHOULDER, RIGHT_SHOULDER = 0, 7, 8, 11, 12
+
+# What a model that isn't built reports
+NO_FACES = SimpleNamespace(detections=None)
+NO_HANDS = SimpleNamespace(multi_hand_landmarks=None)
+
+
+class FrameDetections:
+    """What one inference pass saw, in the shape the scoring and drawing code expects"""
+
+    def __init__(self, face_results, hand_results, pose_landmarks=None):
+        self.face_results = face_results  # .detections like FaceDetection output
+        self.hand_results = hand_results  # .multi_hand_landmarks like Hands output
+        self.pose_landmarks = pose_landmarks  # NormalizedLandmarkList or None
+
+    @property
+    def face_count(self):
+        return len(self.face_results.detections or [])
+
+    @property
+    def hand_count(self):
+        return len(self.hand_results.multi_hand_landmarks or [])
+
+    @property
+    def weakest_face_score(self):
+        """Lowest face detection confidence this pass, or None with no faces"""
+        scores = [detection.score[0] for detection in self.face_results.detections or [] if detection.score]
+        return min(scores) if scores else None
+
+
+class SeparateGraphsBackend:
+    """Face detection and hand tracking (plus optional pose) as independent graphs, each only if needed"""
+
+    name = "separate"
+
+    def __init__(self, mp, profile, enable_pose=False, enable_face=True, enable_hands=True):
+        self.mp = mp
+        self.profile = profile
+        self.face_detector = build_face_detector(mp, profile) if enable_face else None
+        self.hands = build_hands(mp, profile) if enable_hands else None
+        self.pose = None
+        if enable_pose:
+            self.pose = mp.solutions.pose.Pose(model_complexity=profile['hands_model_complexity'],
+                                               min_detection_confidence=0.5, min_tracking_confidence=0.5)
+
+    def process(self, rgb_frame):
+        face_results = self.face_detector.process(rgb_frame) if self.face_detector is not None else NO_FACES
+        hand_results = self.hands.process(rgb_frame) if self.hands is not None else NO_HANDS
+        pose_landmarks = self.pose.process(rgb_frame).pose_landmarks if self.pose is not None else None
+        return FrameDetections(face_results, hand_results, pose_landmarks)
+
+    def set_model_complexity(self, complexity):
+        """Rebuild the hand graph with a new model_complexity"""
+        if self.hands is None:
+            return
+        self.hands.close()
+        self.hands = build_hands(self.mp, dict(self.profile, hands_model_complexity=complexity))
+
+    def close(self):
+        if self.face_detector is not None:
+            self.face_detector.close()
+        if self.hands is not None:
+            self.hands.close()
+        if self.pose is not None:
+            self.pose.close()
+
+
+class HolisticBackend:
+    """One MediaPipe Holistic pass for face, both hands and pose"""
+
+    name = "holistic"
+
+    def __init__(self, mp, profile):
+        from mediapipe.framework.formats import detection_pb2, location_data_pb2
+        self.detection_pb2 = detection_pb2
+        self.location_data_pb2 = location_data_pb2
+        self.mp = mp
+        self.profile = profile
+        self.holistic = self.build(profile['hands_model_complexity'])
+
+    def build(self, complexity):
+        return self.mp.solutions.holistic.Holistic(
+            model_complexity=complexity,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+
+    def face_detection_from_mesh(self, face_landmarks):
+        """Turn a face mesh into a FaceDetection-style Detection so downstream code is unchanged"""
+        points = np.array([(lm.x, lm.y) for lm in face_landmarks.landmark], dtype=np.float32)
+        x_min, y_min = points.min(axis=0)
+        x_max, y_max = points.max(axis=0)
+
+        detection = self.detection_pb2.Detection()
+        detection.score.append(1.0)
+        location = detection.location_data
+        location.format = self.location_data_pb2.LocationData.RELATIVE_BOUNDING_BOX
+        box = location.relative_bounding_box
+        box.xmin, box.ymin = float(x_min), float(y_min)
+        box.width, box.height = float(x_max - x_min), float(y_max - y_min)
+        for indices in MESH_KEYPOINTS:
+            x, y = points[list(indices)].mean(axis=0)
+            keypoint = location.relative_keypoints.add()
+            keypoint.x, keypoint.y = float(x), float(y)
+        return detection
+
+    def process(self, rgb_frame):
+        results = self.holistic.process(rgb_frame)
+        detections = None
+        if results.face_landmarks is not None:
+            detections = [self.face_detection_from_mesh(results.face_landmarks)]
+        hands = [h for h in (results.left_hand_landmarks, results.right_hand_landmarks) if h is not None]
+        return FrameDetections(SimpleNamespace(detections=detections),
+                               SimpleNamespace(multi_hand_landmarks=hands or None),
+                               results.pose_landmarks)
+
+    def set_model_complexity(self, complexity):
+        """Rebuild the holistic graph with a new model_complexity"""
+        self.holistic.close()
+        self.holistic = self.build(complexity)
+
+    def close(self):
+        self.holistic.close()
+
+
+BACKENDS = {
+    'separate': SeparateGraphsBackend,
+    'holistic': HolisticBackend
+}
+
+
+def build_backend(mp, profile, name='separate', enable_pose=False, enable_face=True, enable_hands=True):
+    """Create an inference backend by name (Holistic always runs everything in its one graph)"""
+    if name == 'holistic':
+        return HolisticBackend(mp, profile)
+    if name == 'separate':
+        return SeparateGraphsBackend(mp, profile, enable_pose=enable_pose, enable_face=enable_face,
+                                     enable_hands=enable_hands)
+    raise ValueError(f"Unknown backend '{name}' (choose from {', '.join(BACKENDS)})")
+
+
+class PostureMonitor:
+    """Slouching and shoulder tension from pose landmarks, relative to the person's own baseline"""
+
+    def __init__(self, calibration_frames=60, slouch_ratio=0.8, tension_ratio=0.75, min_visibility=0.5):
+        self.calibration_frames = calibration_frames
+        self.slouch_ratio = slouch_ratio
+        self.tension_ratio = tension_ratio
+        self.min_visibility = min_visibility
+        self.samples = 0
+        self.baseline_neck = None
+        self.baseline_ears = None
+        self.slouching = False
+        self.shoulders_tense = False
+
+    def update(self, pose_landmarks):
+        """Update posture flags from this frame's pose (None leaves them off)"""
+        self.slouching = False
+        self.shoulders_tense = False
+        if pose_landmarks is None:
+            return self
+
+        lm = pose_landmarks.landmark
+        needed = (NOSE, LEFT_EAR, RIGHT_EAR, LEFT_SHOULDER, RIGHT_SHOULDER)
+        if min(lm[i].visibility for i in needed) < self.min_visibility:
+            return self
+
+        shoulder_width = abs(lm[LEFT_SHOULDER].x - lm[RIGHT_SHOULDER].x)
+        if shoulder_width < 1e-3:
+            return self
+        shoulder_y = (lm[LEFT_SHOULDER].y + lm[RIGHT_SHOULDER].y) / 2
+        ear_y = (lm[LEFT_EAR].y + lm[RIGHT_EAR].y) / 2
+        # Head drops toward the shoulders when slouching; shoulders creep up to the ears when tense
+        neck = (shoulder_y - lm[NOSE].y) / shoulder_width
+        ears = (shoulder_y - ear_y) / shoulder_width
+
+        if self.samples < self.calibration_frames:
+            self.samples += 1
+            if self.baseline_neck is None:
+                self.baseline_neck, self.baseline_ears = neck, ears
+            else:
+                self.baseline_neck += (neck - self.baseline_neck) / self.samples
+                self.baseline_ears += (ears - self.baseline_ears) / self.samples
+            return self
+
+        self.slouching = neck < self.baseline_neck * self.slouch_ratio
+        self.shoulders_tense = ears < self.baseline_ears * self.tension_ratio
+        return self
+
+
+def benchmark_backends(source_spec="synthetic:300", max_frames=300, profile=DEFAULT_PROFILE):
+    """Compare latency and detection rate of separate graphs vs a single Holistic pass"""
+    import mediapipe as mp
+    from frame_sources import open_source
+
+    # Decode once up front so only inference is timed
+    source = open_source(source_spec, prefetch=False)
+    frames = []
+    for frame in source:
+        frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        if len(frames) >= max_frames:
+            break
+    source.release()
+    if not frames:
+        print("❌ No frames to benchmark")
+        return {}
+
+    profile = get_profile(profile)
+    candidates = [
+        ("face+hands", lambda: SeparateGraphsBackend(mp, profile)),
+        ("face+hands+pose", lambda: SeparateGraphsBackend(mp, profile, enable_pose=True)),
+        ("holistic", lambda: HolisticBackend(mp, profile))
+    ]
+
+    print(f"📊 Backend Benchmark ({len(frames)} frames)")
+    print(f"{'pipeline':<16} {'ms/frame':>9} {'face':>7} {'hands':>7} {'pose':>7}")
+    results = {}
+    for name, factory in candidates:
+        backend = factory()
+        backend.process(frames[0])  # Warm-up
+        faces = hands = poses = 0
+        start = time.perf_counter()
+        for rgb_frame in frames:
+            detections = backend.process(rgb_frame)
+            faces += detections.face_count > 0
+            hands += detections.hand_count
+            poses += detections.pose_landmarks is not None
+        elapsed = time.perf_counter() - start
+        backend.close()
+
+        n = len(frames)
+        results[name] = {'ms_per_frame': 1000 * elapsed / n, 'face_rate': faces / n,
+                         'hands_per_frame': hands / n, 'pose_rate': poses / n}
+        print(f"{name:<16} {1000 * elapsed / n:>9.1f} {100 * faces / n:>6.1f}% "
+              f"{hands / n:>7.2f} {100 * poses / n:>6.1f}%")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare separate graphs with a single Holistic pass")
+    parser.add_argument("--source", default="synthetic:300", help="Frame source to benchmark on")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--profile", default=DEFAULT_PROFILE)
+    args = parser.parse_args()
+
+    benchmark_backends(args.source, args.frames, args.profile)
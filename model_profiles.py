@@ -0,0 +1,123 @@
+# save as: model_profiles.py
+import time
+import argparse
+import cv2
+
+# Named speed/accuracy trade-offs for weaker kiosks vs beefy laptops.
+# balanced matches the settings the detectors always used.
+PROFILES = {
+    'lite': {
+        'description': "Short-range face model, light hand model, one hand, 320px, every 2nd frame",
+        'face_model_selection': 0,
+        'hands_model_complexity': 0,
+        'max_num_hands': 1,
+        'inference_width': 320,
+        'detection_stride': 2
+    },
+    'balanced': {
+        'description': "Default models at full camera resolution on every frame",
+        'face_model_selection': 0,
+        'hands_model_complexity': 1,
+        'max_num_hands': 2,
+        'inference_width': None,
+        'detection_stride': 1
+    },
+    'accurate': {
+        'description': "Full-range face model, full hand model, full resolution on every frame",
+        'face_model_selection': 1,
+        'hands_model_complexity': 1,
+        'max_num_hands': 2,
+        'inference_width': None,
+        'detection_stride': 1
+    }
+}
+
+DEFAULT_PROFILE = 'balanced'
+
+
+def get_profile(name):
+    """Look up a profile by name"""
+    if name not in PROFILES:
+        raise ValueError(f"Unknown profile '{name}' (choose from {', '.join(PROFILES)})")
+    return dict(PROFILES[name], name=name)
+
+
+def build_face_detector(mp, profile):
+    """Create the MediaPipe face detector for a profile"""
+    return mp.solutions.face_detection.FaceDetection(
+        model_selection=profile['face_model_selection'],
+        min_detection_confidence=0.5
+    )
+
+
+def build_hands(mp, profile):
+    """Create the MediaPipe hand tracker for a profile"""
+    return mp.solutions.hands.Hands(
+        model_complexity=profile['hands_model_complexity'],
+        min_detection_confidence=0.7,
+        min_tracking_confidence=0.5,
+        max_num_hands=profile['max_num_hands']
+    )
+
+
+def resize_for_inference(frame, inference_width):
+    """Shrink a frame to the profile's inference width (landmarks stay normalized)"""
+    h, w = frame.shape[:2]
+    if not inference_width or w <= inference_width:
+        return frame
+    scale = inference_width / w
+    return cv2.resize(frame, (inference_width, int(round(h * scale))), interpolation=cv2.INTER_AREA)
+
+
+def trace_clip(video_path, profile_name):
+    """Run the detector with a profile over a clip and record what it saw per frame"""
+    from final_awkwardness_detector import UltimateAwkwardnessDetector
+    from frame_sources import open_source
+
+    detector = UltimateAwkwardnessDetector(enable_memes=False, enable_audio=False,
+                                           enable_motion_gate=False, profile=profile_name)
+    source = open_source(video_path)
+    trace = []
+    elapsed = 0.0
+    for frame in source:
+        start = time.perf_counter()
+        detector.process_frame(frame)
+        elapsed += time.perf_counter() - start
+
+        detections = detector.last_results
+        trace.append((detections.face_count > 0, detections.hand_count, detector.awkwardness_score))
+    source.release()
+    return trace, elapsed
+
+
+def benchmark_profiles(video_path):
+    """Print FPS for every profile against agreement with the accurate profile"""
+    results = {}
+    for name in PROFILES:
+        print(f"⏱️ Running profile '{name}'...")
+        results[name] = trace_clip(video_path, name)
+
+    reference, _ = results['accurate']
+    if not reference:
+        print("❌ Could not read any frames from the clip")
+        return results
+
+    print("\n📊 Profile Report (agreement vs 'accurate')")
+    print(f"{'profile':<10} {'fps':>7} {'ms/frame':>9} {'face':>7} {'hands':>7} {'score err':>10}")
+    for name, (trace, elapsed) in results.items():
+        frames = min(len(trace), len(reference))
+        face_agree = sum(trace[i][0] == reference[i][0] for i in range(frames)) / frames
+        hand_agree = sum(trace[i][1] == reference[i][1] for i in range(frames)) / frames
+        score_err = sum(abs(trace[i][2] - reference[i][2]) for i in range(frames)) / frames
+        fps = len(trace) / max(elapsed, 1e-9)
+        print(f"{name:<10} {fps:>7.1f} {1000 / max(fps, 1e-9):>9.1f} "
+              f"{100 * face_agree:>6.1f}% {100 * hand_agree:>6.1f}% {score_err:>10.2f}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare model profiles on a reference clip")
+    parser.add_argument("video", help="Path to a reference clip (or 'synthetic')")
+    args = parser.parse_args()
+
+    benchmark_profiles(args.video)
@@ -0,0 +1,192 @@
+# save as: motion_gate.py
+import time
+import argparse
+import cv2
+import numpy as np
+
+# The face detector keeps faces above 0.5; one scoring under this can vanish on sensor noise alone
+MARGINAL_FACE_SCORE = 0.7
+
+
+class MotionGate:
+    """Cheap frame-difference gate that decides when inference is worth running"""
+
+    def __init__(self, thumb_size=(32, 24), sensitivity=3.0, min_threshold=1.5, max_noise=1.0,
+                 refresh_interval=15, noise_adapt_rate=0.05, block_size=4, settle_runs=30):
+        # Tiny grayscale thumbnail keeps the difference check well under a millisecond
+        self.thumb_size = thumb_size
+        self.sensitivity = sensitivity
+        self.min_threshold = min_threshold
+        self.refresh_interval = refresh_interval
+        self.noise_adapt_rate = noise_adapt_rate
+        self.max_noise = max_noise  # Ceiling on the noise estimate, so the threshold can't run away
+        self.block_size = block_size  # Thumbnail pixels per block side; the busiest block decides
+        self.settle_runs = settle_runs  # Inferences that must agree, confidently, before frames may be skipped
+        self.recent_results = []  # (result, marginal) for the last settle_runs inferences
+
+        self.reference_thumb = None
+        self.previous_thumb = None
+        self.previous_ran = False
+        self.noise_level = min_threshold / sensitivity
+        self.frames_since_refresh = 0
+        self.last_difference = 0.0
+
+        self.stats = {
+            'frames': 0,
+            'skipped': 0,
+            'forced_refreshes': 0,
+            'unsettled_runs': 0,
+            'inference_runs': 0,
+            'inference_time': 0.0,
+            'gate_time': 0.0
+        }
+
+    def make_thumbnail(self, frame):
+        """Downscale a BGR frame to a small grayscale thumbnail"""
+        small = cv2.resize(frame, self.thumb_size, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY).astype(np.float32)
+
+    @property
+    def threshold(self):
+        """Current adaptive motion threshold (mean absolute grey-level difference in the busiest block)"""
+        return max(self.min_threshold, self.noise_level * self.sensitivity)
+
+    def block_differences(self, thumb, other):
+        """Mean absolute difference of each block of the thumbnail"""
+        diff = np.abs(thumb - other)
+        h, w = diff.shape
+        b = self.block_size
+        return diff[:h - h % b, :w - w % b].reshape(h // b, b, w // b, b).mean(axis=(1, 3))
+
+    @property
+    def settled(self):
+        """The last few inferences saw the same thing, confidently, so reusing their results is safe"""
+        if len(self.recent_results) < self.settle_runs:
+            return False
+        first = self.recent_results[0][0]
+        return all(result == first and not marginal for result, marginal in self.recent_results)
+
+    def should_run(self, frame):
+        """Return True when the scene moved enough (or the refresh interval expired)"""
+        start = time.perf_counter()
+        self.stats['frames'] += 1
+        thumb = self.make_thumbnail(frame)
+
+        if self.reference_thumb is None:
+            run = True
+        else:
+            # Compare against the frame inference last ran on, so slow drift still adds up; the busiest
+            # block decides, so a small moving hand isn't averaged away by a static scene
+            self.last_difference = float(self.block_differences(thumb, self.reference_thumb).max())
+            moving = self.last_difference > self.threshold
+            if self.previous_ran:
+                # Noise is learned from one-frame gaps right after an inference, never from drift that built
+                # up against an older reference; the median block ignores whatever part of the scene moved
+                step = float(np.median(self.block_differences(thumb, self.previous_thumb)))
+                self.noise_level += self.noise_adapt_rate * (step - self.noise_level)
+                self.noise_level = min(self.noise_level, self.max_noise)
+            run = moving
+            if not run and not self.settled:
+                # Detections are flipping between runs, or barely held; don't freeze one of them
+                run = True
+                self.stats['unsettled_runs'] += 1
+            if not run and self.frames_since_refresh + 1 >= self.refresh_interval:
+                run = True
+                self.stats['forced_refreshes'] += 1
+
+        self.previous_thumb = thumb
+        self.previous_ran = run
+        if run:
+            self.reference_thumb = thumb
+            self.frames_since_refresh = 0
+        else:
+            self.frames_since_refresh += 1
+            self.stats['skipped'] += 1
+
+        self.stats['gate_time'] += time.perf_counter() - start
+        return run
+
+    def record_inference(self, seconds, result=None, marginal=False):
+        """Remember how long a full inference pass took, what it saw (e.g. face and hand counts), and
+        whether any detection sat close enough to its threshold that the next frame could flip it"""
+        self.recent_results = (self.recent_results + [(result, marginal)])[-self.settle_runs:]
+        self.stats['inference_runs'] += 1
+        self.stats['inference_time'] += seconds
+
+    def summary(self):
+        """Skip rate and estimated CPU time saved by the gate"""
+        frames = max(1, self.stats['frames'])
+        runs = max(1, self.stats['inference_runs'])
+        avg_inference = self.stats['inference_time'] / runs
+        saved = self.stats['skipped'] * avg_inference - self.stats['gate_time']
+        return {
+            'frames': self.stats['frames'],
+            'skipped': self.stats['skipped'],
+            'skip_rate': self.stats['skipped'] / frames,
+            'forced_refreshes': self.stats['forced_refreshes'],
+            'unsettled_runs': self.stats['unsettled_runs'],
+            'avg_inference_ms': avg_inference * 1000,
+            'avg_gate_ms': self.stats['gate_time'] / frames * 1000,
+            'cpu_saved_s': max(0.0, saved)
+        }
+
+    def report_lines(self):
+        """Human-readable lines for the session report"""
+        summary = self.summary()
+        return [
+            f"• Motion Gate Skip Rate: {100 * summary['skip_rate']:.1f}% "
+            f"({summary['skipped']}/{summary['frames']} frames)",
+            f"• Inference CPU Saved: {summary['cpu_saved_s']:.1f}s "
+            f"(avg inference {summary['avg_inference_ms']:.1f}ms, gate {summary['avg_gate_ms']:.2f}ms)"
+        ]
+
+
+def score_clip(video_path, enable_motion_gate):
+    """Run the final detector over a clip (or any frame source spec) and return its per-frame scores"""
+    from final_awkwardness_detector import UltimateAwkwardnessDetector
+    from frame_sources import open_source
+
+    detector = UltimateAwkwardnessDetector(enable_memes=False, enable_audio=False,
+                                           enable_motion_gate=enable_motion_gate)
+    source = open_source(video_path)
+    scores = []
+    start = time.perf_counter()
+    for frame in source:
+        # Source time, so the gated and ungated runs see the same clock
+        detector.process_frame(frame, source.timestamp)
+        scores.append(detector.awkwardness_score)
+    source.release()
+    return np.array(scores), time.perf_counter() - start, detector
+
+
+def compare_gated_run(video_path, tolerance=2.0):
+    """Check that gating a recorded clip keeps the score within tolerance of the ungated run"""
+    baseline, baseline_time, _ = score_clip(video_path, enable_motion_gate=False)
+    gated, gated_time, detector = score_clip(video_path, enable_motion_gate=True)
+
+    if len(baseline) == 0:
+        print("❌ Could not read any frames from the clip")
+        return False
+
+    max_error = float(np.max(np.abs(baseline - gated)))
+    mean_error = float(np.mean(np.abs(baseline - gated)))
+    passed = max_error <= tolerance
+
+    print("⚡ Motion Gate Comparison")
+    print(f"Frames: {len(baseline)}")
+    for line in detector.motion_gate.report_lines():
+        print(line)
+    print(f"Ungated: {baseline_time:.2f}s, gated: {gated_time:.2f}s "
+          f"({baseline_time / max(gated_time, 1e-9):.2f}x)")
+    print(f"Score error: max {max_error:.2f}, mean {mean_error:.2f} (tolerance {tolerance})")
+    print("✅ Scores match" if passed else "❌ Scores drifted beyond tolerance")
+    return passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare gated and ungated scoring on a recorded clip")
+    parser.add_argument("video", help="Path to a recorded session clip (or 'synthetic')")
+    parser.add_argument("--tolerance", type=float, default=2.0, help="Maximum allowed score difference")
+    args = parser.parse_args()
+
+    raise SystemExit(0 if compare_gated_run(args.video, args.tolerance) else 1)
@@ -0,0 +1,248 @@
+# save as: person_tracker.py
+import cv2
+import numpy as np
+from event_segmenter import BehaviorEvents
+
+TRACK_COLORS = [(255, 128, 0), (0, 200, 255), (200, 0, 255), (0, 255, 128), (255, 0, 128), (128, 255, 0)]
+
+
+def face_boxes(face_results):
+    """Face detections as an (N, 4) array of normalized x1, y1, x2, y2"""
+    detections = face_results.detections or []
+    boxes = np.zeros((len(detections), 4), dtype=np.float32)
+    for i, detection in enumerate(detections):
+        box = detection.location_data.relative_bounding_box
+        boxes[i] = (box.xmin, box.ymin, box.xmin + box.width, box.ymin + box.height)
+    return boxes
+
+
+def hand_points(hand_results):
+    """Hand centroids and index fingertips as two (M, 2) arrays of normalized x, y"""
+    hands = hand_results.multi_hand_landmarks or []
+    centroids = np.zeros((len(hands), 2), dtype=np.float32)
+    tips = np.zeros((len(hands), 2), dtype=np.float32)
+    for i, hand_landmarks in enumerate(hands):
+        points = np.array([(lm.x, lm.y) for lm in hand_landmarks.landmark], dtype=np.float32)
+        centroids[i] = points.mean(axis=0)
+        tips[i] = points[8]  # Index finger tip
+    return centroids, tips
+
+
+def iou_matrix(boxes_a, boxes_b):
+    """Pairwise intersection-over-union between two sets of boxes"""
+    if len(boxes_a) == 0 or len(boxes_b) == 0:
+        return np.zeros((len(boxes_a), len(boxes_b)), dtype=np.float32)
+    a = boxes_a[:, None, :]
+    b = boxes_b[None, :, :]
+    inter_w = np.clip(np.minimum(a[..., 2], b[..., 2]) - np.maximum(a[..., 0], b[..., 0]), 0, None)
+    inter_h = np.clip(np.minimum(a[..., 3], b[..., 3]) - np.maximum(a[..., 1], b[..., 1]), 0, None)
+    inter = inter_w * inter_h
+    area_a = (a[..., 2] - a[..., 0]) * (a[..., 3] - a[..., 1])
+    area_b = (b[..., 2] - b[..., 0]) * (b[..., 3] - b[..., 1])
+    return inter / np.maximum(area_a + area_b - inter, 1e-9)
+
+
+def linear_assignment(cost):
+    """Minimum-cost matching (Hungarian algorithm); returns matched row and column indices"""
+    cost = np.asarray(cost, dtype=np.float64)
+    if cost.size == 0:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    n, m = cost.shape
+
+    # Shortest augmenting path with row/column potentials, 1-based with a dummy column 0
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    p = np.zeros(m + 1, dtype=int)
+    way = np.zeros(m + 1, dtype=int)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            free = ~used[1:]
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            improve = free & (reduced < minv[1:])
+            minv[1:][improve] = reduced[improve]
+            way[1:][improve] = j0
+            candidates = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+            used_columns = np.nonzero(used)[0]
+            u[p[used_columns]] += delta
+            v[used_columns] -= delta
+            minv[1:][free] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    columns = np.nonzero(p[1:])[0]
+    rows = p[1:][columns] - 1
+    order = np.argsort(rows)
+    rows, columns = rows[order], columns[order]
+    if transposed:
+        rows, columns = columns, rows
+        order = np.argsort(rows)
+        rows, columns = rows[order], columns[order]
+    return rows, columns
+
+
+class PersonTrack:
+    """One person in the frame with their own score and stats"""
+
+    def __init__(self, track_id, box):
+        self.track_id = track_id
+        self.box = box
+        self.visible = True
+        self.hits = 1
+        self.misses = 0
+        self.awkwardness_score = 0
+        self.hand_count = 0
+        self.events = BehaviorEvents()
+        self.stats = {
+            'frames_seen': 0,
+            'face_touches': 0,
+            'eye_contact_breaks': 0,
+            'awkward_frames': 0,
+            'peak_awkwardness': 0
+        }
+
+    @property
+    def color(self):
+        return TRACK_COLORS[(self.track_id - 1) % len(TRACK_COLORS)]
+
+
+class PersonTracker:
+    """Keeps stable IDs on faces across frames and scores each person separately"""
+
+    def __init__(self, iou_threshold=0.3, max_missed=90, touch_margin=0.5, min_hits=15, max_retired=100):
+        self.iou_threshold = iou_threshold
+        self.max_missed = max_missed  # Frames a face may vanish before the person is forgotten
+        self.touch_margin = touch_margin  # Face box growth that still counts as touching the face
+        self.min_hits = min_hits  # Frames matched before a track counts as a real person
+        self.max_retired = max_retired  # Departed people kept for the report, most recent last
+        self.tracks = []
+        self.retired = []
+        self.next_id = 1
+        self.detection_ids = []  # Track id of each face detection in the last update, in detection order
+
+    def update(self, face_results, hand_results, timestamp=0.0):
+        """Match this frame's faces to tracks, assign hands, and update per-person scores"""
+        boxes = face_boxes(face_results)
+        track_boxes = np.array([t.box for t in self.tracks], dtype=np.float32).reshape(-1, 4)
+
+        # Match existing tracks to faces on IoU
+        ious = iou_matrix(track_boxes, boxes)
+        rows, columns = linear_assignment(1.0 - ious)
+        keep = ious[rows, columns] >= self.iou_threshold if len(rows) else np.zeros(0, dtype=bool)
+        rows, columns = rows[keep], columns[keep]
+
+        for track in self.tracks:
+            track.visible = False
+        self.detection_ids = [None] * len(boxes)
+        for row, column in zip(rows, columns):
+            track = self.tracks[row]
+            self.detection_ids[column] = track.track_id
+            track.box = boxes[column]
+            track.visible = True
+            track.hits += 1
+            track.misses = 0
+
+        unmatched = np.setdiff1d(np.arange(len(boxes)), columns)
+        for column in unmatched:
+            self.detection_ids[column] = self.next_id
+            self.tracks.append(PersonTrack(self.next_id, boxes[column]))
+            self.next_id += 1
+
+        for track in self.tracks:
+            if not track.visible:
+                track.misses += 1
+        # One-off false detections are forgotten outright; real people are kept for the report, up to a cap
+        self.retired += [t for t in self.tracks if t.misses > self.max_missed and t.hits >= self.min_hits]
+        if len(self.retired) > self.max_retired:
+            del self.retired[:len(self.retired) - self.max_retired]
+        self.tracks = [t for t in self.tracks if t.misses <= self.max_missed]
+
+        self.score_people(hand_results, timestamp)
+        return self.tracks
+
+    def assign_hands(self, centroids):
+        """Index of the nearest tracked person for each hand (-1 when nobody is tracked)"""
+        if not self.tracks or len(centroids) == 0:
+            return np.full(len(centroids), -1, dtype=int)
+        boxes = np.array([t.box for t in self.tracks], dtype=np.float32)
+        centers = (boxes[:, :2] + boxes[:, 2:]) / 2
+        distances = np.linalg.norm(centroids[:, None, :] - centers[None, :, :], axis=2)
+        # People whose face is missing only get a hand when nobody visible is closer
+        visible = np.array([t.visible for t in self.tracks])
+        distances[:, ~visible] += 1.0
+        return np.argmin(distances, axis=1)
+
+    def score_people(self, hand_results, timestamp):
+        """Apply the frame scoring rules to each person on their own"""
+        centroids, tips = hand_points(hand_results)
+        owners = self.assign_hands(centroids)
+
+        frame_awkwardness = np.zeros(len(self.tracks))
+        touches = np.zeros(len(self.tracks), dtype=int)
+        hand_counts = np.bincount(owners[owners >= 0], minlength=len(self.tracks))
+
+        if len(tips) and self.tracks:
+            boxes = np.array([t.box for t in self.tracks], dtype=np.float32)
+            size = boxes[:, 2:] - boxes[:, :2]
+            grown = np.concatenate([boxes[:, :2] - size * self.touch_margin / 2,
+                                    boxes[:, 2:] + size * self.touch_margin / 2], axis=1)
+            owned = owners >= 0
+            owner_boxes = grown[owners[owned]]
+            owner_tips = tips[owned]
+            touching = np.all((owner_tips >= owner_boxes[:, :2]) & (owner_tips <= owner_boxes[:, 2:]), axis=1)
+            np.add.at(touches, owners[owned], touching.astype(int))
+            np.add.at(frame_awkwardness, owners[owned], np.where(touching, 4, 1))
+
+        for i, track in enumerate(self.tracks):
+            track.hand_count = int(hand_counts[i])
+            track.stats['frames_seen'] += 1
+            if not track.visible:
+                frame_awkwardness[i] += 3
+            track.events.update({'eye_contact_break': int(not track.visible), 'face_touch': int(touches[i])},
+                                timestamp)
+            track.stats['eye_contact_breaks'] = track.events.count('eye_contact_break')
+            track.stats['face_touches'] = track.events.count('face_touch')
+
+            track.awkwardness_score = max(0, track.awkwardness_score + frame_awkwardness[i] * 0.5 - 0.2)
+            track.stats['peak_awkwardness'] = max(track.stats['peak_awkwardness'], track.awkwardness_score)
+            if frame_awkwardness[i] > 2:
+                track.stats['awkward_frames'] += 1
+
+    def draw(self, frame):
+        """Draw each tracked face with its ID and personal score"""
+        h, w, _ = frame.shape
+        for track in self.tracks:
+            if not track.visible:
+                continue
+            x1, y1, x2, y2 = (track.box * np.array([w, h, w, h])).astype(int)
+            cv2.rectangle(frame, (x1, y1), (x2, y2), track.color, 2)
+            cv2.putText(frame, f"P{track.track_id}: {track.awkwardness_score:.1f}", (x1, max(15, y1 - 8)),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, track.color, 2)
+        return frame
+
+    def report_lines(self):
+        """Per-person lines for the session report"""
+        people = sorted(self.tracks + self.retired, key=lambda t: t.track_id)
+        people = [t for t in people if t.hits >= self.min_hits]  # Ignore one-off false detections
+        lines = []
+        for track in people:
+            stats = track.stats
+            lines.append(f"• Person {track.track_id}: peak {stats['peak_awkwardness']:.1f}, "
+                         f"face touches {stats['face_touches']}, eye contact breaks {stats['eye_contact_breaks']}, "
+                         f"awkward frames {stats['awkward_frames']}/{stats['frames_seen']}")
+        return lines
@@ -0,0 +1,253 @@
+# save as: preview_server.py
+import time
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import cv2
+
+BOUNDARY = b"awkwardframe"
+
+INDEX_PAGE = b"""<!doctype html>
+<html><head><title>Awkwardness Preview</title></head>
+<body style="margin:0;background:#111;display:flex;justify-content:center">
+<img src="/stream" style="max-width:100%">
+</body></html>"""
+
+
+class PreviewHandler(BaseHTTPRequestHandler):
+    """/ shows the page, /stream is MJPEG, /snapshot.jpg is the latest frame"""
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        preview = self.server.preview
+        if path == '/':
+            self.send_bytes(INDEX_PAGE, 'text/html')
+        elif path == '/snapshot.jpg':
+            # Counts as a viewer for a moment so a fresh frame gets encoded
+            preview.viewer_joined()
+            _, jpeg = preview.wait_for_frame(preview.sequence, timeout=2.0)
+            preview.viewer_left()
+            jpeg = jpeg or preview.jpeg
+            if jpeg is None:
+                self.send_error(503, "No frames yet")
+            else:
+                self.send_bytes(jpeg, 'image/jpeg')
+        elif path == '/stream':
+            self.stream(preview)
+        else:
+            self.send_error(404)
+
+    def send_bytes(self, body, content_type):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream(self, preview):
+        self.send_response(200)
+        self.send_header('Content-Type', f"multipart/x-mixed-replace; boundary={BOUNDARY.decode()}")
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        preview.viewer_joined()
+        sequence = 0
+        try:
+            while preview.running:
+                latest, jpeg = preview.wait_for_frame(sequence, timeout=1.0)
+                if jpeg is None:
+                    continue
+                # A slow viewer just gets the newest frame; everything in between is skipped
+                preview.record_sent(len(jpeg), latest - sequence - 1 if sequence else 0)
+                sequence = latest
+                self.wfile.write(b"--" + BOUNDARY + b"\r\nContent-Type: image/jpeg\r\n"
+                                 b"Content-Length: " + str(len(jpeg)).encode() + b"\r\n\r\n" + jpeg + b"\r\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            preview.viewer_left()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class PreviewServer:
+    """Encodes annotated frames to JPEG once, on its own thread, and serves the bytes to every viewer"""
+
+    def __init__(self, port=8080, host="127.0.0.1", max_fps=10.0, max_width=640, quality=70):
+        self.max_fps = max_fps
+        self.max_width = max_width
+        self.quality = quality
+
+        self.condition = threading.Condition()
+        self.pending = None  # Latest frame handed over by the video loop (replaced, never queued)
+        self.jpeg = None
+        self.sequence = 0
+        self.viewers = 0
+        self.running = False
+        self.encoder = None
+
+        self.stats = {
+            'submitted': 0,
+            'encoded': 0,
+            'encode_time': 0.0,
+            'bytes_sent': 0,
+            'frames_sent': 0,
+            'skipped': 0,
+            'peak_viewers': 0
+        }
+
+        self.http = ThreadingHTTPServer((host, port), PreviewHandler)
+        self.http.daemon_threads = True
+        self.http.preview = self
+        self.url = f"http://{host}:{self.http.server_address[1]}/"
+
+    def start(self):
+        self.running = True
+        self.encoder = threading.Thread(target=self.encode_loop, name="preview-encoder", daemon=True)
+        self.encoder.start()
+        threading.Thread(target=self.http.serve_forever, name="preview-http", daemon=True).start()
+        print(f"📺 Preview: {self.url}")
+        return self
+
+    def submit(self, frame):
+        """Offer the latest annotated frame; costs nothing when nobody is watching"""
+        self.stats['submitted'] += 1
+        if self.viewers == 0 and self.jpeg is not None:
+            return
+        with self.condition:
+            self.pending = frame
+            self.condition.notify_all()
+
+    def encode_loop(self):
+        """Encoder thread: at most max_fps JPEGs, each shared by all viewers"""
+        interval = 1.0 / self.max_fps
+        last_encode = 0.0
+        while self.running:
+            with self.condition:
+                while self.pending is None and self.running:
+                    self.condition.wait(0.5)
+                frame, self.pending = self.pending, None
+            if frame is None:
+                continue
+
+            wait = last_encode + interval - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+                # A newer frame may have arrived while we waited
+                with self.condition:
+                    if self.pending is not None:
+                        frame, self.pending = self.pending, None
+            last_encode = time.perf_counter()
+
+            h, w = frame.shape[:2]
+            if w > self.max_width:
+                frame = cv2.resize(frame, (self.max_width, int(h * self.max_width / w)),
+                                   interpolation=cv2.INTER_AREA)
+            ok, encoded = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, self.quality])
+            if not ok:
+                continue
+            with self.condition:
+                self.jpeg = encoded.tobytes()
+                self.sequence += 1
+                self.stats['encoded'] += 1
+                self.stats['encode_time'] += time.perf_counter() - last_encode
+                self.condition.notify_all()
+
+    def wait_for_frame(self, after_sequence, timeout=1.0):
+        """Block a viewer until there's a frame newer than the one it has"""
+        with self.condition:
+            if self.sequence <= after_sequence or self.jpeg is None:
+                self.condition.wait_for(lambda: self.sequence > after_sequence and self.jpeg is not None
+                                        or not self.running, timeout)
+            if self.sequence <= after_sequence or self.jpeg is None:
+                return after_sequence, None
+            return self.sequence, self.jpeg
+
+    def viewer_joined(self):
+        with self.condition:
+            self.viewers += 1
+            self.stats['peak_viewers'] = max(self.stats['peak_viewers'], self.viewers)
+
+    def viewer_left(self):
+        with self.condition:
+            self.viewers -= 1
+
+    def record_sent(self, size, skipped):
+        with self.condition:
+            self.stats['bytes_sent'] += size
+            self.stats['frames_sent'] += 1
+            self.stats['skipped'] += skipped
+
+    def stop(self):
+        self.running = False
+        with self.condition:
+            self.condition.notify_all()
+        self.encoder.join(timeout=1.0)
+        self.http.shutdown()
+        self.http.server_close()
+
+    def report_lines(self):
+        """Encode cost and fan-out for the session report"""
+        encoded = max(1, self.stats['encoded'])
+        return [
+            f"• Preview: {self.stats['encoded']}/{self.stats['submitted']} frames encoded "
+            f"({1000 * self.stats['encode_time'] / encoded:.1f}ms each), {self.stats['frames_sent']} sent "
+            f"to up to {self.stats['peak_viewers']} viewers ({self.stats['skipped']} skipped by slow viewers, "
+            f"{self.stats['bytes_sent'] / 1e6:.1f}MB)"
+        ]
+
+
+def benchmark_fanout(viewer_counts=(0, 1, 4, 16), seconds=3.0, source_spec="synthetic:30"):
+    """Encoder and server CPU time as viewers are added (viewers are in-process, so they count too)"""
+    import resource
+    from urllib.request import urlopen
+    from frame_sources import open_source
+
+    # Decode up front so only the preview path is measured
+    source = open_source(source_spec, prefetch=False)
+    frames = list(source)
+    source.release()
+
+    print(f"📊 Preview Fan-out ({seconds:.0f}s per run)")
+    print(f"{'viewers':>8} {'encoded':>8} {'sent':>8} {'cpu %':>7}")
+    results = {}
+    for viewers in viewer_counts:
+        preview = PreviewServer(port=0).start()
+        stop = threading.Event()
+
+        def watch():
+            stream = urlopen(preview.url + "stream")
+            while not stop.is_set():
+                stream.read(65536)
+
+        threads = [threading.Thread(target=watch, daemon=True) for _ in range(viewers)]
+        for thread in threads:
+            thread.start()
+
+        start_cpu = resource.getrusage(resource.RUSAGE_SELF)
+        start = time.perf_counter()
+        index = 0
+        while time.perf_counter() - start < seconds:
+            preview.submit(frames[index % len(frames)])
+            index += 1
+            time.sleep(1 / 30)
+        end_cpu = resource.getrusage(resource.RUSAGE_SELF)
+        stop.set()
+        preview.stop()
+
+        cpu = (end_cpu.ru_utime + end_cpu.ru_stime) - (start_cpu.ru_utime + start_cpu.ru_stime)
+        results[viewers] = {'encoded': preview.stats['encoded'], 'sent': preview.stats['frames_sent'],
+                            'cpu_percent': 100 * cpu / seconds}
+        print(f"{viewers:>8} {preview.stats['encoded']:>8} {preview.stats['frames_sent']:>8} "
+              f"{100 * cpu / seconds:>6.1f}%")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the cost of adding preview viewers")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    benchmark_fanout(seconds=args.seconds)
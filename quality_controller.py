@@ -0,0 +1,204 @@
+# save as: quality_controller.py
+import os
+import time
+import argparse
+import multiprocessing
+
+# Ways to shed work, cheapest loss of quality first
+DEGRADE_STEPS = [
+    ('inference_width', 480),
+    ('inference_width', 320),
+    ('detection_stride', 2),
+    ('hands_model_complexity', 0),
+    ('comedy_overlays', False),
+    ('detection_stride', 3)
+]
+
+
+def build_quality_levels(profile):
+    """Quality ladder that starts at the profile's settings and steps down one knob at a time"""
+    level = {
+        'inference_width': profile['inference_width'],
+        'detection_stride': profile['detection_stride'],
+        'hands_model_complexity': profile['hands_model_complexity'],
+        'comedy_overlays': True
+    }
+    levels = [dict(level)]
+    for knob, value in DEGRADE_STEPS:
+        current = level[knob]
+        if knob == 'inference_width':
+            cheaper = current is None or value < current
+        elif knob == 'detection_stride':
+            cheaper = value > current
+        else:
+            cheaper = value < current
+        if cheaper:
+            level[knob] = value
+            levels.append(dict(level))
+    return levels
+
+
+class AdaptiveQualityController:
+    """Feedback loop that trades quality for frame rate, with hysteresis"""
+
+    def __init__(self, levels, target_fps=20.0, smoothing=0.1, degrade_margin=1.1,
+                 upgrade_margin=0.7, degrade_patience=10, upgrade_patience=60, cooldown=30):
+        self.levels = levels
+        self.target_fps = target_fps
+        self.smoothing = smoothing
+        # Degrade when slower than budget * degrade_margin, upgrade only when comfortably faster
+        self.degrade_margin = degrade_margin
+        self.upgrade_margin = upgrade_margin
+        self.degrade_patience = degrade_patience
+        self.upgrade_patience = upgrade_patience
+        self.cooldown = cooldown
+
+        self.level = 0
+        self.avg_frame_time = None
+        self.restart_average = False
+        self.over_budget = 0
+        self.under_budget = 0
+        self.frames_since_change = 0
+        self.upgrade_backoff = 1
+        self.last_change = None
+        self.changes = 0
+
+    @property
+    def budget(self):
+        return 1.0 / self.target_fps
+
+    @property
+    def settings(self):
+        return self.levels[self.level]
+
+    @property
+    def measured_fps(self):
+        return 1.0 / self.avg_frame_time if self.avg_frame_time else 0.0
+
+    def update(self, frame_seconds):
+        """Feed one frame's processing time; returns True when the level changed"""
+        if self.avg_frame_time is None or self.restart_average:
+            self.avg_frame_time = frame_seconds
+            self.restart_average = False
+        else:
+            self.avg_frame_time += self.smoothing * (frame_seconds - self.avg_frame_time)
+        self.frames_since_change += 1
+
+        if self.avg_frame_time > self.budget * self.degrade_margin:
+            self.over_budget += 1
+            self.under_budget = 0
+        elif self.avg_frame_time < self.budget * self.upgrade_margin:
+            self.under_budget += 1
+            self.over_budget = 0
+        else:
+            self.over_budget = 0
+            self.under_budget = 0
+
+        if self.frames_since_change < self.cooldown:
+            return False
+
+        if self.over_budget >= self.degrade_patience and self.level < len(self.levels) - 1:
+            # Falling back right after an upgrade means that upgrade was a mistake - wait longer next time
+            if self.last_change == 'up' and self.frames_since_change < self.cooldown * 4:
+                self.upgrade_backoff = min(self.upgrade_backoff * 2, 16)
+            return self.change_level(+1, 'down')
+
+        if self.under_budget >= self.upgrade_patience * self.upgrade_backoff and self.level > 0:
+            return self.change_level(-1, 'up')
+
+        return False
+
+    def change_level(self, step, direction):
+        self.level += step
+        self.last_change = direction
+        self.changes += 1
+        self.frames_since_change = 0
+        self.over_budget = 0
+        self.under_budget = 0
+        # The average reflects the old settings, so the next sample starts it fresh; until then the
+        # HUD keeps showing the old one rather than 0 fps
+        self.restart_average = True
+        return True
+
+    def status_text(self):
+        """Short HUD label"""
+        return f"Quality L{self.level}/{len(self.levels) - 1} ({self.measured_fps:.0f}/{self.target_fps:.0f} fps)"
+
+    def metrics(self):
+        return {
+            'quality_level': self.level,
+            'quality_levels': len(self.levels),
+            'measured_fps': self.measured_fps,
+            'target_fps': self.target_fps,
+            'quality_changes': self.changes
+        }
+
+
+def burn_cpu(stop_event):
+    """Busy loop used to create CPU contention"""
+    x = 0
+    while not stop_event.is_set():
+        for _ in range(10000):
+            x = (x * 31 + 7) % 1000003
+
+
+def run_contention_test(target_fps=20.0, num_frames=1200, burners=None, profile="balanced"):
+    """Process synthetic frames, add CPU contention halfway through and watch the controller settle"""
+    from final_awkwardness_detector import UltimateAwkwardnessDetector
+    from frame_sources import open_source
+
+    burners = burners or os.cpu_count() or 2
+    detector = UltimateAwkwardnessDetector(enable_memes=True, enable_audio=False,
+                                           enable_motion_gate=False, profile=profile,
+                                           target_fps=target_fps)
+    controller = detector.quality_controller
+    source = open_source(f"synthetic:{num_frames}")
+    stop_event = multiprocessing.Event()
+    workers = []
+    window = []
+
+    print(f"🔥 Contention test: target {target_fps:.0f} fps, {burners} burner processes from frame {num_frames // 3}")
+    for index, frame in enumerate(source):
+        if index == num_frames // 3:
+            for _ in range(burners):
+                worker = multiprocessing.Process(target=burn_cpu, args=(stop_event,), daemon=True)
+                worker.start()
+                workers.append(worker)
+
+        start = time.perf_counter()
+        detector.process_frame(frame)
+        window.append(time.perf_counter() - start)
+
+        if (index + 1) % 100 == 0:
+            fps = len(window) / sum(window)
+            print(f"frame {index + 1:>5}: {fps:6.1f} fps, level {controller.level}, "
+                  f"{'contended' if workers else 'idle'}")
+            window = []
+
+    stop_event.set()
+    for worker in workers:
+        worker.join(timeout=1.0)
+    source.release()
+
+    final_fps = controller.measured_fps
+    converged = final_fps >= target_fps * 0.85
+    bottomed_out = controller.level == len(controller.levels) - 1
+    print(f"Final level {controller.level}, {final_fps:.1f} fps, {controller.changes} level changes")
+    if converged:
+        print("✅ Converged to target")
+    elif bottomed_out:
+        print("❌ Bottomed out: even the lowest quality level misses the target")
+    else:
+        print("❌ Did not reach target")
+    return converged
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Synthetic CPU-contention test for the quality controller")
+    parser.add_argument("--target-fps", type=float, default=20.0)
+    parser.add_argument("--frames", type=int, default=1200)
+    parser.add_argument("--burners", type=int, default=None, help="Busy processes to start (default: one per CPU)")
+    parser.add_argument("--profile", default="balanced")
+    args = parser.parse_args()
+
+    raise SystemExit(0 if run_contention_test(args.target_fps, args.frames, args.burners, args.profile) else 1)
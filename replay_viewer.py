@@ -0,0 +1,302 @@
+# save as: replay_viewer.py
+import os
+import json
+import time
+import argparse
+from collections import OrderedDict
+import cv2
+import numpy as np
+from session_recorder import load_session
+
+INDEX_VERSION = 1
+
+
+def build_keyframe_index(video_path):
+    """Packet timestamps and keyframe positions from a demux pass (no decoding), cached beside the video"""
+    index_path = os.path.splitext(video_path)[0] + ".index.json"
+    if os.path.exists(index_path) and os.path.getmtime(index_path) >= os.path.getmtime(video_path):
+        with open(index_path) as f:
+            index = json.load(f)
+        if index.get('version') == INDEX_VERSION:
+            return index
+
+    import av
+    with av.open(video_path) as container:
+        stream = container.streams.video[0]
+        packets = [(packet.pts, packet.is_keyframe) for packet in container.demux(stream) if packet.pts is not None]
+    packets.sort()
+    index = {
+        'version': INDEX_VERSION,
+        'pts': [pts for pts, _ in packets],
+        'keyframes': [i for i, (_, keyframe) in enumerate(packets) if keyframe]
+    }
+    with open(index_path, 'w') as f:
+        json.dump(index, f)
+    return index
+
+
+def load_sidecar(path):
+    """Timestamps, scores and detections recorded with each frame"""
+    timestamps, scores, detections = [], [], []
+    with open(path) as f:
+        for line in f:
+            record = json.loads(line)
+            timestamps.append(record['t'])
+            scores.append(record.get('score', 0.0))
+            detections.append(record.get('detections'))
+    return np.array(timestamps), np.array(scores, dtype=np.float32), detections
+
+
+class FrameCache:
+    """LRU of decoded frames, bounded by memory rather than count"""
+
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.frames = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        frame = self.frames.get(key)
+        if frame is None:
+            self.misses += 1
+            return None
+        self.frames.move_to_end(key)
+        self.hits += 1
+        return frame
+
+    def put(self, key, frame):
+        if key in self.frames:
+            return
+        self.frames[key] = frame
+        self.bytes += frame.nbytes
+        while self.bytes > self.max_bytes and len(self.frames) > 1:
+            _, evicted = self.frames.popitem(last=False)
+            self.bytes -= evicted.nbytes
+
+
+class SessionReplay:
+    """Random access into a recorded session: seek from the nearest keyframe, cache what was decoded"""
+
+    def __init__(self, session_dir, cache_mb=256):
+        self.manifest = load_session(session_dir)
+        self.overlays = self.manifest.get('overlays', True)
+        self.segments = []
+        timestamps, scores = [], []
+        self.detections = []
+        offset = 0
+        for segment in self.manifest['segments']:
+            seg_times, seg_scores, seg_detections = load_sidecar(segment['sidecar'])
+            index = build_keyframe_index(segment['path'])
+            # A frame the encoder dropped at the very end may be missing from the container
+            count = min(len(seg_times), len(index['pts']))
+            self.segments.append({'path': segment['path'], 'first': offset, 'count': count, 'index': index,
+                                  'keyframes': np.array(index['keyframes'], dtype=int),
+                                  'pts_lookup': {pts: i for i, pts in enumerate(index['pts'])}})
+            timestamps.append(seg_times[:count])
+            scores.append(seg_scores[:count])
+            self.detections += seg_detections[:count]
+            offset += count
+        self.timestamps = np.concatenate(timestamps) if timestamps else np.zeros(0)
+        self.scores = np.concatenate(scores) if scores else np.zeros(0, dtype=np.float32)
+        self.segment_starts = np.array([s['first'] for s in self.segments], dtype=int)
+
+        self.cache = FrameCache(cache_mb * 1024 * 1024)
+        self.container = None
+        self.decoder = None
+        self.open_segment = None
+        self.next_frame = None  # Frame the open decoder will produce next, if reading sequentially
+
+        self.stats = {
+            'requests': 0,
+            'seeks': 0,
+            'decoded': 0,
+            'seek_time': 0.0,
+            'max_seek_time': 0.0
+        }
+
+    @property
+    def frame_count(self):
+        return len(self.timestamps)
+
+    def frame_at(self, timestamp):
+        """Index of the frame showing at a session time"""
+        return int(np.clip(np.searchsorted(self.timestamps, timestamp, side='right') - 1, 0, self.frame_count - 1))
+
+    def locate(self, frame_index):
+        segment_number = int(np.searchsorted(self.segment_starts, frame_index, side='right') - 1)
+        return segment_number, frame_index - self.segments[segment_number]['first']
+
+    def frame(self, frame_index):
+        """Annotated frame by index, from the cache or decoded from the nearest keyframe"""
+        self.stats['requests'] += 1
+        frame_index = int(np.clip(frame_index, 0, self.frame_count - 1))
+        cached = self.cache.get(frame_index)
+        if cached is not None:
+            return cached
+
+        start = time.perf_counter()
+        segment_number, local = self.locate(frame_index)
+        segment = self.segments[segment_number]
+        if self.open_segment != segment_number or self.next_frame != frame_index:
+            self.seek(segment_number, local)
+
+        # Decode forward to the target, keeping everything on the way for scrubbing back
+        result = None
+        while result is None:
+            try:
+                decoded = next(self.decoder)
+            except StopIteration:
+                break
+            # Trust the packet timestamp over counting when the container has one
+            current = segment['first'] + segment['pts_lookup'].get(decoded.pts, self.next_frame - segment['first'])
+            self.next_frame = current + 1
+            self.stats['decoded'] += 1
+            if current < frame_index:
+                self.cache.put(current, self.annotate(decoded.to_ndarray(format='bgr24'), current))
+                continue
+            result = self.annotate(decoded.to_ndarray(format='bgr24'), current)
+            self.cache.put(current, result)
+
+        elapsed = time.perf_counter() - start
+        self.stats['seek_time'] += elapsed
+        self.stats['max_seek_time'] = max(self.stats['max_seek_time'], elapsed)
+        return result
+
+    def seek(self, segment_number, local):
+        """Reposition the decoder on the keyframe at or before a frame"""
+        segment = self.segments[segment_number]
+        if self.open_segment != segment_number:
+            import av
+            if self.container is not None:
+                self.container.close()
+            self.container = av.open(segment['path'])
+            self.open_segment = segment_number
+        stream = self.container.streams.video[0]
+        keyframes = segment['keyframes']
+        keyframe = int(keyframes[max(0, np.searchsorted(keyframes, local, side='right') - 1)])
+        self.container.seek(segment['index']['pts'][keyframe], stream=stream, backward=True, any_frame=False)
+        self.decoder = self.container.decode(stream)
+        self.next_frame = segment['first'] + keyframe
+        self.stats['seeks'] += 1
+
+    def annotate(self, frame, frame_index):
+        """Redraw the stored detections and score (recordings made with overlays are left alone)"""
+        if self.overlays:
+            return frame
+        h, w = frame.shape[:2]
+        detections = self.detections[frame_index] or {'faces': [], 'hands': []}
+        for x, y, bw, bh, _ in detections['faces']:
+            cv2.rectangle(frame, (int(x * w), int(y * h)), (int((x + bw) * w), int((y + bh) * h)), (0, 255, 0), 2)
+        for hand in detections['hands']:
+            for px, py in hand:
+                cv2.circle(frame, (int(px * w), int(py * h)), 3, (255, 0, 255), -1)
+        cv2.putText(frame, f"Awkwardness Score: {self.scores[frame_index]:.1f}", (10, 30),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+        return frame
+
+    def worst_moments(self, count=5, min_gap=10.0):
+        """Frame indices of the highest scores, at least min_gap seconds apart"""
+        picks = []
+        for frame_index in np.argsort(self.scores)[::-1]:
+            if all(abs(self.timestamps[frame_index] - self.timestamps[p]) >= min_gap for p in picks):
+                picks.append(int(frame_index))
+                if len(picks) == count:
+                    break
+        return picks
+
+    def close(self):
+        if self.container is not None:
+            self.container.close()
+            self.container = None
+
+    def report_lines(self):
+        """Seek latency and cache hit rate"""
+        misses = max(1, self.cache.misses)
+        requests = max(1, self.stats['requests'])
+        return [
+            f"• Frame Requests: {self.stats['requests']} ({100 * self.cache.hits / requests:.1f}% cache hits, "
+            f"{self.cache.bytes / 1e6:.0f}MB cached)",
+            f"• Seek Latency: {1000 * self.stats['seek_time'] / misses:.1f}ms avg, "
+            f"{1000 * self.stats['max_seek_time']:.1f}ms max ({self.stats['decoded'] / misses:.1f} frames decoded per miss)"
+        ]
+
+
+def benchmark_seeks(session_dir, num_seeks=200, seed=0, cache_mb=256):
+    """Random seeks followed by short scrubs, like someone hunting for a moment"""
+    replay = SessionReplay(session_dir, cache_mb=cache_mb)
+    rng = np.random.default_rng(seed)
+    for target in rng.integers(0, replay.frame_count, num_seeks):
+        replay.frame(target)
+        for step in (1, 2, -1):  # Scrub around the landing spot
+            replay.frame(target + step)
+    duration = replay.timestamps[-1] - replay.timestamps[0] if replay.frame_count else 0.0
+    print(f"📊 Replay Seek Benchmark ({replay.frame_count} frames, {duration / 60:.1f} min, {num_seeks} seeks)")
+    for line in replay.report_lines():
+        print(line)
+    replay.close()
+    return replay.stats
+
+
+def play(session_dir, cache_mb=256):
+    """Scrub a recorded session: space plays/pauses, a/d step, j/l jump 5s, n goes to the next worst moment"""
+    replay = SessionReplay(session_dir, cache_mb=cache_mb)
+    if replay.frame_count == 0:
+        print("❌ Nothing recorded in this session")
+        return
+    window = "Awkwardness Replay"
+    position = {'frame': 0}
+    cv2.namedWindow(window)
+    cv2.createTrackbar("frame", window, 0, replay.frame_count - 1, lambda value: position.update(frame=value))
+    worst = replay.worst_moments()
+    worst_index = 0
+    playing = False
+    fps = replay.manifest.get('fps', 30.0)
+
+    print("Controls: space play/pause, a/d step, j/l ±5s, n next worst moment, q quit")
+    while True:
+        frame = replay.frame(position['frame'])
+        if frame is not None:
+            cv2.imshow(window, frame)
+        key = cv2.waitKey(int(1000 / fps) if playing else 30) & 0xFF
+        current = position['frame']
+        if key == ord('q'):
+            break
+        elif key == ord(' '):
+            playing = not playing
+        elif key == ord('d'):
+            current += 1
+        elif key == ord('a'):
+            current -= 1
+        elif key in (ord('j'), ord('l')):
+            current = replay.frame_at(replay.timestamps[current] + (5 if key == ord('l') else -5))
+        elif key == ord('n') and worst:
+            current = worst[worst_index % len(worst)]
+            worst_index += 1
+            print(f"😬 Score {replay.scores[current]:.1f} at {replay.timestamps[current]:.1f}s")
+        elif playing:
+            current += 1
+        current = int(np.clip(current, 0, replay.frame_count - 1))
+        if current != position['frame']:
+            position['frame'] = current
+            cv2.setTrackbarPos("frame", window, current)
+
+    cv2.destroyAllWindows()
+    for line in replay.report_lines():
+        print(line)
+    replay.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrub through a recorded session")
+    parser.add_argument("session_dir", help="Directory written by --record")
+    parser.add_argument("--cache-mb", type=int, default=256, help="Memory cap for decoded frames")
+    parser.add_argument("--benchmark", type=int, default=0, metavar="SEEKS",
+                        help="Measure this many random seeks instead of opening the viewer")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark_seeks(args.session_dir, args.benchmark, cache_mb=args.cache_mb)
+    else:
+        play(args.session_dir, args.cache_mb)
@@ -0,0 +1,134 @@
+# save as: score_history.py
+import time
+import argparse
+import threading
+
+
+class ScoreHistory:
+    """Whole-session score history as a min/max pyramid: level k buckets span sample_interval * 2**k seconds"""
+
+    def __init__(self, sample_interval=0.5, target_points=200):
+        self.sample_interval = sample_interval
+        self.target_points = target_points  # Most buckets the chart ever shows
+        self.levels = [[]]  # Closed buckets per level: (start, low, high)
+        self.open = None  # [bucket index, low, high] still collecting frames
+        self.lock = threading.Lock()  # Frames arrive on the video thread, the UI reads on its own
+
+        self.chart_level = None
+        self.chart_sent = 0
+
+        self.stats = {
+            'frames': 0,
+            'redraws': 0,
+            'rows_sent': 0
+        }
+
+    def add(self, timestamp, score):
+        """One frame's score; constant amortized work however long the session is"""
+        index = int(timestamp / self.sample_interval)
+        with self.lock:
+            self.stats['frames'] += 1
+            if self.open is not None and self.open[0] != index:
+                self.close_bucket()
+            if self.open is None:
+                self.open = [index, score, score]
+            else:
+                self.open[1] = min(self.open[1], score)
+                self.open[2] = max(self.open[2], score)
+
+    def close_bucket(self):
+        index, low, high = self.open
+        self.open = None
+        bucket = (index * self.sample_interval, low, high)
+        level = 0
+        # Every second bucket completes a pair, which becomes one bucket a level up
+        while True:
+            self.levels[level].append(bucket)
+            if len(self.levels[level]) % 2:
+                return
+            first, second = self.levels[level][-2:]
+            bucket = (first[0], min(first[1], second[1]), max(first[2], second[2]))
+            level += 1
+            if level == len(self.levels):
+                self.levels.append([])
+
+    def display_level(self):
+        """Finest level that fits in target_points"""
+        for level, buckets in enumerate(self.levels):
+            if len(buckets) <= self.target_points:
+                return level
+        return len(self.levels) - 1
+
+    def view(self):
+        """(seconds, low, high) of the buckets a chart should show right now"""
+        with self.lock:
+            return self.rows(self.levels[self.display_level()])
+
+    def reset_chart(self):
+        """Next chart_update redraws everything (a new chart element was created)"""
+        with self.lock:
+            self.chart_level = None
+            self.chart_sent = 0
+
+    def chart_update(self):
+        """What to send to the chart since the last call: (redraw, rows).
+
+        Only newly closed buckets are returned while the display level holds; when the session outgrows it,
+        the chart is redrawn one level coarser, which happens log2(duration) times per session.
+        """
+        with self.lock:
+            level = self.display_level()
+            buckets = self.levels[level]
+            redraw = level != self.chart_level
+            rows = self.rows(buckets if redraw else buckets[self.chart_sent:])
+            self.chart_level = level
+            self.chart_sent = len(buckets)
+            self.stats['redraws'] += redraw
+            self.stats['rows_sent'] += len(rows['seconds'])
+            return redraw, rows
+
+    @staticmethod
+    def rows(buckets):
+        return {'seconds': [b[0] for b in buckets], 'low': [round(b[1], 2) for b in buckets],
+                'high': [round(b[2], 2) for b in buckets]}
+
+    def report_lines(self):
+        level = self.display_level()
+        return [f"• History: {self.stats['frames']} frames in {len(self.levels)} levels, charted at "
+                f"{self.sample_interval * 2 ** level:g}s buckets ({self.stats['redraws']} redraws, "
+                f"{self.stats['rows_sent']} rows sent)"]
+
+
+def benchmark_history(hours=4.0, fps=30.0, refresh=0.5, target_points=200):
+    """A long session fed frame by frame, with the chart polled like the Streamlit loop polls it"""
+    history = ScoreHistory(target_points=target_points)
+    frames = int(hours * 3600 * fps)
+    polls = 0
+    naive_rows = 0
+    frames_per_poll = max(1, int(refresh * fps))
+    start = time.perf_counter()
+    for i in range(frames):
+        history.add(i / fps, (i % 900) / 30.0)
+        if i % frames_per_poll == 0:
+            history.chart_update()
+            polls += 1
+            # The old chart re-sent one point per half second of the whole session
+            naive_rows += int(i / fps / 0.5)
+    elapsed = time.perf_counter() - start
+
+    print(f"📊 History Benchmark ({hours:g}h at {fps:g} fps, chart polled every {refresh:g}s)")
+    print(f"• Ingest + polling: {1e6 * elapsed / frames:.2f}µs per frame")
+    print(f"• Rows sent to the chart: {history.stats['rows_sent']} "
+          f"(re-sending everything each poll would be {naive_rows})")
+    for line in history.report_lines():
+        print(line)
+    return history.stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the multi-resolution score history")
+    parser.add_argument("--hours", type=float, default=4.0)
+    parser.add_argument("--points", type=int, default=200, help="Most buckets on the chart")
+    args = parser.parse_args()
+
+    benchmark_history(args.hours, target_points=args.points)
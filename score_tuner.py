@@ -0,0 +1,319 @@
+# save as: score_tuner.py
+import os
+import json
+import time
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from session_recorder import load_session
+from event_stream import ALERT_LEVELS
+from scoring_strategies import FrameFeatures, UltimateStrategy
+
+LEVEL_NAMES = [name for _, name in ALERT_LEVELS]
+DEFAULT_CUTOFFS = (5, 15, 30, 50)  # The stock ALERT_LEVELS boundaries
+DEFAULT_LABEL_LEVEL = "uncomfortable"  # Level of a labeled interval that doesn't say
+
+# Every value of every weight is combined with every other (37,500 settings by default)
+DEFAULT_GRID = {
+    'no_face_points': [1, 2, 3, 4, 5],
+    'touch_points': [2, 3, 4, 5, 6],
+    'fidget_points': [0, 0.5, 1, 2],
+    'face_touch_y': [0.3, 0.35, 0.4, 0.45, 0.5],
+    'posture_points': [2],
+    'silence_points': [2],
+    'gain': [0.3, 0.4, 0.5, 0.6, 0.7],
+    'decay': [0.1, 0.15, 0.2, 0.25, 0.3],
+    'cutoffs': [DEFAULT_CUTOFFS, (4, 12, 25, 40), (6, 18, 35, 60)]
+}
+METRICS = ('f1', 'level_accuracy')
+
+
+def load_features(session_dir):
+    """Per-frame scoring inputs from a recording's sidecars (the session must be recorded with detections)"""
+    manifest = load_session(session_dir)
+    times, faces, tips, signals = [], [], [], []
+    for segment in manifest['segments']:
+        with open(segment['sidecar']) as f:
+            for line in f:
+                record = json.loads(line)
+                detections = record.get('detections')
+                if detections is None:
+                    raise ValueError(f"{segment['sidecar']} has frames without detections - record without "
+                                     "turning them off to tune on this session")
+                times.append(record['t'])
+                faces.append(len(detections['faces']))
+                tips.append([hand[8][1] for hand in detections['hands']])
+                signals.append(record.get('signals', {}))
+
+    # Hands go in fixed columns, NaN where a frame has fewer (NaN never counts as a touch)
+    fingertip_ys = np.full((len(tips), max([1] + [len(ys) for ys in tips])), np.nan, dtype=np.float32)
+    for i, ys in enumerate(tips):
+        fingertip_ys[i, :len(ys)] = ys
+    faces = np.array(faces)
+    return {
+        't': np.array(times),
+        'away': (faces == 0) | np.array([bool(s.get('looking_away')) for s in signals], dtype=bool),
+        'fingertip_ys': fingertip_ys,
+        'posture': np.array([s.get('slouching', 0) + s.get('shoulders_tense', 0) for s in signals], dtype=np.float32),
+        'silent': np.array([s.get('silent', 0) for s in signals], dtype=np.float32),
+        'starts': np.arange(len(times)) == 0  # Where the score starts from zero again
+    }
+
+
+def load_labels(path, timestamps):
+    """Per-frame level index from labeled intervals ({"start", "end", "level"}); unlabeled frames are smooth"""
+    with open(path) as f:
+        labels = json.load(f)
+    intervals = labels['intervals'] if isinstance(labels, dict) else labels
+    levels = np.zeros(len(timestamps), dtype=np.int8)
+    for interval in intervals:
+        name = interval.get('level', DEFAULT_LABEL_LEVEL)
+        if name not in LEVEL_NAMES:
+            raise ValueError(f"Unknown level '{name}' in {path} (choose from {', '.join(LEVEL_NAMES)})")
+        inside = (timestamps >= interval['start']) & (timestamps <= interval['end'])
+        levels[inside] = np.maximum(levels[inside], LEVEL_NAMES.index(name))
+    return levels
+
+
+def load_sessions(session_dirs, label_paths=None):
+    """Concatenated features and labels of several sessions; each one's score restarts from zero"""
+    label_paths = label_paths or [os.path.join(d, "labels.json") for d in session_dirs]
+    features, levels = [], []
+    for session_dir, label_path in zip(session_dirs, label_paths):
+        session = load_features(session_dir)
+        features.append(session)
+        levels.append(load_labels(label_path, session['t']))
+    hands = max(f['fingertip_ys'].shape[1] for f in features)
+    combined = {key: np.concatenate([f[key] for f in features]) for key in ('t', 'away', 'posture', 'silent', 'starts')}
+    combined['fingertip_ys'] = np.concatenate([
+        np.pad(f['fingertip_ys'], ((0, 0), (0, hands - f['fingertip_ys'].shape[1])), constant_values=np.nan)
+        for f in features])
+    return combined, np.concatenate(levels)
+
+
+def expand_grid(grid):
+    """Every combination as parallel arrays (one entry per setting); cutoffs that don't increase are skipped"""
+    grid = dict(DEFAULT_GRID, **grid)
+    names = list(UltimateStrategy.WEIGHTS)
+    combos = [c for c in itertools.product(*(grid[name] for name in names), grid['cutoffs'])
+              if all(a < b for a, b in zip(c[-1], c[-1][1:]))]
+    params = {name: np.array([c[i] for c in combos], dtype=np.float32) for i, name in enumerate(names)}
+    params['cutoffs'] = np.array([c[-1] for c in combos], dtype=np.float32).reshape(len(combos), -1)
+    return params
+
+
+def slice_params(params, start, stop):
+    return {name: values[start:stop] for name, values in params.items()}
+
+
+def simulate_scores(features, params):
+    """Scores of every setting on every frame, shape (frames, settings): the recurrence runs once over time,
+    broadcast across settings"""
+    ys = features['fingertip_ys']
+    touches = (ys[:, :, None] < params['face_touch_y'][None, None, :]).sum(axis=1, dtype=np.float32)
+    hands = np.isfinite(ys).sum(axis=1, dtype=np.float32)[:, None]
+    points = (features['away'][:, None] * params['no_face_points']
+              + touches * params['touch_points']
+              + (hands - touches) * params['fidget_points']
+              + features['posture'][:, None] * params['posture_points']
+              + features['silent'][:, None] * params['silence_points'])
+
+    # score = max(0, score + points * gain - decay), written over the increments in place;
+    # the running score stays float64 so long sessions don't drift from the per-frame strategy
+    scores = points * params['gain'] - params['decay']
+    score = np.zeros(scores.shape[1])
+    for t, restart in enumerate(features['starts']):
+        if restart:
+            score[:] = 0
+        np.add(score, scores[t], out=score)
+        np.maximum(score, 0, out=score)
+        scores[t] = score
+    return scores
+
+
+def evaluate(features, levels, params):
+    """Agreement of every setting with the labels"""
+    scores = simulate_scores(features, params)
+    predicted = np.zeros(scores.shape, dtype=np.int8)
+    for k in range(params['cutoffs'].shape[1]):
+        predicted += scores >= params['cutoffs'][:, k]
+    del scores
+
+    awkward_level = LEVEL_NAMES.index(DEFAULT_LABEL_LEVEL)
+    actual = (levels >= awkward_level)[:, None]
+    flagged = predicted >= awkward_level
+    tp = (flagged & actual).sum(axis=0)
+    fp = (flagged & ~actual).sum(axis=0)
+    fn = (~flagged & actual).sum(axis=0)
+    return {
+        'f1': np.where(2 * tp + fp + fn > 0, 2 * tp / np.maximum(1, 2 * tp + fp + fn), 1.0),
+        'level_accuracy': (predicted == levels[:, None]).mean(axis=0)
+    }
+
+
+# Worker processes get the session data once, at startup, instead of with every chunk
+_worker_data = {}
+
+
+def _init_worker(features, levels):
+    _worker_data['features'] = features
+    _worker_data['levels'] = levels
+
+
+def _evaluate_chunk(params):
+    return evaluate(_worker_data['features'], _worker_data['levels'], params)
+
+
+def sweep(features, levels, params, max_bytes=256 * 1024 * 1024, workers=0):
+    """Evaluate all settings in chunks small enough that a chunk's score matrix stays under max_bytes"""
+    count = len(params['gain'])
+    # Touches, points and scores (float32) plus a few int8/bool planes per frame and setting
+    chunk = max(1, int(max_bytes // (len(levels) * 16)))
+    chunks = [slice_params(params, start, start + chunk) for start in range(0, count, chunk)]
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(features, levels)) as pool:
+            results = list(pool.map(_evaluate_chunk, chunks))
+    else:
+        results = [evaluate(features, levels, c) for c in chunks]
+    return {metric: np.concatenate([r[metric] for r in results]) for metric in METRICS}, len(chunks)
+
+
+def setting(params, index):
+    """One setting as plain Python values"""
+    return {
+        'weights': {name: round(float(params[name][index]), 4) for name in UltimateStrategy.WEIGHTS},
+        'cutoffs': [float(c) for c in params['cutoffs'][index]]
+    }
+
+
+def baseline_params():
+    """The detector's current weights as a one-setting grid"""
+    return expand_grid({name: [value] for name, value in UltimateStrategy().weights().items()})
+
+
+def tune(session_dirs, label_paths=None, grid=None, metric='f1', top=10, max_bytes=256 * 1024 * 1024,
+         workers=0, output=None):
+    """Rank weight settings by agreement with labeled sessions"""
+    features, levels = load_sessions(session_dirs, label_paths)
+    params = expand_grid(grid or {})
+    count = len(params['gain'])
+
+    start = time.perf_counter()
+    results, chunks = sweep(features, levels, params, max_bytes, workers)
+    elapsed = time.perf_counter() - start
+    baseline = evaluate(features, levels, baseline_params())
+
+    ranked = np.argsort(-results[metric], kind='stable')[:top]
+    print(f"🎛️ Score Tuning ({count} settings x {len(levels)} frames from {len(session_dirs)} sessions, "
+          f"{chunks} chunks, {elapsed:.1f}s)")
+    print(f"• Current weights: f1 {baseline['f1'][0]:.3f}, level accuracy {baseline['level_accuracy'][0]:.3f}")
+    for rank, index in enumerate(ranked):
+        best = setting(params, index)
+        weights = ", ".join(f"{name}={value:g}" for name, value in best['weights'].items())
+        print(f"• #{rank + 1}: f1 {results['f1'][index]:.3f}, level accuracy {results['level_accuracy'][index]:.3f} "
+              f"| {weights} | cutoffs {'/'.join(f'{c:g}' for c in best['cutoffs'])}")
+
+    best = dict(setting(params, ranked[0]), metric=metric, value=round(float(results[metric][ranked[0]]), 4),
+                baseline=round(float(baseline[metric][0]), 4))
+    if output:
+        with open(output, 'w') as f:
+            json.dump(best, f, indent=2)
+        print(f"📝 Best weights saved to {output} (use with --scoring-weights)")
+    return best
+
+
+def synthetic_features(num_frames=9000, seed=0):
+    """Calm stretches broken by awkward episodes where faces vanish and hands wander"""
+    rng = np.random.default_rng(seed)
+    awkward = np.zeros(num_frames, dtype=bool)
+    t = 0
+    while t < num_frames:
+        t += int(rng.integers(150, 600))
+        length = int(rng.integers(30, 150))
+        awkward[t:t + length] = True
+        t += length
+    fingertip_ys = np.full((num_frames, 2), np.nan, dtype=np.float32)
+    visible = rng.random((num_frames, 2)) < np.where(awkward, 0.5, 0.03)[:, None]
+    fingertip_ys[visible] = rng.random(visible.sum())
+    return {
+        't': np.arange(num_frames) / 30.0,
+        'away': rng.random(num_frames) < np.where(awkward, 0.4, 0.02),
+        'fingertip_ys': fingertip_ys,
+        'posture': (awkward & (rng.random(num_frames) < 0.2)).astype(np.float32),
+        'silent': (rng.random(num_frames) < 0.02).astype(np.float32),
+        'starts': np.arange(num_frames) == 0
+    }
+
+
+def check_against_strategy(features, samples=5, seed=0):
+    """The broadcast recurrence must give the same scores as UltimateStrategy frame by frame"""
+    params = expand_grid({})
+    picks = np.random.default_rng(seed).choice(len(params['gain']), samples, replace=False)
+    subset = {name: values[picks] for name, values in params.items()}
+    scores = simulate_scores(features, subset)
+    worst = 0.0
+    for column, index in enumerate(picks):
+        strategy = UltimateStrategy(**setting(params, index)['weights'])
+        expected = []
+        for t in range(len(features['t'])):
+            ys = features['fingertip_ys'][t]
+            frame = FrameFeatures(features['t'][t], 0 if features['away'][t] else 1,
+                                  [float(y) for y in ys[np.isfinite(ys)]],
+                                  slouching=bool(features['posture'][t]), silent=bool(features['silent'][t]))
+            strategy.update(frame)
+            expected.append(strategy.score)
+        worst = max(worst, float(np.abs(scores[:, column] - np.array(expected)).max()))
+    return worst
+
+
+def evaluate_levels(features):
+    """Level of each frame under the current weights and cutoffs"""
+    params = baseline_params()
+    scores = simulate_scores(features, params)[:, 0]
+    return np.searchsorted(params['cutoffs'][0], scores, side='right').astype(np.int8)
+
+
+def benchmark_tuner(num_frames=9000, max_bytes=256 * 1024 * 1024, workers=0):
+    """Sweep the default grid over a synthetic session and check it against the per-frame strategy"""
+    features = synthetic_features(num_frames)
+    # Label the stretches where the current weights would be uncomfortable, so there's something to find
+    levels = evaluate_levels(features)
+    params = expand_grid({})
+    start = time.perf_counter()
+    results, chunks = sweep(features, levels, params, max_bytes, workers)
+    elapsed = time.perf_counter() - start
+    error = check_against_strategy(features)
+    count = len(params['gain'])
+    print(f"📊 Tuner Benchmark ({count} settings x {num_frames} frames, {chunks} chunks, "
+          f"{workers or 1} worker{'s' if workers > 1 else ''})")
+    print(f"• Sweep: {elapsed:.2f}s ({1e9 * elapsed / (count * num_frames):.1f}ns per setting-frame)")
+    print(f"• Best f1: {results['f1'].max():.3f} (current weights label the data, so 1.0 is reachable)")
+    print(f"• Max difference from UltimateStrategy: {error:.2e}")
+    return {'seconds': elapsed, 'settings': count, 'max_error': error}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tune scoring weights against labeled recordings")
+    parser.add_argument("sessions", nargs="*", help="Session directories written by --record")
+    parser.add_argument("--labels", nargs="+", default=None,
+                        help="Label files, one per session (default: labels.json in each session)")
+    parser.add_argument("--grid", default=None, help="JSON file of weight -> candidate values")
+    parser.add_argument("--metric", choices=METRICS, default='f1')
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-mb", type=float, default=256, help="Memory budget per chunk")
+    parser.add_argument("--workers", type=int, default=0, help="Spread chunks over this many processes")
+    parser.add_argument("--output", default=None, help="Save the best weights and cutoffs here")
+    parser.add_argument("--benchmark", action="store_true", help="Time the sweep on a synthetic session")
+    args = parser.parse_args()
+
+    if args.benchmark or not args.sessions:
+        benchmark_tuner(max_bytes=int(args.max_mb * 1024 * 1024), workers=args.workers)
+    else:
+        grid = None
+        if args.grid:
+            with open(args.grid) as f:
+                grid = {name: [tuple(v) if isinstance(v, list) else v for v in values]
+                        for name, values in json.load(f).items()}
+        tune(args.sessions, args.labels, grid, args.metric, args.top, int(args.max_mb * 1024 * 1024),
+             args.workers, args.output)
@@ -0,0 +1,289 @@
+# save as: scoring_strategies.py
+import csv
+import time
+import argparse
+
+# Frame-level signals besides faces and hands (what the recorder keeps alongside detections)
+SIGNALS = ('looking_away', 'slouching', 'shoulders_tense', 'silent')
+
+
+class FrameFeatures:
+    """Everything the scoring rules look at, extracted once per frame from one inference pass"""
+
+    def __init__(self, timestamp, face_count, fingertip_ys, looking_away=False, slouching=False,
+                 shoulders_tense=False, silent=False, gestures=()):
+        self.timestamp = timestamp
+        self.face_count = face_count  # None when face absence isn't being measured
+        self.fingertip_ys = fingertip_ys  # Normalized y of each hand's index fingertip
+        self.looking_away = looking_away
+        self.slouching = slouching
+        self.shoulders_tense = shoulders_tense
+        self.silent = silent
+        self.gestures = gestures  # Gestures the classifier saw start this frame
+
+    @property
+    def hand_count(self):
+        return len(self.fingertip_ys)
+
+    def signals(self):
+        """The signals that are on this frame, as a compact dict"""
+        return {name: 1 for name in SIGNALS if getattr(self, name)}
+
+    @classmethod
+    def from_results(cls, face_results, hand_results, timestamp, gestures=(), **signals):
+        hands = hand_results.multi_hand_landmarks or []
+        return cls(timestamp, len(face_results.detections or []),
+                   [hand_landmarks.landmark[8].y for hand_landmarks in hands], gestures=gestures, **signals)
+
+
+class ScoringStrategy:
+    """One rule set: points per frame, then a gain/decay recurrence on the running score"""
+
+    name = "base"
+    description = ""
+
+    def __init__(self):
+        self.score = 0.0
+        self.peak = 0.0
+        self.behaviors = []  # What this frame's points were for
+
+    def frame_points(self, features):
+        raise NotImplementedError
+
+    def next_score(self, score, points):
+        raise NotImplementedError
+
+    def update(self, features):
+        """Score one frame; returns its points"""
+        points = self.frame_points(features)
+        self.score = self.next_score(self.score, points)
+        self.peak = max(self.peak, self.score)
+        return points
+
+
+class UltimateStrategy(ScoringStrategy):
+    """UltimateAwkwardnessDetector: gaze, face touches, fidgeting, posture and silence"""
+
+    name = "ultimate"
+    description = "Final detector (gaze, touches, posture, silence)"
+
+    # Weights score_tuner.py can search over
+    no_face_points = 3
+    touch_points = 4
+    fidget_points = 1
+    face_touch_y = 0.4  # Fingertips above this line count as touching the face
+    posture_points = 2
+    silence_points = 2
+    gain = 0.5
+    decay = 0.2
+    WEIGHTS = ('no_face_points', 'touch_points', 'fidget_points', 'face_touch_y',
+               'posture_points', 'silence_points', 'gain', 'decay')
+
+    def __init__(self, **weights):
+        super().__init__()
+        for name, value in weights.items():
+            if name not in self.WEIGHTS:
+                raise ValueError(f"Unknown weight '{name}' (choose from {', '.join(self.WEIGHTS)})")
+            setattr(self, name, value)
+
+    def weights(self):
+        return {name: getattr(self, name) for name in self.WEIGHTS}
+
+    def frame_points(self, features):
+        points = 0
+        self.behaviors = []
+        if features.face_count == 0 or features.looking_away:
+            points += self.no_face_points
+            self.behaviors.append("eye_contact_break")
+        for y in features.fingertip_ys:
+            if y < self.face_touch_y:
+                points += self.touch_points
+                if self.touch_points:  # Zeroed while face touch detection is off
+                    self.behaviors.append("face_touch")
+            else:
+                points += self.fidget_points
+        if features.slouching:
+            points += self.posture_points
+        if features.shoulders_tense:
+            points += self.posture_points
+        if features.silent:
+            points += self.silence_points
+        return points
+
+    def next_score(self, score, points):
+        return max(0, score + points * self.gain - self.decay)
+
+
+class ScientificStrategy(ScoringStrategy):
+    """AwkwardnessDetector: sustained looking away, upper-third touches, classified gestures"""
+
+    name = "scientific"
+    description = "Scientific analyzer (2s look-away, touches, gestures)"
+    face_touch_y = 1 / 3
+    gesture_labels = {'hair_touch': "💇 NERVOUS HAIR TOUCHING", 'neck_touch': "😬 NECK RUBBING",
+                      'waving': "👋 AWKWARD WAVING", 'crossed_arms': "🙅 DEFENSIVE CROSSED ARMS"}
+
+    def __init__(self):
+        super().__init__()
+        self.last_face_time = None
+        self.no_face_time = 0
+        self.face_touch_count = 0
+
+    def frame_points(self, features):
+        points = 0
+        self.behaviors = []
+        if self.last_face_time is None:
+            self.last_face_time = features.timestamp
+        if features.face_count != 0:
+            self.last_face_time = features.timestamp
+            self.no_face_time = 0
+        else:
+            self.no_face_time = features.timestamp - self.last_face_time
+            if self.no_face_time > 2:  # Looking away for 2+ seconds
+                points += 5
+                self.behaviors.append("👀 AVOIDING EYE CONTACT")
+        for y in features.fingertip_ys:
+            if y < self.face_touch_y:
+                self.face_touch_count += 1
+                points += 2
+                self.behaviors.append("🤚 NERVOUS FACE TOUCHING")
+        for gesture in features.gestures:
+            self.behaviors.append(self.gesture_labels.get(gesture, gesture))
+            points += 3
+        return points
+
+    def next_score(self, score, points):
+        # Forgiveness only on calm frames
+        return score + points if points else max(0, score - 0.1)
+
+
+class VisualStrategy(ScoringStrategy):
+    """VisualAlertSystem: missing face and visible hands"""
+
+    name = "visual"
+    description = "Visual alerts (no face +2, each hand +1)"
+
+    def frame_points(self, features):
+        return (2 if features.face_count == 0 else 0) + features.hand_count
+
+    def next_score(self, score, points):
+        return max(0, score + points * 0.5 - 0.2)
+
+
+class AudioStrategy(ScoringStrategy):
+    """AudioAlertSystem: missing face and any hands, slower gain"""
+
+    name = "audio"
+    description = "Audio alerts (no face +3, hands +2, x0.3)"
+
+    def frame_points(self, features):
+        return (3 if features.face_count == 0 else 0) + (2 if features.hand_count else 0)
+
+    def next_score(self, score, points):
+        return max(0, score + points * 0.3 - 0.15)
+
+
+class ComedyStrategy(AudioStrategy):
+    """ComedyFeaturesSystem: same points as the audio rules, gentler decay"""
+
+    name = "comedy"
+    description = "Comedy features (no face +3, hands +2, slow decay)"
+
+    def next_score(self, score, points):
+        return max(0, score + points * 0.3 - 0.1)
+
+
+STRATEGIES = {strategy.name: strategy for strategy in
+              (UltimateStrategy, ScientificStrategy, VisualStrategy, AudioStrategy, ComedyStrategy)}
+
+
+def build_strategy(name, **options):
+    """Create a scoring strategy by name"""
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown scoring strategy '{name}' (choose from {', '.join(STRATEGIES)})")
+    return STRATEGIES[name](**options)
+
+
+class StrategyBank:
+    """Several strategies scoring the same features side by side, optionally writing their score tracks"""
+
+    def __init__(self, names=None, track_path=None):
+        names = list(STRATEGIES) if names in (None, 'all', ['all']) else names
+        self.strategies = [build_strategy(name) for name in names]
+        self.update_time = 0.0
+        self.frames = 0
+        self.track_file = None
+        self.track_writer = None
+        if track_path is not None:
+            self.track_file = open(track_path, 'w', newline='')
+            self.track_writer = csv.writer(self.track_file)
+            self.track_writer.writerow(['frame', 't'] + [s.name for s in self.strategies])
+
+    def update(self, features):
+        """Every strategy scores this frame; one row per frame goes to the track file"""
+        start = time.perf_counter()
+        for strategy in self.strategies:
+            strategy.update(features)
+        self.update_time += time.perf_counter() - start
+        self.frames += 1
+        if self.track_writer is not None:
+            self.track_writer.writerow([self.frames, f"{features.timestamp:.3f}"] +
+                                       [f"{s.score:.2f}" for s in self.strategies])
+        return {s.name: s.score for s in self.strategies}
+
+    def close(self):
+        if self.track_file is not None:
+            self.track_file.close()
+            self.track_file = None
+
+    def report_lines(self):
+        """Final and peak score per strategy, plus what scoring them cost"""
+        lines = [f"• {s.name}: final {s.score:.1f}, peak {s.peak:.1f}" for s in self.strategies]
+        lines.append(f"• Scoring Cost: {1e6 * self.update_time / max(1, self.frames):.1f}µs per frame "
+                     f"for {len(self.strategies)} strategies")
+        return lines
+
+
+def compare_strategies(source_spec="synthetic:300", names=None, track_path=None, profile=None):
+    """One inference pass per frame feeding every strategy; prints their scores and the cost split"""
+    import cv2
+    import mediapipe as mp
+    from frame_sources import open_source
+    from model_profiles import DEFAULT_PROFILE, get_profile, resize_for_inference
+    from inference_backends import build_backend
+
+    profile = get_profile(profile or DEFAULT_PROFILE)
+    backend = build_backend(mp, profile)
+    bank = StrategyBank(names, track_path)
+    source = open_source(source_spec)
+    inference_time = 0.0
+    for frame in source:
+        start = time.perf_counter()
+        rgb_frame = cv2.cvtColor(resize_for_inference(frame, profile['inference_width']), cv2.COLOR_BGR2RGB)
+        detections = backend.process(rgb_frame)
+        inference_time += time.perf_counter() - start
+        bank.update(FrameFeatures.from_results(detections.face_results, detections.hand_results, source.timestamp))
+    source.release()
+    backend.close()
+    bank.close()
+
+    frames = max(1, bank.frames)
+    print(f"📊 Strategy Comparison ({bank.frames} frames, one inference pass each)")
+    for line in bank.report_lines():
+        print(line)
+    print(f"• Inference Cost: {1000 * inference_time / frames:.1f}ms per frame")
+    if track_path:
+        print(f"📝 Score tracks saved to {track_path}")
+    return {s.name: {'final': s.score, 'peak': s.peak} for s in bank.strategies}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score one video with every rule set at once")
+    parser.add_argument("--source", default="synthetic:300", help="Frame source to score")
+    parser.add_argument("--strategies", nargs="+", default=None, choices=list(STRATEGIES),
+                        help="Which rule sets to run (default: all)")
+    parser.add_argument("--tracks", default=None, help="Write per-frame scores to this CSV")
+    parser.add_argument("--profile", default=None)
+    args = parser.parse_args()
+
+    compare_strategies(args.source, args.strategies, args.tracks, args.profile)
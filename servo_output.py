@@ -0,0 +1,412 @@
+# save as: servo_output.py
+import os
+import time
+import select
+import struct
+import argparse
+import tempfile
+import threading
+from event_stream import ALERT_LEVELS, alert_level
+
+# One frame per update: sync byte, sequence, servo angle (0-180), alert level index, score x100 (uint16,
+# big-endian), then a CRC-8 of the five bytes after sync. Seven bytes, so even 9600 baud carries 130/s.
+SYNC = 0xA5
+FRAME = struct.Struct('>BBBBHB')
+LEVEL_NAMES = [name for _, name in ALERT_LEVELS]
+DEFAULT_BAUD = 115200
+BAUD_RATES = (9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600)  # Standard rates termios knows
+
+
+def build_crc_table(polynomial=0x07):
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ polynomial if crc & 0x80 else crc << 1) & 0xFF
+        table.append(crc)
+    return table
+
+
+CRC_TABLE = build_crc_table()
+
+
+def crc8(data):
+    """CRC-8 (polynomial 0x07), cheap enough for an Arduino to check per frame"""
+    crc = 0
+    for byte in data:
+        crc = CRC_TABLE[crc ^ byte]
+    return crc
+
+
+def encode_frame(sequence, score, max_score=100.0, levels=ALERT_LEVELS):
+    """Seven-byte frame for one score"""
+    score = max(0.0, float(score))
+    angle = int(round(180 * min(score, max_score) / max_score))
+    body = struct.pack('>BBBH', sequence & 0xFF, angle, LEVEL_NAMES.index(alert_level(score, levels)),
+                       min(int(round(score * 100)), 0xFFFF))
+    return bytes([SYNC]) + body + bytes([crc8(body)])
+
+
+class FrameDecoder:
+    """Receiving side of the framing: finds sync bytes, checks CRCs and skips garbage"""
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.stats = {
+            'frames': 0,
+            'skipped_bytes': 0
+        }
+
+    def feed(self, data):
+        """Add received bytes; returns the complete frames among them as dicts"""
+        self.buffer += data
+        frames = []
+        while len(self.buffer) >= FRAME.size:
+            if self.buffer[0] != SYNC or crc8(self.buffer[1:FRAME.size - 1]) != self.buffer[FRAME.size - 1]:
+                # Not a frame start (or a torn frame): resync one byte later
+                del self.buffer[0]
+                self.stats['skipped_bytes'] += 1
+                continue
+            _, sequence, angle, level, centi, _ = FRAME.unpack(bytes(self.buffer[:FRAME.size]))
+            del self.buffer[:FRAME.size]
+            frames.append({'sequence': sequence, 'angle': angle,
+                           'level': LEVEL_NAMES[min(level, len(LEVEL_NAMES) - 1)], 'score': centi / 100})
+            self.stats['frames'] += 1
+        return frames
+
+
+class TTYPort:
+    """A serial device opened through termios, for when pyserial isn't installed (POSIX only)"""
+
+    def __init__(self, path, baud=DEFAULT_BAUD, write_timeout=0.05):
+        import termios
+        import tty
+        speed = getattr(termios, f"B{baud}", None)
+        if speed is None:
+            raise ValueError(f"Unsupported baud rate {baud} (choose from {', '.join(map(str, BAUD_RATES))})")
+        self.write_timeout = write_timeout
+        self.fd = os.open(path, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        try:
+            tty.setraw(self.fd)  # Binary frames: no echo, no newline translation
+            attributes = termios.tcgetattr(self.fd)
+            attributes[4] = attributes[5] = speed
+            termios.tcsetattr(self.fd, termios.TCSANOW, attributes)
+        except Exception:
+            os.close(self.fd)
+            raise
+
+    def write(self, data):
+        view = memoryview(data)
+        deadline = time.perf_counter() + self.write_timeout
+        while view:
+            remaining = deadline - time.perf_counter()
+            _, ready, _ = select.select([], [self.fd], [], max(0.0, remaining))
+            if not ready:
+                raise TimeoutError("serial write timed out")
+            view = view[os.write(self.fd, view):]
+
+    def close(self):
+        os.close(self.fd)
+
+
+class SerialPort:
+    """pyserial, with write timeouts raised as TimeoutError like TTYPort"""
+
+    def __init__(self, path, baud=DEFAULT_BAUD, write_timeout=0.05):
+        import serial
+        self.serial_module = serial
+        self.serial = serial.Serial(path, baud, timeout=0, write_timeout=write_timeout)
+
+    def write(self, data):
+        try:
+            self.serial.write(data)
+        except self.serial_module.SerialTimeoutException as error:
+            raise TimeoutError(str(error))
+
+    def close(self):
+        self.serial.close()
+
+
+def open_port(path, baud=DEFAULT_BAUD, write_timeout=0.05):
+    """pyserial when it's installed, plain termios otherwise"""
+    try:
+        import serial  # noqa: F401
+    except ImportError:
+        return TTYPort(path, baud, write_timeout)
+    return SerialPort(path, baud, write_timeout)
+
+
+class ServoChannel:
+    """Sends the latest score to a serial servo controller from its own thread, at most rate times a second.
+
+    update() only swaps in the newest value, so a slow, stalled or missing device never holds up the video
+    loop; values that arrive faster than the rate are coalesced and counted as dropped.
+    """
+
+    def __init__(self, port, baud=DEFAULT_BAUD, rate=20.0, max_score=100.0, keepalive=1.0,
+                 write_timeout=0.05, min_backoff=0.25, max_backoff=8.0, opener=open_port, levels=ALERT_LEVELS):
+        self.port = port
+        self.levels = levels  # Alert buckets behind the level byte
+        self.baud = baud
+        self.interval = 1.0 / rate
+        self.max_score = max_score  # Score that swings the servo all the way to 180 degrees
+        self.keepalive = keepalive  # Resend the last value this often so a rebooted board catches up
+        self.write_timeout = write_timeout
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.opener = opener
+
+        self.condition = threading.Condition()
+        self.latest = None  # (score, perf_counter when submitted) not yet sent
+        self.last_score = None
+        self.connection = None
+        self.backoff = min_backoff
+        self.outage_reported = False
+        self.idle = False  # Output thread is waiting for a value (the only time update() needs to wake it)
+        self.sequence = 0
+        self.running = False
+        self.thread = None
+
+        self.stats = {
+            'updates': 0,
+            'dropped': 0,
+            'frames_sent': 0,
+            'bytes_sent': 0,
+            'keepalives': 0,
+            'write_time': 0.0,
+            'write_max': 0.0,
+            'delivery_time': 0.0,
+            'write_timeouts': 0,
+            'write_errors': 0,
+            'connects': 0,
+            'connect_failures': 0
+        }
+
+    def start(self):
+        """Launch the output thread (the port is opened there, not on the caller's thread)"""
+        if self.running:
+            return self
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name="servo-output", daemon=True)
+        self.thread.start()
+        return self
+
+    def update(self, score):
+        """Called from the video loop: replaces any unsent value and returns at once"""
+        with self.condition:
+            self.stats['updates'] += 1
+            if self.latest is not None:
+                self.stats['dropped'] += 1
+            self.latest = (float(score), time.perf_counter())
+            if self.idle:
+                self.condition.notify()
+
+    def stop(self, timeout=1.0):
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if self.thread is not None:
+            self.thread.join(timeout)
+        self.disconnect()
+
+    def sleep(self, seconds):
+        """Wait without holding up stop()"""
+        with self.condition:
+            self.condition.wait_for(lambda: not self.running, seconds)
+
+    def run(self):
+        while self.running:
+            if self.connection is None and not self.connect():
+                self.sleep(self.backoff)
+                self.backoff = min(2 * self.backoff, self.max_backoff)
+                continue
+            with self.condition:
+                if self.latest is None:
+                    self.idle = True
+                    self.condition.wait_for(lambda: self.latest is not None or not self.running, self.keepalive)
+                    self.idle = False
+                if not self.running:
+                    break
+                item, self.latest = self.latest, None
+            if item is None:
+                if self.last_score is None:
+                    continue
+                item = (self.last_score, time.perf_counter())
+                self.stats['keepalives'] += 1
+            self.send(*item)
+            # Whatever arrives before the next slot is coalesced into one frame
+            self.sleep(self.interval)
+
+    def connect(self):
+        try:
+            self.connection = self.opener(self.port, self.baud, self.write_timeout)
+        except (OSError, ValueError) as error:
+            if not self.outage_reported:  # Once per outage, not once per attempt
+                print(f"🔌 Servo port {self.port} unavailable ({error}) - retrying in the background")
+                self.outage_reported = True
+            self.stats['connect_failures'] += 1
+            return False
+        self.stats['connects'] += 1
+        self.backoff = self.min_backoff
+        self.outage_reported = False
+        print(f"🔌 Servo connected on {self.port}")
+        return True
+
+    def disconnect(self):
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except OSError:
+                pass
+            self.connection = None
+
+    def send(self, score, submitted_at):
+        frame = encode_frame(self.sequence, score, self.max_score, self.levels)
+        start = time.perf_counter()
+        try:
+            self.connection.write(frame)
+        except TimeoutError:
+            # Device isn't reading; keep the port (reopening resets most Arduinos) and send newer values later
+            self.stats['write_timeouts'] += 1
+            return False
+        except OSError as error:
+            self.stats['write_errors'] += 1
+            print(f"🔌 Servo port lost ({error}) - reconnecting")
+            self.disconnect()
+            with self.condition:
+                if self.latest is None:
+                    self.latest = (score, submitted_at)  # Resend once the port is back
+            return False
+        done = time.perf_counter()
+        self.sequence = (self.sequence + 1) & 0xFF
+        self.last_score = score
+        self.stats['frames_sent'] += 1
+        self.stats['bytes_sent'] += len(frame)
+        self.stats['write_time'] += done - start
+        self.stats['write_max'] = max(self.stats['write_max'], done - start)
+        self.stats['delivery_time'] += done - submitted_at
+        return True
+
+    def report_lines(self):
+        sent = max(1, self.stats['frames_sent'])
+        return [f"• Servo: {self.stats['frames_sent']} frames ({self.stats['bytes_sent']} bytes) to {self.port}, "
+                f"{self.stats['dropped']} of {self.stats['updates']} updates coalesced away",
+                f"• Servo Writes: {1000 * self.stats['write_time'] / sent:.2f}ms avg, "
+                f"{1000 * self.stats['write_max']:.2f}ms max, {1000 * self.stats['delivery_time'] / sent:.1f}ms "
+                f"update-to-wire, {self.stats['write_timeouts']} timeouts, {self.stats['connects']} connects, "
+                f"{self.stats['connect_failures']} failed attempts"]
+
+
+class PtyServo:
+    """Pseudo-terminal stand-in for the servo board: decodes what the channel writes, and can be unplugged.
+
+    The channel opens link_path, a symlink to the current pty (like a udev name), so replugging shows up
+    as the same port coming back.
+    """
+
+    def __init__(self, link_path=None):
+        import tty
+        self.tty = tty
+        self.link_path = link_path or os.path.join(tempfile.mkdtemp(prefix="servo_"), "ttyservo")
+        self.decoder = FrameDecoder()
+        self.frames = []
+        self.lock = threading.Lock()
+        self.master = None
+        self.slave = None
+        self.thread = None
+
+    def plug(self):
+        self.master, self.slave = os.openpty()
+        self.tty.setraw(self.slave)
+        temporary = self.link_path + ".new"
+        os.symlink(os.ttyname(self.slave), temporary)
+        os.replace(temporary, self.link_path)
+        self.thread = threading.Thread(target=self.read_loop, args=(self.master,), name="pty-servo", daemon=True)
+        self.thread.start()
+        return self
+
+    def read_loop(self, master):
+        while self.master == master:
+            try:
+                ready, _, _ = select.select([master], [], [], 0.05)
+                data = os.read(master, 4096) if ready else b""
+            except (OSError, ValueError):
+                break
+            if data:
+                frames = self.decoder.feed(data)
+                with self.lock:
+                    self.frames += frames
+
+    def unplug(self):
+        """Close both ends; the channel's next write fails like a pulled USB cable"""
+        master, self.master = self.master, None
+        if self.thread is not None:
+            self.thread.join(1.0)
+        os.close(master)
+        os.close(self.slave)
+        os.unlink(self.link_path)
+
+    def close(self):
+        if self.master is not None:
+            self.unplug()
+        os.rmdir(os.path.dirname(self.link_path))
+
+
+def benchmark_servo(fps=30.0, rate=20.0, phase_seconds=2.0):
+    """Drive a channel at video frame rate against a pty stand-in that gets unplugged and replugged"""
+    device = PtyServo().plug()
+    channel = ServoChannel(device.link_path, rate=rate, min_backoff=0.1, max_backoff=0.4).start()
+    update_time = 0.0
+    update_max = 0.0
+    frames = 0
+    for phase in ("connected", "unplugged", "replugged"):
+        if phase == "unplugged":
+            device.unplug()
+        elif phase == "replugged":
+            device.plug()
+        end = time.perf_counter() + phase_seconds
+        while time.perf_counter() < end:
+            # A score sweeping up and down, one update per video frame
+            score = 60 * abs(((frames / fps) % 4) - 2)
+            start = time.perf_counter()
+            channel.update(score)
+            elapsed = time.perf_counter() - start
+            update_time += elapsed
+            update_max = max(update_max, elapsed)
+            frames += 1
+            time.sleep(1 / fps)
+    time.sleep(0.2)
+    channel.stop()
+    received = len(device.frames)
+    device.close()
+
+    print(f"📊 Servo Channel Benchmark ({fps:g} fps video, {rate:g} Hz output, "
+          f"{phase_seconds:g}s each connected / unplugged / replugged)")
+    print(f"• update(): {1e6 * update_time / max(1, frames):.1f}µs avg, {1e6 * update_max:.0f}µs max "
+          f"over {frames} frames")
+    print(f"• Device received {received} frames, {device.decoder.stats['skipped_bytes']} bytes skipped resyncing")
+    for line in channel.report_lines():
+        print(line)
+    return channel.stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Drive the servo from a score, or test the channel on a pty")
+    parser.add_argument("--port", default=None, help="Serial port of the servo board (default: pty self-test)")
+    parser.add_argument("--baud", type=int, default=DEFAULT_BAUD, choices=BAUD_RATES)
+    parser.add_argument("--rate", type=float, default=20.0, help="Frames per second on the wire")
+    parser.add_argument("--seconds", type=float, default=10.0, help="How long to sweep a real servo")
+    args = parser.parse_args()
+
+    if args.port is None:
+        benchmark_servo(rate=args.rate)
+    else:
+        channel = ServoChannel(args.port, args.baud, args.rate).start()
+        print(f"🦾 Sweeping the servo on {args.port} for {args.seconds:g}s")
+        start = time.perf_counter()
+        while time.perf_counter() - start < args.seconds:
+            channel.update(channel.max_score * (1 - abs((time.perf_counter() - start) % 4 - 2) / 2))
+            time.sleep(1 / 30)
+        channel.stop()
+        for line in channel.report_lines():
+            print(line)
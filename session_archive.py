@@ -0,0 +1,377 @@
+# save as: session_archive.py
+import os
+import re
+import glob
+import json
+import time
+import random
+import sqlite3
+import argparse
+from datetime import datetime, timedelta
+
+DEFAULT_DB = "awkwardness_archive.db"
+SUMMARY_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    source TEXT UNIQUE NOT NULL,
+    format TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    day TEXT NOT NULL,
+    duration REAL,
+    frames INTEGER,
+    peak REAL,
+    final REAL,
+    mean REAL,
+    awkward_frames INTEGER,
+    smooth_moments INTEGER,
+    face_touches INTEGER,
+    eye_contact_breaks INTEGER,
+    profile TEXT,
+    summary TEXT
+);
+CREATE TABLE IF NOT EXISTS series (
+    session_id INTEGER NOT NULL,
+    second INTEGER NOT NULL,
+    mean REAL NOT NULL,
+    peak REAL NOT NULL,
+    PRIMARY KEY (session_id, second)
+) WITHOUT ROWID;
+-- Per-day rollup so trends read a few hundred rows, however many sessions there are
+CREATE TABLE IF NOT EXISTS days (
+    day TEXT PRIMARY KEY,
+    sessions INTEGER NOT NULL,
+    mean_sum REAL,
+    mean_count INTEGER NOT NULL,
+    peak_sum REAL,
+    peak_max REAL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    session_id INTEGER
+);
+-- Covering indexes: the rollup refresh and the leaderboard never touch the table itself
+CREATE INDEX IF NOT EXISTS sessions_by_day ON sessions (day, mean, peak);
+CREATE INDEX IF NOT EXISTS sessions_by_peak ON sessions (peak DESC, id);
+CREATE INDEX IF NOT EXISTS sessions_by_start ON sessions (started_at);
+"""
+
+SESSION_COLUMNS = ('source', 'format', 'started_at', 'day', 'duration', 'frames', 'peak', 'final', 'mean',
+                   'awkward_frames', 'smooth_moments', 'face_touches', 'eye_contact_breaks', 'profile', 'summary')
+
+# Legacy report lines -> (column, converter); both the detector and the comedy system's wording
+LEGACY_FIELDS = [
+    (re.compile(r"Date:\s*(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})"), 'date', str),
+    (re.compile(r"Session Duration:\s*([\d.]+) minutes"), 'duration', lambda v: float(v) * 60),
+    (re.compile(r"Frames Analyzed:\s*(\d+)"), 'frames', int),
+    (re.compile(r"Peak Cringe Level:\s*([\d.]+)"), 'peak', float),
+    (re.compile(r"Final Score:\s*([\d.]+)"), 'final', float),
+    (re.compile(r"Awkward Frames:\s*(\d+)"), 'awkward_frames', int),
+    (re.compile(r"Smooth Moments:\s*(\d+)"), 'smooth_moments', int),
+    (re.compile(r"Awkward/Smooth Ratio:\s*(\d+)/(\d+)"), 'ratio', None),
+    (re.compile(r"Face Touches:\s*(\d+)"), 'face_touches', int),
+    (re.compile(r"Fidget Count:\s*(\d+)"), 'face_touches', int),
+    (re.compile(r"Model Profile:\s*(\S+)"), 'profile', str),
+    (re.compile(r"Eye Contact Breaks:\s*(\d+)"), 'eye_contact_breaks', int),
+]
+REPORT_NAME = re.compile(r"awkwardness_report_(\d{8}_\d{6})")
+
+
+class ScoreSeries:
+    """Per-second mean and peak of the score, built up one frame at a time"""
+
+    def __init__(self):
+        self.seconds = {}  # second -> [sum, count, peak]
+        self.total = 0.0
+        self.count = 0
+
+    def update(self, timestamp, score):
+        bucket = self.seconds.setdefault(int(timestamp), [0.0, 0, score])
+        bucket[0] += score
+        bucket[1] += 1
+        bucket[2] = max(bucket[2], score)
+        self.total += score
+        self.count += 1
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def rows(self):
+        """[second, mean, peak] rows in time order"""
+        return [[second, round(s / n, 2), round(peak, 2)] for second, (s, n, peak) in sorted(self.seconds.items())]
+
+
+def parse_legacy_report(path):
+    """Session fields from a text report; the date falls back to the file name"""
+    fields = {}
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            for pattern, name, convert in LEGACY_FIELDS:
+                match = pattern.search(line)
+                if match is None or name in fields:
+                    continue
+                if name == 'ratio':
+                    fields.setdefault('awkward_frames', int(match.group(1)))
+                    fields.setdefault('smooth_moments', int(match.group(2)))
+                else:
+                    fields[name] = convert(match.group(1))
+                break
+    if 'peak' not in fields:
+        raise ValueError(f"{path} doesn't look like an awkwardness report")
+
+    if 'date' in fields:
+        started = datetime.strptime(fields.pop('date'), '%Y-%m-%d %H:%M:%S')
+    else:
+        match = REPORT_NAME.search(os.path.basename(path))
+        started = datetime.strptime(match.group(1), '%Y%m%d_%H%M%S') if match else \
+            datetime.fromtimestamp(os.path.getmtime(path))
+    # Reports are written at the end, so the session started a duration earlier
+    started -= timedelta(seconds=fields.get('duration', 0.0))
+    fields.update(started_at=started.timestamp(), day=started.strftime('%Y-%m-%d'))
+    return fields, []
+
+
+def parse_summary(path):
+    """Session fields and per-second series from a detector JSON summary"""
+    with open(path) as f:
+        summary = json.load(f)
+    started = datetime.fromisoformat(summary['started_at'])
+    stats = summary.get('stats', {})
+    fields = {
+        'started_at': started.timestamp(),
+        'day': started.strftime('%Y-%m-%d'),
+        'duration': summary.get('duration'),
+        'frames': summary.get('frames'),
+        'peak': summary['scores']['peak'],
+        'final': summary['scores']['final'],
+        'mean': summary['scores'].get('mean'),
+        'awkward_frames': stats.get('awkward_frames'),
+        'smooth_moments': stats.get('smooth_moments'),
+        'face_touches': stats.get('face_touches'),
+        'eye_contact_breaks': stats.get('eye_contact_breaks'),
+        'profile': summary.get('profile'),
+        # Events, highlights and the rest stay queryable with SQLite's JSON functions
+        'summary': json.dumps({k: v for k, v in summary.items() if k != 'series'})
+    }
+    return fields, summary.get('series', [])
+
+
+def report_files(paths):
+    """Report files under the given files/directories; a .txt with a .json twin is left to the JSON"""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            found += glob.glob(os.path.join(path, "awkwardness_report_*.json"))
+            found += glob.glob(os.path.join(path, "awkwardness_report_*.txt"))
+        else:
+            found.append(path)
+    found = sorted(set(os.path.abspath(p) for p in found))
+    return [p for p in found if not (p.endswith('.txt') and os.path.exists(p[:-4] + '.json'))]
+
+
+class SessionArchive:
+    """SQLite store of session summaries and per-second score series"""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        self.stats = {
+            'ingested': 0,
+            'skipped': 0,
+            'failed': 0,
+            'series_rows': 0
+        }
+        self.dirty_days = set()  # Days whose rollup row is stale
+
+    def ingest(self, paths):
+        """Add new or changed reports; files already ingested unchanged are skipped on a stat() alone"""
+        known = {path: (size, mtime) for path, size, mtime in self.db.execute("SELECT path, size, mtime FROM files")}
+        with self.db:
+            for path in report_files(paths):
+                info = os.stat(path)
+                if known.get(path) == (info.st_size, info.st_mtime):
+                    self.stats['skipped'] += 1
+                    continue
+                try:
+                    if path.endswith('.json'):
+                        fields, series = parse_summary(path)
+                        fields['format'] = 'json'
+                    else:
+                        fields, series = parse_legacy_report(path)
+                        fields['format'] = 'txt'
+                except (ValueError, KeyError, json.JSONDecodeError) as error:
+                    print(f"⚠️ Skipping {path}: {error}")
+                    self.stats['failed'] += 1
+                    continue
+                session_id = self.store(path, fields, series)
+                self.db.execute("INSERT OR REPLACE INTO files (path, size, mtime, session_id) VALUES (?, ?, ?, ?)",
+                                (path, info.st_size, info.st_mtime, session_id))
+                self.stats['ingested'] += 1
+            self.refresh_days()
+        return self.stats
+
+    def store(self, source, fields, series):
+        """Insert (or replace) one session and its series; caller holds the transaction"""
+        existing = self.db.execute("SELECT id, day FROM sessions WHERE source = ?", (source,)).fetchone()
+        if existing is not None:
+            self.dirty_days.add(existing[1])
+            self.db.execute("DELETE FROM series WHERE session_id = ?", existing[:1])
+            self.db.execute("DELETE FROM sessions WHERE id = ?", existing[:1])
+        self.dirty_days.add(fields['day'])
+        fields = dict(fields, source=source)
+        cursor = self.db.execute(
+            f"INSERT INTO sessions ({', '.join(SESSION_COLUMNS)}) VALUES ({', '.join('?' * len(SESSION_COLUMNS))})",
+            [fields.get(column) for column in SESSION_COLUMNS])
+        session_id = cursor.lastrowid
+        self.db.executemany("INSERT INTO series (session_id, second, mean, peak) VALUES (?, ?, ?, ?)",
+                            [(session_id, second, mean, peak) for second, mean, peak in series])
+        self.stats['series_rows'] += len(series)
+        return session_id
+
+    def refresh_days(self):
+        """Recompute the rollup rows of the days that changed"""
+        for day in self.dirty_days:
+            self.db.execute("DELETE FROM days WHERE day = ?", (day,))
+            self.db.execute("INSERT INTO days SELECT day, COUNT(*), SUM(mean), COUNT(mean), SUM(peak), MAX(peak) "
+                            "FROM sessions WHERE day = ? GROUP BY day", (day,))
+        self.dirty_days.clear()
+
+    def query(self, sql, params=()):
+        """Rows plus how long the query took in ms"""
+        start = time.perf_counter()
+        rows = self.db.execute(sql, params).fetchall()
+        return rows, 1000 * (time.perf_counter() - start)
+
+    def trend(self, by='week', since=None, until=None):
+        """Sessions, mean and peak score per day/week/month"""
+        period = {'day': "day", 'week': "strftime('%Y-W%W', day)", 'month': "substr(day, 1, 7)"}[by]
+        return self.query(
+            f"SELECT {period} AS period, SUM(sessions), SUM(mean_sum) / NULLIF(SUM(mean_count), 0), "
+            "SUM(peak_sum) / SUM(sessions), MAX(peak_max) FROM days "
+            "WHERE day >= ? AND day <= ? GROUP BY period ORDER BY period",
+            (since or '0000-00-00', until or '9999-99-99'))
+
+    def daily_means(self, since=None, until=None):
+        return self.trend('day', since, until)
+
+    def top_sessions(self, limit=10):
+        """Highest peaks first"""
+        return self.query("SELECT id, day, peak, mean, duration, face_touches, source FROM sessions "
+                          "ORDER BY peak DESC, id LIMIT ?", (limit,))
+
+    def session(self, session_id, bucket_seconds=60):
+        """One session with its series rolled up into buckets"""
+        row, elapsed = self.query("SELECT id, source, day, duration, frames, peak, final, mean, face_touches, "
+                                  "eye_contact_breaks FROM sessions WHERE id = ?", (session_id,))
+        series, more = self.query("SELECT second / ? AS bucket, AVG(mean), MAX(peak) FROM series "
+                                  "WHERE session_id = ? GROUP BY bucket ORDER BY bucket",
+                                  (bucket_seconds, session_id))
+        return (row[0] if row else None), series, elapsed + more
+
+    def count(self):
+        return self.db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def close(self):
+        self.db.close()
+
+    def report_lines(self):
+        return [f"• Ingested {self.stats['ingested']} reports ({self.stats['skipped']} unchanged, "
+                f"{self.stats['failed']} unreadable, {self.stats['series_rows']} series rows); "
+                f"{self.count()} sessions archived"]
+
+
+def benchmark_archive(path="archive_benchmark.db", num_sessions=20000, seconds_per_session=120, seed=0):
+    """Fill an archive with synthetic sessions and time the CLI's queries"""
+    if os.path.exists(path):
+        os.remove(path)
+    archive = SessionArchive(path)
+    rng = random.Random(seed)
+    start_day = datetime(2024, 1, 1)
+    start = time.perf_counter()
+    with archive.db:
+        for i in range(num_sessions):
+            started = start_day + timedelta(minutes=rng.randint(0, 60 * 24 * 600))
+            scores = [max(0.0, rng.gauss(20, 10)) for _ in range(seconds_per_session)]
+            fields = {'format': 'json', 'started_at': started.timestamp(), 'day': started.strftime('%Y-%m-%d'),
+                      'duration': seconds_per_session, 'frames': seconds_per_session * 30, 'peak': max(scores),
+                      'final': scores[-1], 'mean': sum(scores) / len(scores), 'face_touches': rng.randint(0, 40)}
+            archive.store(f"synthetic_{i}", fields, [(s, score, score) for s, score in enumerate(scores)])
+        archive.refresh_days()
+    ingest = time.perf_counter() - start
+
+    print(f"📊 Archive Benchmark ({num_sessions} sessions, {archive.stats['series_rows']} series rows, "
+          f"built in {ingest:.1f}s)")
+    timings = {}
+    for name, run in [('trend by week', lambda: archive.trend('week')),
+                      ('mean per day', lambda: archive.daily_means()),
+                      ('top 10 by peak', lambda: archive.top_sessions(10)),
+                      ('one session', lambda: archive.session(num_sessions // 2)[1:])]:
+        rows, elapsed = run()
+        timings[name] = elapsed
+        print(f"• {name}: {elapsed:.1f}ms ({len(rows)} rows)")
+    archive.close()
+    os.remove(path)
+    return timings
+
+
+def print_rows(headers, rows, elapsed):
+    print("  ".join(f"{h:>12}" for h in headers))
+    for row in rows:
+        print("  ".join(f"{v:>12.1f}" if isinstance(v, float) else f"{'-' if v is None else v:>12}" for v in row))
+    print(f"({len(rows)} rows in {elapsed:.1f}ms)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Archive and query awkwardness sessions")
+    parser.add_argument("--db", default=DEFAULT_DB)
+    commands = parser.add_subparsers(dest="command", required=True)
+    ingest_parser = commands.add_parser("ingest", help="Add report files (JSON summaries or legacy .txt)")
+    ingest_parser.add_argument("paths", nargs="*", default=["."], help="Files or directories (default: here)")
+    trend_parser = commands.add_parser("trend", help="Sessions and scores over time")
+    trend_parser.add_argument("--by", choices=["day", "week", "month"], default="week")
+    daily_parser = commands.add_parser("daily", help="Mean score per day")
+    for sub in (trend_parser, daily_parser):
+        sub.add_argument("--since", default=None, metavar="YYYY-MM-DD")
+        sub.add_argument("--until", default=None, metavar="YYYY-MM-DD")
+    top_parser = commands.add_parser("top", help="Sessions with the highest peaks")
+    top_parser.add_argument("-n", type=int, default=10)
+    show_parser = commands.add_parser("show", help="One session, minute by minute")
+    show_parser.add_argument("session_id", type=int)
+    bench_parser = commands.add_parser("benchmark", help="Time the queries on a synthetic archive")
+    bench_parser.add_argument("--sessions", type=int, default=20000)
+    args = parser.parse_args()
+
+    if args.command == "benchmark":
+        benchmark_archive(num_sessions=args.sessions)
+    else:
+        archive = SessionArchive(args.db)
+        if args.command == "ingest":
+            archive.ingest(args.paths)
+            for line in archive.report_lines():
+                print(line)
+        elif args.command == "trend":
+            print_rows([args.by, "sessions", "mean", "avg peak", "max peak"], *archive.trend(args.by, args.since,
+                                                                                               args.until))
+        elif args.command == "daily":
+            print_rows(["day", "sessions", "mean", "avg peak", "max peak"], *archive.daily_means(args.since,
+                                                                                                 args.until))
+        elif args.command == "top":
+            print_rows(["id", "day", "peak", "mean", "seconds", "touches", "source"], *archive.top_sessions(args.n))
+        elif args.command == "show":
+            session, series, elapsed = archive.session(args.session_id)
+            if session is None:
+                print(f"❌ No session {args.session_id}")
+            else:
+                print(f"🎭 Session {session[0]} on {session[2]} ({session[1]})")
+                print(f"• {session[3] or 0:.0f}s, {session[4]} frames, peak {session[5]:.1f}, final {session[6]:.1f}, "
+                      f"mean {session[7] if session[7] is not None else float('nan'):.1f}, "
+                      f"{session[8]} touches, {session[9]} eye contact breaks")
+                print_rows(["minute", "mean", "peak"], series, elapsed)
+        archive.close()
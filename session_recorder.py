@@ -0,0 +1,235 @@
+# save as: session_recorder.py
+import os
+import json
+import time
+import argparse
+import threading
+from collections import deque
+from datetime import datetime
+import cv2
+
+DEFAULT_OUTPUT_DIR = "recordings"
+DROP_POLICIES = ('drop_oldest', 'drop_newest')
+SEGMENT_EXTENSIONS = {'mp4v': '.mp4', 'avc1': '.mp4', 'XVID': '.avi', 'MJPG': '.avi'}
+
+
+def detections_to_dict(detections):
+    """Compact, JSON-friendly copy of one frame's detections (normalized coordinates)"""
+    if detections is None:
+        return None
+    faces = []
+    for detection in detections.face_results.detections or []:
+        box = detection.location_data.relative_bounding_box
+        faces.append([round(box.xmin, 4), round(box.ymin, 4), round(box.width, 4), round(box.height, 4),
+                      round(detection.score[0], 3) if detection.score else 1.0])
+    hands = []
+    for hand_landmarks in detections.hand_results.multi_hand_landmarks or []:
+        hands.append([[round(lm.x, 4), round(lm.y, 4)] for lm in hand_landmarks.landmark])
+    return {'faces': faces, 'hands': hands}
+
+
+class SessionRecorder:
+    """Writes session video on a background thread through a bounded queue, in time/size segments"""
+
+    def __init__(self, output_dir=DEFAULT_OUTPUT_DIR, fps=30.0, codec='mp4v', resolution=None,
+                 segment_seconds=300.0, segment_bytes=None, queue_size=64, drop_policy='drop_oldest',
+                 record_detections=True, overlays=True):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy '{drop_policy}' (choose from {', '.join(DROP_POLICIES)})")
+        self.session_dir = os.path.join(output_dir, datetime.now().strftime('session_%Y%m%d_%H%M%S'))
+        self.fps = fps
+        self.codec = codec
+        self.resolution = resolution  # (width, height) or None to keep the frame size
+        self.segment_seconds = segment_seconds
+        self.segment_bytes = segment_bytes
+        self.drop_policy = drop_policy
+        self.record_detections = record_detections
+        self.overlays = overlays  # Whether frames already carry the detector's drawings
+
+        self.queue = deque(maxlen=queue_size)
+        self.condition = threading.Condition()
+        self.thread = None
+        self.running = False
+
+        self.writer = None
+        self.sidecar = None
+        self.segment = None
+        self.segments = []
+
+        self.stats = {
+            'submitted': 0,
+            'written': 0,
+            'dropped': 0,
+            'encode_time': 0.0,
+            'max_queue': 0
+        }
+
+    def start(self):
+        os.makedirs(self.session_dir, exist_ok=True)
+        self.running = True
+        self.thread = threading.Thread(target=self.encode_loop, name="session-recorder", daemon=True)
+        self.thread.start()
+        print(f"⏺️ Recording to {self.session_dir}")
+        return self
+
+    def submit(self, frame, timestamp, score=None, detections=None, signals=None):
+        """Hand a frame to the encoder thread; never waits (full queue drops per the policy)"""
+        item = (frame, timestamp, score, detections_to_dict(detections) if self.record_detections else None,
+                signals)
+        with self.condition:
+            self.stats['submitted'] += 1
+            if len(self.queue) == self.queue.maxlen:
+                self.stats['dropped'] += 1
+                if self.drop_policy == 'drop_newest':
+                    return False
+            self.queue.append(item)  # deque(maxlen) discards the oldest
+            self.stats['max_queue'] = max(self.stats['max_queue'], len(self.queue))
+            self.condition.notify()
+        return True
+
+    def encode_loop(self):
+        """Encoder thread: write frames until stopped and the queue is empty"""
+        while True:
+            with self.condition:
+                while not self.queue and self.running:
+                    self.condition.wait(0.5)
+                if not self.queue:
+                    break
+                frame, timestamp, score, detections, signals = self.queue.popleft()
+
+            start = time.perf_counter()
+            if self.resolution is not None and (frame.shape[1], frame.shape[0]) != tuple(self.resolution):
+                frame = cv2.resize(frame, tuple(self.resolution), interpolation=cv2.INTER_AREA)
+            if self.segment is None or self.segment_full(timestamp):
+                self.open_segment(frame, timestamp)
+            self.writer.write(frame)
+            record = {'frame': self.segment['frames'], 't': round(timestamp, 4)}
+            if score is not None:
+                record['score'] = round(float(score), 2)
+            if detections is not None:
+                record['detections'] = detections
+            if signals:
+                record['signals'] = signals
+            self.sidecar.write(json.dumps(record) + "\n")
+            self.segment['frames'] += 1
+            self.segment['end'] = timestamp
+            self.stats['written'] += 1
+            self.stats['encode_time'] += time.perf_counter() - start
+        self.close_segment()
+
+    def segment_full(self, timestamp):
+        if timestamp - self.segment['start'] >= self.segment_seconds:
+            return True
+        # Checking the file size is a syscall, so only do it once a second of video
+        if self.segment_bytes and self.segment['frames'] % max(1, int(self.fps)) == 0:
+            return os.path.getsize(self.segment['path']) >= self.segment_bytes
+        return False
+
+    def open_segment(self, frame, timestamp):
+        self.close_segment()
+        index = len(self.segments)
+        extension = SEGMENT_EXTENSIONS.get(self.codec, '.avi')
+        path = os.path.join(self.session_dir, f"segment_{index:03d}{extension}")
+        h, w = frame.shape[:2]
+        self.writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*self.codec), self.fps, (w, h))
+        if not self.writer.isOpened():
+            raise RuntimeError(f"Could not open a {self.codec} writer for {path}")
+        sidecar_path = os.path.join(self.session_dir, f"segment_{index:03d}.jsonl")
+        self.sidecar = open(sidecar_path, 'w')
+        self.segment = {'index': index, 'path': path, 'sidecar': sidecar_path, 'start': timestamp,
+                        'end': timestamp, 'frames': 0, 'width': w, 'height': h, 'fps': self.fps}
+        self.segments.append(self.segment)
+
+    def close_segment(self):
+        if self.writer is None:
+            return
+        self.writer.release()
+        self.sidecar.close()
+        self.writer = None
+        self.write_manifest()
+
+    def write_manifest(self):
+        """segments.json ties every segment to its time range on the session clock"""
+        manifest = {'fps': self.fps, 'codec': self.codec, 'overlays': self.overlays, 'segments': [
+            dict(s, path=os.path.basename(s['path']), sidecar=os.path.basename(s['sidecar']))
+            for s in self.segments]}
+        with open(os.path.join(self.session_dir, "segments.json"), 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+    def stop(self):
+        """Finish writing what's queued and close the last segment"""
+        if not self.running:
+            return
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        self.thread.join()
+
+    def report_lines(self):
+        """Recorder counters for the session report"""
+        written = max(1, self.stats['written'])
+        return [
+            f"• Recording: {self.stats['written']}/{self.stats['submitted']} frames in "
+            f"{len(self.segments)} segments ({self.stats['dropped']} dropped, "
+            f"{1000 * self.stats['encode_time'] / written:.1f}ms encode, peak queue {self.stats['max_queue']})"
+        ]
+
+
+def load_session(session_dir):
+    """Segment manifest of a recorded session, with paths resolved against its directory"""
+    with open(os.path.join(session_dir, "segments.json")) as f:
+        manifest = json.load(f)
+    for segment in manifest['segments']:
+        segment['path'] = os.path.join(session_dir, segment['path'])
+        segment['sidecar'] = os.path.join(session_dir, segment['sidecar'])
+    return manifest
+
+
+def benchmark_recorder(source_spec="synthetic:300", output_dir=DEFAULT_OUTPUT_DIR, codec='mp4v', capture_fps=60.0):
+    """Capture-loop cost of inline VideoWriter.write vs the background recorder at a given capture rate"""
+    from frame_sources import open_source
+
+    source = open_source(source_spec, prefetch=False)
+    frames = list(source)
+    source.release()
+    h, w = frames[0].shape[:2]
+
+    inline_path = os.path.join(output_dir, "inline_check" + SEGMENT_EXTENSIONS.get(codec, '.avi'))
+    os.makedirs(output_dir, exist_ok=True)
+    writer = cv2.VideoWriter(inline_path, cv2.VideoWriter_fourcc(*codec), 30.0, (w, h))
+    start = time.perf_counter()
+    for frame in frames:
+        writer.write(frame)
+    inline = time.perf_counter() - start
+    writer.release()
+    os.remove(inline_path)
+
+    recorder = SessionRecorder(output_dir, codec=codec, segment_seconds=5.0).start()
+    queued = 0.0
+    paced_start = start = time.perf_counter()
+    for i, frame in enumerate(frames):
+        recorder.submit(frame, i / 30.0, score=0.0)
+        queued += time.perf_counter() - start
+        time.sleep(max(0.0, (i + 1) / capture_fps - (time.perf_counter() - paced_start)))
+        start = time.perf_counter()
+    recorder.stop()
+
+    n = len(frames)
+    print(f"📊 Recorder Benchmark ({n} frames, {w}x{h}, {codec}, captured at {capture_fps:.0f} fps)")
+    print(f"   inline write: {1000 * inline / n:.2f}ms per frame on the capture thread")
+    print(f"   background:   {1000 * queued / n:.3f}ms per frame on the capture thread")
+    for line in recorder.report_lines():
+        print(line)
+    return {'inline_ms': 1000 * inline / n, 'background_ms': 1000 * queued / n,
+            'dropped': recorder.stats['dropped'], 'session_dir': recorder.session_dir}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare inline and background session recording")
+    parser.add_argument("--source", default="synthetic:300")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--codec", default="mp4v")
+    parser.add_argument("--capture-fps", type=float, default=60.0)
+    args = parser.parse_args()
+
+    benchmark_recorder(args.source, args.output_dir, args.codec, args.capture_fps)
@@ -0,0 +1,372 @@
+# save as: silence_detector.py
+import os
+import time
+import wave
+import argparse
+import tempfile
+import threading
+import numpy as np
+
+SAMPLE_RATE = 16000
+BLOCK_SIZE = 512  # 32ms at 16kHz
+SPEECH_BAND = (300, 3400)  # Hz
+
+
+class AudioRingBuffer:
+    """Fixed-size block ring the audio callback writes into and the analyzer drains"""
+
+    def __init__(self, capacity_blocks=64, block_size=BLOCK_SIZE):
+        self.capacity = capacity_blocks
+        self.block_size = block_size
+        self.blocks = np.zeros((capacity_blocks, block_size), dtype=np.float32)
+        self.timestamps = np.zeros(capacity_blocks, dtype=np.float64)
+        self.write_count = 0
+        self.read_count = 0
+        self.overflow = 0
+        self.lock = threading.Lock()
+
+    def write(self, samples, timestamp):
+        """Store one block (called from the audio thread; never allocates)"""
+        with self.lock:
+            slot = self.write_count % self.capacity
+            self.blocks[slot] = samples
+            self.timestamps[slot] = timestamp
+            self.write_count += 1
+
+    def read_pending(self):
+        """Copy out every unread block as an (N, block_size) array plus timestamps"""
+        with self.lock:
+            pending = self.write_count - self.read_count
+            if pending > self.capacity:
+                # The reader fell behind; the oldest blocks were overwritten
+                self.overflow += pending - self.capacity
+                self.read_count = self.write_count - self.capacity
+            slots = np.arange(self.read_count, self.write_count) % self.capacity
+            self.read_count = self.write_count
+            return self.blocks[slots], self.timestamps[slots]
+
+
+def block_features(blocks, sample_rate=SAMPLE_RATE):
+    """Energy and spectral features for a batch of blocks, one row per block"""
+    blocks = np.atleast_2d(blocks)
+    rms = np.sqrt(np.mean(blocks ** 2, axis=1))
+    energy_db = 20 * np.log10(rms + 1e-10)
+    zero_crossings = np.mean(np.abs(np.diff(np.signbit(blocks), axis=1)), axis=1)
+
+    power = np.abs(np.fft.rfft(blocks * np.hanning(blocks.shape[1]), axis=1)) ** 2 + 1e-12
+    frequencies = np.fft.rfftfreq(blocks.shape[1], 1.0 / sample_rate)
+    band = (frequencies >= SPEECH_BAND[0]) & (frequencies <= SPEECH_BAND[1])
+    # Noise is spectrally flat (close to 1); voiced speech is peaky (close to 0)
+    flatness = np.exp(np.mean(np.log(power), axis=1)) / np.mean(power, axis=1)
+    band_ratio = power[:, band].sum(axis=1) / power.sum(axis=1)
+
+    return {
+        'energy_db': energy_db,
+        'zero_crossing_rate': zero_crossings,
+        'flatness': flatness,
+        'speech_band_ratio': band_ratio
+    }
+
+
+class SilenceDetector:
+    """Voice activity per block, turned into timestamped silence intervals"""
+
+    def __init__(self, sample_rate=SAMPLE_RATE, block_size=BLOCK_SIZE, min_silence=2.0,
+                 margin_db=10.0, min_energy_db=-55.0, max_flatness=0.3, min_band_ratio=0.1,
+                 hangover=0.3, noise_adapt=0.02, max_intervals=1000):
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.block_seconds = block_size / sample_rate
+        self.min_silence = min_silence  # Quiet this long before it counts as dead silence
+        self.margin_db = margin_db  # Voice must be this far above the noise floor
+        self.min_energy_db = min_energy_db
+        self.max_flatness = max_flatness
+        self.min_band_ratio = min_band_ratio
+        self.hangover_blocks = max(1, int(round(hangover / self.block_seconds)))
+        self.noise_adapt = noise_adapt
+        self.max_intervals = max_intervals
+
+        self.noise_floor_db = min_energy_db - margin_db  # Assume a quiet room until we hear one
+        self.quiet_blocks = 0
+        self.quiet_since = None
+        self.last_timestamp = 0.0
+        self.intervals = []
+        self.silent = False
+
+        self.stats = {
+            'blocks': 0,
+            'voice_blocks': 0,
+            'process_time': 0.0,
+            'max_delay': 0.0
+        }
+
+    def feed(self, blocks, timestamps):
+        """Analyze a batch of blocks (features are vectorized; only the state machine loops)"""
+        if len(blocks) == 0:
+            return self.intervals
+        start = time.perf_counter()
+        features = block_features(blocks, self.sample_rate)
+        energy = features['energy_db']
+        spectral_voice = ((features['flatness'] < self.max_flatness) &
+                          (features['speech_band_ratio'] > self.min_band_ratio) &
+                          (energy > self.min_energy_db))
+
+        for i in range(len(energy)):
+            voice = spectral_voice[i] and energy[i] > self.noise_floor_db + self.margin_db
+            if voice:
+                self.stats['voice_blocks'] += 1
+            else:
+                # Drop to quieter rooms immediately, rise slowly so speech can't drag the floor up
+                if energy[i] < self.noise_floor_db:
+                    self.noise_floor_db = energy[i]
+                else:
+                    self.noise_floor_db += self.noise_adapt * (energy[i] - self.noise_floor_db)
+            self.step(voice, timestamps[i])
+
+        self.stats['blocks'] += len(energy)
+        self.stats['process_time'] += time.perf_counter() - start
+        return self.intervals
+
+    def step(self, voice, timestamp):
+        """Advance the silence state machine by one block"""
+        self.last_timestamp = timestamp + self.block_seconds
+        if voice:
+            if self.silent:
+                self.close_interval(timestamp)
+            self.quiet_blocks = 0
+            self.quiet_since = None
+            return
+
+        self.quiet_blocks += 1
+        # Short pauses inside speech (within the hangover) don't start a silence
+        if self.quiet_blocks == self.hangover_blocks:
+            self.quiet_since = timestamp - (self.hangover_blocks - 1) * self.block_seconds
+        if not self.silent and self.quiet_since is not None and \
+                self.last_timestamp - self.quiet_since >= self.min_silence:
+            self.silent = True
+
+    def close_interval(self, end):
+        self.silent = False
+        self.intervals.append((self.quiet_since, end))
+        if len(self.intervals) > self.max_intervals:
+            del self.intervals[0]
+
+    def current_silence(self):
+        """Seconds of the silence in progress (0 when someone is talking)"""
+        if not self.silent:
+            return 0.0
+        return self.last_timestamp - self.quiet_since
+
+    def finish(self):
+        """Close an open silence at the end of a file"""
+        if self.silent:
+            self.close_interval(self.last_timestamp)
+        return self.intervals
+
+    def report_lines(self):
+        """Silence metrics for the session report"""
+        durations = [end - start for start, end in self.intervals]
+        if self.silent:
+            durations.append(self.current_silence())
+        audio_seconds = self.stats['blocks'] * self.block_seconds
+        return [
+            f"• Dead Silences: {len(durations)} ({sum(durations):.1f}s total, "
+            f"longest {max(durations, default=0.0):.1f}s)",
+            f"• Speech Detected: {100 * self.stats['voice_blocks'] / max(1, self.stats['blocks']):.1f}% "
+            f"of {audio_seconds:.1f}s audio"
+        ]
+
+    def performance_lines(self):
+        audio_seconds = max(1e-9, self.stats['blocks'] * self.block_seconds)
+        return [
+            f"• Silence Detector: {1000 * self.stats['process_time'] / audio_seconds:.2f}ms per audio second, "
+            f"{1000 * self.stats['max_delay']:.0f}ms max delay"
+        ]
+
+
+class MicrophoneListener:
+    """Streams microphone blocks into a ring buffer; the video loop polls the detector"""
+
+    def __init__(self, detector=None, device=None, buffer_seconds=2.0):
+        self.detector = detector or SilenceDetector()
+        self.device = device
+        capacity = max(4, int(buffer_seconds / self.detector.block_seconds))
+        self.ring = AudioRingBuffer(capacity, self.detector.block_size)
+        self.stream = None
+
+    def start(self):
+        """Open the input stream (needs the optional sounddevice package)"""
+        try:
+            import sounddevice as sd
+        except (ImportError, OSError):
+            print("🎙️ sounddevice not available - silence detection disabled")
+            return self
+        try:
+            self.stream = sd.InputStream(samplerate=self.detector.sample_rate,
+                                         blocksize=self.detector.block_size, channels=1,
+                                         dtype='float32', device=self.device, callback=self.callback)
+            self.stream.start()
+            print("🎙️ Listening for awkward silences")
+        except Exception as e:
+            self.stream = None
+            print(f"🎙️ Could not open microphone: {e}")
+        return self
+
+    def callback(self, indata, frames, time_info, status):
+        """Audio thread: copy the block into the ring and return"""
+        self.ring.write(indata[:, 0], time.perf_counter() - frames / self.detector.sample_rate)
+
+    def poll(self):
+        """Analyze everything captured since the last poll (cheap; call once per video frame)"""
+        blocks, timestamps = self.ring.read_pending()
+        if len(timestamps):
+            delay = time.perf_counter() - timestamps[0]
+            self.detector.stats['max_delay'] = max(self.detector.stats['max_delay'], delay)
+        self.detector.feed(blocks, timestamps)
+        return self.detector
+
+    @property
+    def active(self):
+        return self.stream is not None
+
+    def stop(self):
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+
+
+def read_wav_blocks(path, block_size=BLOCK_SIZE, chunk_blocks=64):
+    """Yield (sample_rate, blocks) chunks of a 16-bit WAV as mono float32, a fixed amount at a time"""
+    with wave.open(path, 'rb') as wav:
+        rate = wav.getframerate()
+        channels = wav.getnchannels()
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit PCM WAV is supported")
+        while True:
+            raw = wav.readframes(block_size * chunk_blocks)
+            if not raw:
+                break
+            samples = np.frombuffer(raw, dtype='<i2').astype(np.float32) / 32768.0
+            samples = samples.reshape(-1, channels).mean(axis=1)
+            usable = len(samples) // block_size * block_size
+            if usable:
+                yield rate, samples[:usable].reshape(-1, block_size)
+
+
+def analyze_wav(path, block_size=BLOCK_SIZE, chunk_blocks=64, **detector_options):
+    """Run the streaming detector over a WAV file as fast as it will go"""
+    detector = None
+    ring = None
+    start = time.perf_counter()
+    for rate, chunk in read_wav_blocks(path, block_size, chunk_blocks):
+        if detector is None:
+            detector = SilenceDetector(sample_rate=rate, block_size=block_size, **detector_options)
+            ring = AudioRingBuffer(chunk_blocks, block_size)
+        # Same path as live audio: blocks go through the ring, then get analyzed in a batch
+        for block in chunk:
+            ring.write(block, ring.write_count * detector.block_seconds)
+        detector.feed(*ring.read_pending())
+    if detector is None:
+        raise ValueError(f"{path}: no audio")
+    detector.finish()
+    elapsed = time.perf_counter() - start
+    audio_seconds = detector.stats['blocks'] * detector.block_seconds
+    detector.stats['realtime_factor'] = audio_seconds / max(elapsed, 1e-9)
+    return detector
+
+
+def write_conversation_wav(path, segments, sample_rate=SAMPLE_RATE, seed=0):
+    """Synthetic test audio: ('speech', seconds) buzzes like a voice, ('silence', seconds) is room noise"""
+    rng = np.random.default_rng(seed)
+    parts = []
+    for kind, seconds in segments:
+        n = int(seconds * sample_rate)
+        t = np.arange(n) / sample_rate
+        noise = 0.002 * rng.standard_normal(n)
+        if kind == 'speech':
+            # Harmonics of a wobbling pitch with a syllable-rate envelope
+            pitch = 140 + 20 * np.sin(2 * np.pi * 0.7 * t)
+            phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+            voice = sum(np.sin(k * phase) / k for k in range(1, 8))
+            syllables = 0.6 + 0.4 * np.abs(np.sin(2 * np.pi * 2.5 * t))
+            parts.append(0.15 * voice * syllables + noise)
+        else:
+            parts.append(noise)
+    samples = np.concatenate(parts)
+    pcm = (np.clip(samples, -1, 1) * 32767).astype('<i2')
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+    return samples
+
+
+def validate_detector(tolerance=0.5):
+    """Check detected silences against a synthetic conversation with known gaps"""
+    segments = [('speech', 3), ('silence', 4), ('speech', 2), ('silence', 1), ('speech', 2),
+                ('silence', 6), ('speech', 3)]
+    # Closed before writing so the wave module can reopen it on any platform, removed once analyzed
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+        path = f.name
+    try:
+        write_conversation_wav(path, segments)
+        detector = analyze_wav(path)
+    finally:
+        os.remove(path)
+
+    expected = []
+    t = 0.0
+    for kind, seconds in segments:
+        if kind == 'silence' and seconds >= 2.0:
+            expected.append((t, t + seconds))
+        t += seconds
+
+    print(f"📊 Silence Detector Check ({t:.0f}s of audio, "
+          f"{detector.stats['realtime_factor']:.0f}x real-time)")
+    matched = 0
+    for start, end in expected:
+        hits = [i for i in detector.intervals if abs(i[0] - start) <= tolerance and abs(i[1] - end) <= tolerance]
+        matched += bool(hits)
+        found = f"{hits[0][0]:.2f}-{hits[0][1]:.2f}s" if hits else "missed"
+        print(f"   expected {start:.1f}-{end:.1f}s: {found}")
+    extra = len(detector.intervals) - matched
+    passed = matched == len(expected) and extra == 0
+    print(f"{'✅' if passed else '❌'} {matched}/{len(expected)} silences found, {extra} false alarms")
+    return passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find awkward silences in a WAV file or the microphone")
+    parser.add_argument("wav", nargs="?", help="16-bit WAV to analyze (omit to listen to the microphone)")
+    parser.add_argument("--min-silence", type=float, default=2.0, help="Seconds of quiet that count as silence")
+    parser.add_argument("--check", action="store_true", help="Validate on a synthetic conversation")
+    args = parser.parse_args()
+
+    if args.check:
+        validate_detector()
+    elif args.wav:
+        detector = analyze_wav(args.wav, min_silence=args.min_silence)
+        for start, end in detector.intervals:
+            print(f"🤫 {start:7.2f}s - {end:7.2f}s ({end - start:.1f}s)")
+        for line in detector.report_lines() + detector.performance_lines():
+            print(line)
+        print(f"• Offline Speed: {detector.stats['realtime_factor']:.0f}x real-time")
+    else:
+        listener = MicrophoneListener(SilenceDetector(min_silence=args.min_silence)).start()
+        if listener.active:
+            print("Press Ctrl+C to stop")
+            try:
+                was_silent = False
+                while True:
+                    time.sleep(0.1)
+                    detector = listener.poll()
+                    if detector.silent != was_silent:
+                        print("🤫 Dead silence..." if detector.silent else "🗣️ Someone's talking")
+                        was_silent = detector.silent
+            except KeyboardInterrupt:
+                pass
+            listener.stop()
+            for line in listener.detector.report_lines():
+                print(line)
@@ -0,0 +1,88 @@
+# save as: startup_report.py
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+ENTRY_MODULES = [
+    "final_awkwardness_detector",
+    "awkwardness_detector",
+    "audio_alerts",
+    "visual_alerts",
+    "comedy_features",
+    "face_detector",
+    "hand_tracker",
+    "testing_scenarios"
+]
+
+
+def measure_cold_import(module_name):
+    """Import a module in a fresh interpreter and return the seconds it took"""
+    code = ("import time; start = time.perf_counter(); "
+            f"import {module_name}; print(time.perf_counter() - start)")
+    # Run beside this file so the repo modules import from any working directory
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def measure_startup(profile, source_spec=None):
+    """Time each stage from a cold start to the first annotated frame"""
+    timings = {}
+    total_start = time.perf_counter()
+
+    start = time.perf_counter()
+    import cv2
+    import numpy as np
+    timings['cv2_numpy_import'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    from final_awkwardness_detector import UltimateAwkwardnessDetector
+    from frame_sources import open_source
+    timings['detector_module_import'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    detector = UltimateAwkwardnessDetector(enable_memes=True, enable_audio=False, profile=profile)
+    timings['detector_construction'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    source = open_source(source_spec, prefetch=False)
+    ret, frame = source.read()
+    source.release()
+    timings['source_first_read'] = time.perf_counter() - start
+    if not ret:
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+    detector.process_frame(frame)
+    timings.update(detector.startup_timings)
+    timings['cold_start_to_first_frame'] = time.perf_counter() - total_start
+    return timings
+
+
+def print_startup_report(profile="balanced", source_spec=None):
+    """Print import, graph construction and first-frame latency"""
+    print("🚀 STARTUP TIME REPORT")
+    print("=" * 50)
+    print("📦 Cold import per entry module (no camera should open):")
+    for module_name in ENTRY_MODULES:
+        seconds = measure_cold_import(module_name)
+        shown = "failed" if seconds is None else f"{seconds * 1000:.0f}ms"
+        print(f"• {module_name}: {shown}")
+
+    timings = measure_startup(profile, source_spec)
+    print("\n⏱️ Cold start breakdown:")
+    for name, seconds in timings.items():
+        print(f"• {name.replace('_', ' ')}: {seconds * 1000:.0f}ms")
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Break down startup latency of the detector")
+    parser.add_argument("--profile", default="balanced", help="Model profile to construct")
+    parser.add_argument("--source", default=None, help="Frame source for the first frame (default: webcam)")
+    args = parser.parse_args()
+
+    print_startup_report(args.profile, args.source)
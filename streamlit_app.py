@@ -2,9 +2,12 @@
 import streamlit as st
 import cv2
 import numpy as np
+import pandas as pd
 import time
 from datetime import datetime
 from final_awkwardness_detector import UltimateAwkwardnessDetector
+from model_profiles import PROFILES, DEFAULT_PROFILE
+from score_history import ScoreHistory
 from streamlit_webrtc import webrtc_streamer, VideoProcessorBase, RTCConfiguration
 import av
 
@@ -14,16 +17,12 @@ st.set_page_config(page_title="Ultimate Dating Awkwardness Detector", page_icon=
 # Initialize session state variables if they don't exist
 if 'detector' not in st.session_state:
     st.session_state.detector = None
-if 'awkwardness_history' not in st.session_state:
-    st.session_state.awkwardness_history = []
 if 'start_time' not in st.session_state:
     st.session_state.start_time = None
 if 'processing_active' not in st.session_state:
     st.session_state.processing_active = False
 if 'report_generated' not in st.session_state:
     st.session_state.report_generated = False
-if 'last_frame_time' not in st.session_state:
-    st.session_state.last_frame_time = time.time()
 if 'current_score' not in st.session_state:
     st.session_state.current_score = 0
 if 'current_frame' not in st.session_state:
@@ -38,19 +37,25 @@ st.sidebar.header("Settings")
 enable_memes = st.sidebar.checkbox("Enable Meme Mode", value=True)
 enable_audio = st.sidebar.checkbox("Enable Audio Alerts", value=False)
 sensitivity = st.sidebar.slider("Awkwardness Sensitivity", 0.5, 2.0, 1.0)
+profile = st.sidebar.selectbox("Model Profile", list(PROFILES), index=list(PROFILES).index(DEFAULT_PROFILE),
+                               help="lite runs fastest on weak machines, accurate catches the most")
+st.sidebar.caption(PROFILES[profile]['description'])
 
 # Create two columns for the main interface
 col1, col2 = st.columns([3, 2])
 
 # Video processor class for real-time processing
 class AwkwardnessVideoProcessor(VideoProcessorBase):
-    def __init__(self, enable_memes, enable_audio, sensitivity):
-        self.detector = UltimateAwkwardnessDetector(enable_memes=enable_memes, enable_audio=enable_audio)
+    def __init__(self, enable_memes, enable_audio, sensitivity, profile):
+        self.detector = UltimateAwkwardnessDetector(enable_memes=enable_memes, enable_audio=enable_audio,
+                                                    profile=profile)
         self.sensitivity = sensitivity
         st.session_state.detector = self.detector
         st.session_state.start_time = time.time()
         st.session_state.processing_active = True
-        st.session_state.awkwardness_history = []
+        # Whole session at several resolutions; the chart shows a bounded number of buckets
+        self.history = ScoreHistory()
+        self.start_time = time.time()
         
     def recv(self, frame):
         img = frame.to_ndarray(format="bgr24")
@@ -66,17 +71,15 @@ class AwkwardnessVideoProcessor(VideoProcessorBase):
         st.session_state.current_frame = result_frame
         
         # Store history for graph
-        current_time = time.time()
-        if current_time - st.session_state.last_frame_time > 0.5:  # Limit data points
-            st.session_state.awkwardness_history.append(self.detector.awkwardness_score)
-            st.session_state.last_frame_time = current_time
-            
-            # Keep only the last 50 points
-            if len(st.session_state.awkwardness_history) > 50:
-                st.session_state.awkwardness_history = st.session_state.awkwardness_history[-50:]
+        self.history.add(time.time() - self.start_time, self.detector.awkwardness_score)
         
         return av.VideoFrame.from_ndarray(result_frame, format="bgr24")
 
+def history_frame(rows):
+    """Chart rows (lowest and highest score per bucket) indexed by session minutes"""
+    return pd.DataFrame({'low': rows['low'], 'high': rows['high']},
+                        index=pd.Index(np.array(rows['seconds']) / 60, name='minutes'))
+
 # RTC Configuration (use Google's STUN servers)
 rtc_config = RTCConfiguration(
     {"iceServers": [{"urls": ["stun:stun.l.google.com:19302"]}]}
@@ -90,7 +93,8 @@ with col1:
         video_processor_factory=lambda: AwkwardnessVideoProcessor(
             enable_memes=enable_memes,
             enable_audio=enable_audio,
-            sensitivity=sensitivity
+            sensitivity=sensitivity,
+            profile=profile
         ),
         rtc_configuration=rtc_config,
         media_stream_constraints={"video": True, "audio": False},
@@ -142,10 +146,9 @@ with col2:
             session_duration = time.time() - st.session_state.start_time
             st.write(f"Session Duration: {session_duration/60:.1f} minutes")
         
-        # Show awkwardness history chart
-        if len(st.session_state.awkwardness_history) > 1:
-            st.subheader("Awkwardness Over Time")
-            st.line_chart(st.session_state.awkwardness_history)
+        # Awkwardness history chart, filled in by the loop at the bottom while the camera runs
+        st.subheader("Awkwardness Over Time")
+        chart_slot = st.empty()
         
         # Show some stats from the detector
         if hasattr(st.session_state.detector, 'stats'):
@@ -161,4 +164,21 @@ with col2:
         for line in st.session_state.report:
             st.write(line)
 
+# Keep the chart live while the camera runs: only newly closed buckets are appended,
+# and it's redrawn only when the session outgrows the current resolution
+if ctx.state.playing and ctx.video_processor is not None and st.session_state.processing_active:
+    history = ctx.video_processor.history
+    history.reset_chart()
+    chart = None
+    while ctx.state.playing:
+        redraw, rows = history.chart_update()
+        if redraw or chart is None:
+            if len(rows['seconds']) > 1:
+                chart = chart_slot.line_chart(history_frame(rows))
+            else:
+                history.reset_chart()
+        elif rows['seconds']:
+            chart.add_rows(history_frame(rows))
+        time.sleep(0.5)
+
 # Run with: streamlit run streamlit_app.py
\ No newline at end of file
@@ -1,53 +1,80 @@
 # save as: testing_scenarios.py
 import cv2
+import os
+import io
+import sys
+import glob
+import json
 import time
+import argparse
+import operator
+import contextlib
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from frame_sources import open_source, add_source_arguments, open_source_from_args
+
+# How a check compares the measured value with the expected one
+CHECK_OPERATORS = {'>=': operator.ge, '<=': operator.le, '>': operator.gt, '<': operator.lt, '==': operator.eq}
+CLIP_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv')
 
 class AwkwardnessTrainingAcademy:
-    def __init__(self):
+    # Training scenarios
+    SCENARIOS = [
+        {
+            'name': "The Forced Smile Test",
+            'instructions': "Smile awkwardly for 10 seconds. Make it look forced!",
+            'duration': 10,
+            'expected_behavior': "Should detect fake facial expressions",
+            # No expression model yet - at least the face has to be found to judge it
+            'checks': [('face_visible_ratio', '>=', 0.8)]
+        },
+        {
+            'name': "The Face Touch Challenge",
+            'instructions': "Touch your face nervously 5 times in 15 seconds",
+            'duration': 15,
+            'expected_behavior': "Should trigger fidget detection",
+            'checks': [('face_touch_events', '>=', 3)]
+        },
+        {
+            'name': "The Eye Contact Avoidance",
+            'instructions': "Look away from the camera for 5 seconds, then back",
+            'duration': 10,
+            'expected_behavior': "Should detect loss of eye contact",
+            'checks': [('eye_contact_break_events', '>=', 1), ('longest_eye_contact_break', '>=', 3.0)]
+        },
+        {
+            'name': "The Nervous Fidget",
+            'instructions': "Play with your hair and touch your neck repeatedly",
+            'duration': 12,
+            'expected_behavior': "Should increase awkwardness score rapidly",
+            'checks': [('peak_score', '>=', 15), ('face_touch_events', '>=', 1)]
+        },
+        {
+            'name': "The Silent Treatment",
+            'instructions': "Just sit still and stare blankly at the camera",
+            'duration': 8,
+            'expected_behavior': "Should detect uncomfortable silence",
+            # Clips carry no audio, so check the stillness: no hands, no touches, no alarm
+            'checks': [('hands_visible_ratio', '<=', 0.1), ('face_touch_events', '==', 0), ('peak_score', '<', 15)]
+        },
+        {
+            'name': "The Overcompensation",
+            'instructions': "Nod enthusiastically and gesture wildly with your hands",
+            'duration': 10,
+            'expected_behavior': "Should detect excessive hand movement",
+            'checks': [('hands_visible_ratio', '>=', 0.5)]
+        }
+    ]
+    
+    def __init__(self, detector=None):
         # Use your completed detection system from previous parts
-        from comedy_features import ComedyFeaturesSystem
-        self.detector = ComedyFeaturesSystem()
-        
-        # Training scenarios
-        self.scenarios = [
-            {
-                'name': "The Forced Smile Test",
-                'instructions': "Smile awkwardly for 10 seconds. Make it look forced!",
-                'duration': 10,
-                'expected_behavior': "Should detect fake facial expressions"
-            },
-            {
-                'name': "The Face Touch Challenge",
-                'instructions': "Touch your face nervously 5 times in 15 seconds",
-                'duration': 15,
-                'expected_behavior': "Should trigger fidget detection"
-            },
-            {
-                'name': "The Eye Contact Avoidance",
-                'instructions': "Look away from the camera for 5 seconds, then back",
-                'duration': 10,
-                'expected_behavior': "Should detect loss of eye contact"
-            },
-            {
-                'name': "The Nervous Fidget",
-                'instructions': "Play with your hair and touch your neck repeatedly",
-                'duration': 12,
-                'expected_behavior': "Should increase awkwardness score rapidly"
-            },
-            {
-                'name': "The Silent Treatment",
-                'instructions': "Just sit still and stare blankly at the camera",
-                'duration': 8,
-                'expected_behavior': "Should detect uncomfortable silence"
-            },
-            {
-                'name': "The Overcompensation",
-                'instructions': "Nod enthusiastically and gesture wildly with your hands",
-                'duration': 10,
-                'expected_behavior': "Should detect excessive hand movement"
-            }
-        ]
+        if detector is None:
+            from comedy_features import ComedyFeaturesSystem
+            detector = ComedyFeaturesSystem()
+        self.detector = detector
         
+        self.scenarios = self.SCENARIOS
         self.current_scenario = 0
         self.scenario_active = False
         self.scenario_start_time = 0
@@ -93,9 +120,9 @@ class AwkwardnessTrainingAcademy:
         
         return frame
     
-    def run_training_session(self):
-        """Run the complete training session"""
-        camera = cv2.VideoCapture(0)
+    def run_training_session(self, source=None):
+        """Run the complete training session (webcam unless a FrameSource is given)"""
+        camera = source if source is not None else open_source()
         
         print("🎓 WELCOME TO THE AWKWARDNESS TRAINING ACADEMY! 🎓")
         print("We'll help you practice being awkward so you can recognize it!")
@@ -144,36 +171,71 @@ class AwkwardnessTrainingAcademy:
         self.detector.save_session_report()
 
 # Additional testing utilities
-def create_test_videos():
-    """Record test videos for different scenarios"""
+def scenario_slug(scenario):
+    """File-friendly name for a scenario"""
+    return scenario['name'].lower().replace("the ", "").replace(" ", "_")
+
+
+def create_test_videos(output_dir="test_videos", source=None, scenarios=None):
+    """Record one clip per scenario from a frame source (webcam by default)"""
     print("📹 Test Video Creator")
-    print("This would help you create videos to test your detector")
-    print("Ideas for test videos:")
-    print("- Record yourself doing awkward things")
-    print("- Find awkward interview clips on YouTube")
-    print("- Stage fake awkward conversations with friends")
-    print("- Test with different lighting conditions")
-
-def benchmark_performance():
+    print("Act out each scenario - every clip runs for the scenario's duration")
+    
+    if scenarios is None:
+        scenarios = AwkwardnessTrainingAcademy.SCENARIOS
+    os.makedirs(output_dir, exist_ok=True)
+    camera = source if source is not None else open_source()
+    fps = camera.fps or 30.0
+    paths = []
+    
+    for scenario in scenarios:
+        path = os.path.join(output_dir, f"{scenario_slug(scenario)}.mp4")
+        print(f"\n🎬 {scenario['name']}: {scenario['instructions']}")
+        writer = None
+        for _ in range(int(scenario['duration'] * fps)):
+            ret, frame = camera.read()
+            if not ret:
+                break
+            if writer is None:
+                h, w = frame.shape[:2]
+                writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, (w, h))
+            writer.write(frame)
+        if writer is None:
+            print("❌ Source ran out of frames")
+            break
+        writer.release()
+        paths.append(path)
+        print(f"💾 Saved {path}")
+    
+    camera.release()
+    return paths
+
+def benchmark_performance(source=None, num_frames=100):
     """Test detection accuracy and performance"""
     print("⚡ Performance Benchmarking")
     print("Testing detection speed and accuracy...")
     
+    from comedy_features import ComedyFeaturesSystem
+    detector = ComedyFeaturesSystem()
+    
     # Simple performance test
-    import time
+    camera = source if source is not None else open_source()
     start_time = time.time()
     frame_count = 0
     
-    camera = cv2.VideoCapture(0)
-    
-    while frame_count < 100:  # Test 100 frames
+    while frame_count < num_frames:
         ret, frame = camera.read()
-        if ret:
-            frame_count += 1
+        if not ret:
+            break
+        detector.process_frame_with_comedy(frame)
+        frame_count += 1
     
     camera.release()
     
     elapsed = time.time() - start_time
+    if frame_count == 0:
+        print("❌ No frames to benchmark")
+        return
     fps = frame_count / elapsed
     
     print(f"📊 Performance Results:")
@@ -181,6 +243,169 @@ def benchmark_performance():
     print(f"Average FPS: {fps:.1f}")
     print(f"Frame processing time: {1000/fps:.1f}ms per frame")
 
+def find_reference_clips(clips_dir, scenarios=None):
+    """Clips for each scenario: <slug>.mp4 plus any <slug>_*.mp4 takes (any common video extension)"""
+    if scenarios is None:
+        scenarios = AwkwardnessTrainingAcademy.SCENARIOS
+    jobs = []
+    for index, scenario in enumerate(scenarios):
+        slug = scenario_slug(scenario)
+        for path in sorted(glob.glob(os.path.join(clips_dir, f"{slug}*"))):
+            name, extension = os.path.splitext(os.path.basename(path))
+            if extension.lower() in CLIP_EXTENSIONS and (name == slug or name.startswith(slug + "_")):
+                jobs.append((index, path))
+    return jobs
+
+
+def analyze_clip(path, profile=None):
+    """Run the full detector headlessly over a clip on the clip's own clock; returns the measured metrics"""
+    from final_awkwardness_detector import UltimateAwkwardnessDetector
+    from model_profiles import DEFAULT_PROFILE
+
+    # Motion gate off so every frame is inferred and runs are repeatable
+    with contextlib.redirect_stdout(io.StringIO()):
+        detector = UltimateAwkwardnessDetector(enable_memes=False, enable_audio=False, enable_motion_gate=False,
+                                               profile=profile or DEFAULT_PROFILE)
+    source = open_source(path, prefetch=False)
+    latencies, faces, hands = [], 0, 0
+    for frame in source:
+        start = time.perf_counter()
+        detector.process_frame(frame, source.timestamp)
+        latencies.append(time.perf_counter() - start)
+        faces += detector.last_results.face_count > 0
+        hands += detector.last_results.hand_count > 0
+    duration = source.timestamp
+    source.release()
+    detector.events.finish()
+
+    count = len(latencies)
+    frames = max(1, count)
+    breaks = detector.events.segmenters['eye_contact_break'].intervals()
+    latencies = np.array(latencies or [0.0]) * 1000
+    return {
+        'frames': count,
+        'duration': round(duration, 2),
+        'face_visible_ratio': round(faces / frames, 3),
+        'hands_visible_ratio': round(hands / frames, 3),
+        'face_touch_events': detector.events.count('face_touch'),
+        'eye_contact_break_events': detector.events.count('eye_contact_break'),
+        'longest_eye_contact_break': round(max([e['end'] - e['start'] for e in breaks] or [0.0]), 2),
+        'peak_score': round(detector.stats['peak_awkwardness'], 2),
+        'final_score': round(detector.awkwardness_score, 2),
+        'mean_ms': round(float(latencies.mean()), 2),
+        'p95_ms': round(float(np.percentile(latencies, 95)), 2)
+    }
+
+
+def run_checks(checks, metrics):
+    """Evaluate (metric, operator, expected) checks against measured metrics"""
+    results = []
+    for metric, op, expected in checks:
+        actual = metrics.get(metric)
+        passed = actual is not None and CHECK_OPERATORS[op](actual, expected)
+        results.append({'metric': metric, 'op': op, 'expected': expected, 'actual': actual, 'passed': passed})
+    return results
+
+
+def run_scenario_clip(job):
+    """One clip of one scenario (runs in a worker process)"""
+    index, path, profile, latency_budget = job
+    scenario = AwkwardnessTrainingAcademy.SCENARIOS[index]
+    start = time.perf_counter()
+    result = {'scenario': scenario['name'], 'slug': scenario_slug(scenario), 'clip': path}
+    try:
+        metrics = analyze_clip(path, profile)
+        checks = list(scenario.get('checks', []))
+        if latency_budget is not None:
+            checks.append(('p95_ms', '<=', latency_budget))
+        result.update(metrics=metrics, checks=run_checks(checks, metrics), error=None)
+    except Exception as error:  # A broken clip fails its own case, not the whole suite
+        result.update(metrics={}, checks=[], error=f"{type(error).__name__}: {error}")
+    result['passed'] = result['error'] is None and all(c['passed'] for c in result['checks'])
+    result['time'] = round(time.perf_counter() - start, 2)
+    return result
+
+
+def run_regression_suite(clips_dir="test_videos", workers=None, profile=None, latency_budget=None):
+    """Every reference clip through the detector, clips in parallel; returns one result per clip"""
+    jobs = [(index, path, profile, latency_budget) for index, path in find_reference_clips(clips_dir)]
+    if not jobs:
+        print(f"❌ No reference clips in {clips_dir} (record some with: python testing_scenarios.py record)")
+        return []
+    workers = workers or os.cpu_count() or 1
+    print(f"🧪 Academy regression suite: {len(jobs)} clips, {min(workers, len(jobs))} workers")
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(min(workers, len(jobs))) as pool:
+            results = list(pool.map(run_scenario_clip, jobs))
+    else:
+        results = [run_scenario_clip(job) for job in jobs]
+
+    for result in results:
+        print(f"{'✅' if result['passed'] else '❌'} {result['scenario']} ({os.path.basename(result['clip'])}, "
+              f"{result['metrics'].get('p95_ms', 0):.1f}ms p95)")
+        if result['error']:
+            print(f"   💥 {result['error']}")
+        for check in result['checks']:
+            if not check['passed']:
+                print(f"   • {check['metric']} = {check['actual']}, expected {check['op']} {check['expected']}")
+    failed = sum(not r['passed'] for r in results)
+    print(f"📊 {len(results) - failed}/{len(results)} clips passed")
+    return results
+
+
+def write_junit_report(results, path):
+    """JUnit XML: a test case per clip, a failure per broken check"""
+    suite = ET.Element('testsuite', name="awkwardness_academy", tests=str(len(results)),
+                       failures=str(sum(not r['passed'] and r['error'] is None for r in results)),
+                       errors=str(sum(r['error'] is not None for r in results)),
+                       time=str(round(sum(r['time'] for r in results), 2)))
+    for result in results:
+        case = ET.SubElement(suite, 'testcase', classname=f"academy.{result['slug']}",
+                             name=os.path.basename(result['clip']), time=str(result['time']))
+        if result['error'] is not None:
+            ET.SubElement(case, 'error', message=result['error'])
+        failures = [c for c in result['checks'] if not c['passed']]
+        if failures:
+            failure = ET.SubElement(case, 'failure', message=f"{len(failures)} checks failed")
+            failure.text = "\n".join(f"{c['metric']} = {c['actual']}, expected {c['op']} {c['expected']}"
+                                     for c in failures)
+        properties = ET.SubElement(case, 'properties')
+        for name, value in result['metrics'].items():
+            ET.SubElement(properties, 'property', name=name, value=str(value))
+    ET.ElementTree(suite).write(path, encoding='utf-8', xml_declaration=True)
+
+
+def write_json_report(results, path):
+    with open(path, 'w') as f:
+        json.dump({'passed': all(r['passed'] for r in results), 'results': results}, f, indent=2)
+
+
 if __name__ == "__main__":
-    academy = AwkwardnessTrainingAcademy()
-    academy.run_training_session()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Awkwardness Training Academy")
+    parser.add_argument("mode", nargs="?", default="train", choices=["train", "record", "benchmark", "regress"],
+                        help="Run the academy, record scenario clips, benchmark the detector, "
+                             "or check the detector against recorded clips")
+    parser.add_argument("--clips", default="test_videos", help="Reference clips for regress (and record)")
+    parser.add_argument("--workers", type=int, default=None, help="Clips analyzed in parallel (default: CPUs)")
+    parser.add_argument("--profile", default=None, help="Model profile for regress")
+    parser.add_argument("--latency-budget", type=float, default=None, metavar="MS",
+                        help="Also fail clips whose p95 frame time exceeds this")
+    parser.add_argument("--junit", default=None, help="Write a JUnit XML report here")
+    parser.add_argument("--json", default=None, help="Write a JSON report here")
+    add_source_arguments(parser)
+    args = parser.parse_args()
+    
+    if args.mode == "regress":
+        results = run_regression_suite(args.clips, args.workers, args.profile, args.latency_budget)
+        if args.junit:
+            write_junit_report(results, args.junit)
+        if args.json:
+            write_json_report(results, args.json)
+        sys.exit(0 if results and all(r['passed'] for r in results) else 1)
+    elif args.mode == "record":
+        create_test_videos(args.clips, source=open_source_from_args(args))
+    elif args.mode == "benchmark":
+        benchmark_performance(source=open_source_from_args(args))
+    else:
+        academy = AwkwardnessTrainingAcademy()
+        academy.run_training_session(open_source_from_args(args))
\ No newline at end of file
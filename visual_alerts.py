@@ -1,12 +1,16 @@
 # save as: visual_alerts.py
 import cv2
-import mediapipe as mp
+import argparse
 import time
 import random
 import numpy as np
+from frame_sources import add_source_arguments, open_source_from_args
+from scoring_strategies import FrameFeatures, VisualStrategy
 
 class VisualAlertSystem:
     def __init__(self):
+        import mediapipe as mp
+        
         # Previous detector code here (face + hand detection)
         self.mp_face = mp.solutions.face_detection
         self.mp_hands = mp.solutions.hands
@@ -16,6 +20,7 @@ class VisualAlertSystem:
         self.hands = self.mp_hands.Hands(min_detection_confidence=0.7, min_tracking_confidence=0.5)
         
         self.awkwardness_score = 0
+        self.scoring = VisualStrategy()
         self.alert_active = False
         self.alert_start_time = 0
         
@@ -117,24 +122,20 @@ class VisualAlertSystem:
         face_results = self.face_detector.process(rgb_frame)
         hand_results = self.hands.process(rgb_frame)
         
-        frame_awkwardness = 0
-        
-        # Face detection and awkwardness calculation
+        # Face detection
         if face_results.detections:
             for detection in face_results.detections:
                 self.mp_draw.draw_detection(frame, detection)
-        else:
-            frame_awkwardness += 2  # No face = awkward
         
         # Hand detection
         if hand_results.multi_hand_landmarks:
             for hand_landmarks in hand_results.multi_hand_landmarks:
                 self.mp_draw.draw_landmarks(frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
-                frame_awkwardness += 1  # Hands visible = fidgeting
         
-        # Update awkwardness score
-        self.awkwardness_score += frame_awkwardness * 0.5
-        self.awkwardness_score = max(0, self.awkwardness_score - 0.2)  # Slow decay
+        # Update awkwardness score (no face +2, each hand +1, slow decay)
+        features = FrameFeatures.from_results(face_results, hand_results, time.time())
+        frame_awkwardness = self.scoring.frame_points(features)
+        self.awkwardness_score = self.scoring.next_score(self.awkwardness_score, frame_awkwardness)
         
         # Trigger visual alerts
         if self.awkwardness_score > 30 and not self.alert_active:
@@ -178,24 +179,34 @@ class VisualAlertSystem:
         else:
             return "🚨 SOCIAL CATASTROPHE!"
 
-# Main execution
-alert_system = VisualAlertSystem()
-camera = cv2.VideoCapture(0)
 
-print("🎨 Visual Alert System Online!")
-print("Prepare for emoji explosions and flashing lights!")
+def main():
+    """Run the visual alert system on the webcam (or any --source)"""
+    parser = argparse.ArgumentParser(description="Visual Alert System")
+    add_source_arguments(parser)
+    args = parser.parse_args()
+    
+    alert_system = VisualAlertSystem()
+    camera = open_source_from_args(args)
 
-while True:
-    ret, frame = camera.read()
-    if not ret:
-        break
+    print("🎨 Visual Alert System Online!")
+    print("Prepare for emoji explosions and flashing lights!")
+
+    while True:
+        ret, frame = camera.read()
+        if not ret:
+            break
     
-    # Process frame with all visual effects
-    frame = alert_system.process_frame(frame)
+        # Process frame with all visual effects
+        frame = alert_system.process_frame(frame)
     
-    cv2.imshow("Awkwardness Alert System", frame)
-    if cv2.waitKey(1) & 0xFF == ord('q'):
-        break
+        cv2.imshow("Awkwardness Alert System", frame)
+        if cv2.waitKey(1) & 0xFF == ord('q'):
+            break
+
+    camera.release()
+    cv2.destroyAllWindows()
+
 
-camera.release()
-cv2.destroyAllWindows()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# save as: voice_cache.py
+import os
+import json
+import time
+import queue
+import hashlib
+import argparse
+import threading
+from audio_engine import SOUND_PRIORITIES
+
+DEFAULT_CACHE_DIR = os.path.join(".awkward_cache", "voice")
+DEFAULT_VOICE_SETTINGS = {'rate': 175, 'volume': 1.0, 'voice': None}
+
+
+class VoiceLineCache:
+    """Voice lines rendered to audio files once, then played as cached clips through the AudioEngine"""
+
+    def __init__(self, audio_engine, cache_dir=DEFAULT_CACHE_DIR, voice_settings=None):
+        self.audio_engine = audio_engine
+        self.cache_dir = cache_dir
+        self.voice_settings = dict(DEFAULT_VOICE_SETTINGS, **(voice_settings or {}))
+        self.ready_lines = set()
+        self.queued_lines = set()  # Waiting for or being rendered, so repeat requests don't queue them again
+        self.lock = threading.Lock()
+        self.render_queue = queue.Queue()
+        self.render_thread = None
+        self.tts_engine = None
+        self.synthesis_available = None  # Unknown until the render thread tries pyttsx3
+
+        self.stats = {
+            'requests': 0,
+            'hits': 0,
+            'misses': 0,
+            'fallbacks': 0,
+            'rendered': 0,
+            'render_time': 0.0,
+            'latency_total': 0.0,
+            'latency_max': 0.0,
+            'latency_count': 0
+        }
+        audio_engine.add_play_listener(self.on_played)
+
+    def key(self, text):
+        """Cache key covering the text and every voice setting"""
+        payload = json.dumps({'text': text, 'settings': self.voice_settings}, sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+    def path(self, text):
+        return os.path.join(self.cache_dir, f"{self.key(text)}.wav")
+
+    def sound_name(self, text):
+        return f"voice:{self.key(text)}"
+
+    def prerender(self, lines):
+        """Register cached lines and render missing ones on a background thread"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for text in lines:
+            with self.lock:
+                if text in self.ready_lines or text in self.queued_lines:
+                    continue
+                self.queued_lines.add(text)
+            self.render_queue.put(text)
+        if self.render_thread is None:
+            self.render_thread = threading.Thread(target=self.render_loop, name="voice-render", daemon=True)
+            self.render_thread.start()
+        return self
+
+    def render_loop(self):
+        """Background thread: load existing clips, synthesize the rest with pyttsx3"""
+        while True:
+            text = self.render_queue.get()
+            if text is None:
+                break
+            ready = self.render_line(text)
+            with self.lock:
+                self.queued_lines.discard(text)
+                if ready:
+                    self.ready_lines.add(text)
+
+    def render_line(self, text):
+        """Load or synthesize one line and register it with the audio engine; True once it's playable"""
+        path = self.path(text)
+        if not os.path.exists(path):
+            if self.synthesis_available is False:
+                return False
+            if self.tts_engine is None:
+                self.tts_engine = self.create_tts_engine()
+                if self.tts_engine is None:
+                    return False
+            start = time.perf_counter()
+            self.tts_engine.save_to_file(text, path)
+            # runAndWait blocks for the whole line - fine here, never on the video thread
+            self.tts_engine.runAndWait()
+            self.stats['render_time'] += time.perf_counter() - start
+            self.stats['rendered'] += 1
+            if not os.path.exists(path):
+                return False
+        return self.audio_engine.register_sound(self.sound_name(text), path)
+
+    def create_tts_engine(self):
+        """Start pyttsx3 with the configured voice, or note that synthesis isn't available"""
+        try:
+            import pyttsx3
+            engine = pyttsx3.init()
+        except Exception:
+            self.synthesis_available = False
+            print("🔇 pyttsx3 not available - voice lines will use a fallback tone")
+            return None
+        engine.setProperty('rate', self.voice_settings['rate'])
+        engine.setProperty('volume', self.voice_settings['volume'])
+        if self.voice_settings['voice']:
+            engine.setProperty('voice', self.voice_settings['voice'])
+        self.synthesis_available = True
+        return engine
+
+    def speak(self, text):
+        """Play a line from the cache without blocking; falls back to a tone when it isn't ready"""
+        self.stats['requests'] += 1
+        with self.lock:
+            cached = text in self.ready_lines
+        if cached:
+            self.stats['hits'] += 1
+            name = self.sound_name(text)
+            self.audio_engine.play(name, priority=SOUND_PRIORITIES['voice'])
+            return True
+
+        self.stats['misses'] += 1
+        self.stats['fallbacks'] += 1
+        self.audio_engine.play('tone')
+        if self.synthesis_available is not False:
+            self.prerender([text])
+        return False
+
+    def on_played(self, name, latency):
+        """Audio-thread callback: record trigger-to-playback time for voice clips"""
+        if not name.startswith("voice:"):
+            return
+        self.stats['latency_count'] += 1
+        self.stats['latency_total'] += latency
+        self.stats['latency_max'] = max(self.stats['latency_max'], latency)
+
+    def stop(self):
+        if self.render_thread is not None:
+            self.render_queue.put(None)
+
+    def report_lines(self):
+        """Cache hit rate and trigger-to-playback latency"""
+        requests = max(1, self.stats['requests'])
+        played = max(1, self.stats['latency_count'])
+        return [
+            f"• Voice Cache Hit Rate: {100 * self.stats['hits'] / requests:.1f}% "
+            f"({self.stats['hits']}/{self.stats['requests']}, {self.stats['fallbacks']} fallback tones)",
+            f"• Voice Trigger-to-Playback: {1000 * self.stats['latency_total'] / played:.1f}ms avg, "
+            f"{1000 * self.stats['latency_max']:.1f}ms max",
+            f"• Voice Lines Rendered: {self.stats['rendered']} in {self.stats['render_time']:.1f}s"
+        ]
+
+
+def prerender_offline(lines, cache_dir=DEFAULT_CACHE_DIR):
+    """Render every line to the cache ahead of time (blocking - run before a session)"""
+    from audio_engine import AudioEngine
+
+    audio = AudioEngine(headless=True).start()
+    cache = VoiceLineCache(audio, cache_dir=cache_dir).prerender(lines)
+    cache.stop()
+    cache.render_thread.join()
+    audio.stop()
+    print(f"🗣️ {len(cache.ready_lines)}/{len(lines)} voice lines cached in {cache_dir}")
+    return cache
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-render the voice alert lines to the on-disk cache")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args()
+
+    from audio_alerts import AudioAlertSystem
+    prerender_offline(AudioAlertSystem.VOICE_LINES, args.cache_dir)